@@ -3,6 +3,8 @@ import dataclasses
 import os
 import sys
 import asyncio
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import List
 
@@ -11,6 +13,15 @@ decky_user_home = os.environ["DECKY_USER_HOME"]
 data_dir = os.environ["DECKY_PLUGIN_RUNTIME_DIR"]
 plugin_dir = Path(os.environ["DECKY_PLUGIN_DIR"])
 
+# How often buffered playtime is checked for being due to be written
+WRITE_BEHIND_CHECK_SECONDS = 5
+# Scheduled snapshots of the current user's database
+SNAPSHOT_INTERVAL_SECONDS = 24 * 60 * 60
+SNAPSHOT_CHECK_SECONDS = 60 * 60
+SNAPSHOTS_TO_KEEP = 5
+# Wait after a user switch or added time before warming the result cache
+PREWARM_DELAY_SECONDS = 2
+
 
 def add_plugin_to_path():
     directories = [["./"], ["py_modules"]]
@@ -23,12 +34,21 @@ add_plugin_to_path()
 
 # pylint: disable=wrong-import-order, wrong-import-position
 # ruff: noqa: E402
+from py_modules.change_events import ChangeNotifier
+from py_modules.data_export import DataExport
+from py_modules.data_import import DataImport
 from py_modules.db.dao import Dao
+from py_modules.db.maintenance import DbMaintenance
 from py_modules.db.migration import DbMigration
 from py_modules.db.sqlite_db import SqlLiteDb
 from py_modules.files import Files
 from py_modules.games import Games
 from py_modules.helpers import parse_date
+from py_modules.response_stream import ResponseStream
+from py_modules.result_cache import ResultCache
+from py_modules.session_journal import SessionJournal
+from py_modules.single_flight import SingleFlight
+from py_modules.snapshot_manager import SnapshotManager
 from py_modules.statistics import Statistics
 from py_modules.time_tracking import TimeTracking
 from py_modules.schemas.request import (
@@ -41,12 +61,16 @@ from py_modules.schemas.request import (
     HasDataBeforeDict,
     RemoveAllGameChecksumsDTO,
     RemoveGameChecksumDTO,
+    SessionHeartbeatDict,
+    StatisticsForPeriodDict,
 )
 from py_modules.dto.save_game_checksum import AddGameChecksumDTO
 from py_modules.dto.statistics.daily_statistics_for_period import (
     DailyStatisticsForPeriodDTO,
 )
+from py_modules.dto.statistics.statistics_for_period import StatisticsForPeriodDTO
 from py_modules.dto.time.add_time import AddTimeDTO
+from py_modules.dto.time.session_heartbeat import SessionHeartbeatDTO
 from py_modules.utils.camel_case import convert_keys_to_camel_case
 from py_modules.dto.time.apply_manual_time_correction import (
     ApplyManualTimeCorrectionDTO,
@@ -68,16 +92,50 @@ class Plugin:
     user_manager: UserManager
     tracking_manager: TrackingManager
     association_manager: AssociationManager
+    db_maintenance: DbMaintenance | None = None
+    session_journal: SessionJournal
+    write_behind_task: asyncio.Task | None = None
+    snapshot_manager: SnapshotManager
+    snapshot_task: asyncio.Task | None = None
+    change_notifier: ChangeNotifier | None = None
+    response_stream: ResponseStream | None = None
+    single_flight: SingleFlight | None = None
+    result_cache: ResultCache | None = None
+    prewarm_task: asyncio.Task | None = None
 
     async def _main(self):
         try:
             # Initialize UserManager for per-user database handling
             self.user_manager = UserManager(data_dir, decky.logger)
+            self.change_notifier = ChangeNotifier(decky.emit, decky.logger)
+            self.response_stream = ResponseStream(decky.emit)
+            self.single_flight = SingleFlight()
+            self.result_cache = ResultCache()
 
             # NOTE: Services (games, statistics, time_tracking) will be initialized
             # when set_current_user is called from the frontend.
             # For backward compatibility, if no user is set, we'll use legacy DB.
             self._initialize_legacy_fallback()
+
+            self.session_journal = SessionJournal(
+                Path(data_dir) / "sessions.journal", logger=decky.logger
+            )
+            self._recover_interrupted_sessions()
+
+            self.db_maintenance = DbMaintenance(
+                self.user_manager.open_databases, logger=decky.logger
+            )
+            self.db_maintenance.start()
+            self.write_behind_task = asyncio.get_running_loop().create_task(
+                self._flush_play_time_periodically()
+            )
+
+            self.snapshot_manager = SnapshotManager(
+                keep=SNAPSHOTS_TO_KEEP, logger=decky.logger
+            )
+            self.snapshot_task = asyncio.get_running_loop().create_task(
+                self._snapshot_periodically()
+            )
         except Exception as e:
             decky.logger.exception("[main] Unhandled exception: %s", e)
             raise
@@ -105,6 +163,57 @@ class Plugin:
             self.tracking_manager = None  # type: ignore
             self.association_manager = None  # type: ignore
 
+    def _recover_interrupted_sessions(self):
+        """
+        Save the playtime of sessions that were still running when the plugin
+        stopped, up to their last heartbeat, less what their heartbeats
+        already wrote. A session that fails to save is logged and kept in the
+        journal for the next start.
+        """
+        recovered = self.session_journal.recover()
+        failed = []
+
+        for session in recovered:
+            try:
+                if session.user_id is not None:
+                    dao = self.user_manager.get_dao_for_user(session.user_id)
+                else:
+                    dao = self.user_manager.get_legacy_dao()
+
+                if dao is None or session.last_seen_at <= session.started_at:
+                    continue
+
+                decky.logger.info(
+                    f"[main] Recovering interrupted session {session.session_id} "
+                    f"of game {session.game_id}"
+                )
+                TimeTracking(dao).add_missing_session_time(
+                    session.started_at,
+                    session.last_seen_at,
+                    session.game_id,
+                    session.game_name,
+                )
+            except Exception as e:
+                decky.logger.exception(
+                    "[main] Failed to recover session %s: %s", session.session_id, e
+                )
+                failed.append(session)
+
+        self.session_journal.commit_recovered(recovered, failed)
+
+    def _flush_play_time(self, only_if_due: bool = False):
+        """Write the buffered playtime of every open database."""
+        for dao in self.user_manager.open_daos():
+            dao.flush_play_time(only_if_due)
+
+    async def _flush_play_time_periodically(self):
+        while True:
+            await asyncio.sleep(WRITE_BEHIND_CHECK_SECONDS)
+            try:
+                self._flush_play_time(only_if_due=True)
+            except Exception as e:
+                decky.logger.exception("[write_behind] Unhandled exception: %s", e)
+
     def _get_current_dao(self) -> Dao:
         """
         Get the DAO for the current user.
@@ -125,6 +234,91 @@ class Plugin:
             "Please call set_current_user first."
         )
 
+    async def _snapshot_periodically(self):
+        while True:
+            await asyncio.sleep(SNAPSHOT_CHECK_SECONDS)
+            try:
+                backups_dir = self._get_current_data_dir() / "backups"
+                latest = self.snapshot_manager.latest_snapshot(backups_dir)
+                last_snapshot_at = (
+                    datetime.fromisoformat(latest.created_at).timestamp()
+                    if latest is not None
+                    else 0
+                )
+
+                if time.time() - last_snapshot_at >= SNAPSHOT_INTERVAL_SECONDS:
+                    dao = self._get_current_dao()
+                    dao.flush_play_time()
+                    await asyncio.to_thread(
+                        self.snapshot_manager.create_snapshot, dao, backups_dir
+                    )
+            except Exception as e:
+                decky.logger.exception("[snapshot] Unhandled exception: %s", e)
+
+    def _schedule_prewarm(self):
+        """
+        Warms the result cache with the views opened most, in the background
+        after `PREWARM_DELAY_SECONDS`. The next stored change cancels it.
+        """
+        self._cancel_prewarm()
+        self.prewarm_task = asyncio.get_running_loop().create_task(self._prewarm())
+
+    def _cancel_prewarm(self):
+        if self.prewarm_task is not None:
+            self.prewarm_task.cancel()
+            self.prewarm_task = None
+
+    async def _prewarm(self):
+        try:
+            await asyncio.sleep(PREWARM_DELAY_SECONDS)
+            await self.statistics_for_last_two_weeks()
+            await self.fetch_playtime_information()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            decky.logger.exception("[prewarm] Unhandled exception: %s", e)
+
+    async def _publish_change(self, reason: str, game_ids: List[str] | None = None):
+        """Tell the frontend the current user's data changed."""
+        # Whatever is being warmed is outdated now
+        self._cancel_prewarm()
+        await self.change_notifier.publish(
+            reason, self._get_current_dao().get_generation(), game_ids
+        )
+
+    async def _shared_result(self, name: str, compute, *args, cache: bool = True):
+        """
+        Returns the cached result of `compute` or runs it in a worker thread,
+        shared with identical calls of the current user made while it runs.
+        Calls only share a result if no change was stored in between.
+        Without `cache` the result is only shared, not kept, for calls whose
+        arguments rarely repeat.
+        """
+        key = (
+            self.user_manager.current_user_id,
+            self._get_current_dao().get_generation(),
+            args,
+        )
+
+        result = self.result_cache.get(name, key) if cache else None
+        if result is None:
+            result = await self.single_flight.run(
+                name, key, lambda: asyncio.to_thread(compute, *args)
+            )
+            if cache:
+                self.result_cache.put(name, key, result)
+
+        return result
+
+    def _get_current_data_dir(self) -> Path:
+        """Directory of the current user's database, the runtime dir for legacy."""
+        user_id = self.user_manager.current_user_id
+
+        if user_id is not None:
+            return self.user_manager.get_user_db_path(user_id).parent
+
+        return Path(data_dir)
+
     def _ensure_services_initialized(self):
         """Ensure services are initialized with current user's DAO."""
         dao = self._get_current_dao()
@@ -165,6 +359,10 @@ class Plugin:
         try:
             decky.logger.info(f"[set_current_user] Setting user: {steam_user_id}")
 
+            previous_dao = self.user_manager.get_current_dao()
+            if previous_dao is not None:
+                previous_dao.flush_play_time()
+
             dao = self.user_manager.set_current_user(steam_user_id)
 
             # Update services to use new user's DAO
@@ -179,11 +377,119 @@ class Plugin:
             decky.logger.info(
                 f"[set_current_user] Successfully set user: {steam_user_id}"
             )
+            await self._publish_change("set_current_user")
+            self._schedule_prewarm()
             return None
         except Exception as e:
             decky.logger.exception("[set_current_user] Unhandled exception: %s", e)
             return None
 
+    async def export_data(self, export_format: str = "jsonl"):
+        """
+        Export all playtime data of the current user to a gzip compressed
+        JSON Lines or CSV file in the user's `exports` directory.
+
+        Returns: Path of the file and the number of rows written per table
+        """
+        try:
+            self._ensure_services_initialized()
+            dao = self._get_current_dao()
+            dao.flush_play_time()
+
+            path = (
+                self._get_current_data_dir()
+                / "exports"
+                / f"playtime-{datetime.now():%Y%m%d-%H%M%S}.{export_format}.gz"
+            )
+            result = await asyncio.to_thread(
+                DataExport(dao).export, path, export_format
+            )
+
+            return convert_keys_to_camel_case(result.to_dict())
+        except Exception as e:
+            decky.logger.exception("[export_data] Unhandled exception: %s", e)
+            raise
+
+    async def import_data(self, path: str):
+        """
+        Import games and sessions from a file written by `export_data`.
+        Sessions that are already stored are skipped.
+
+        Returns: Number of imported, duplicate and rejected rows
+        """
+        try:
+            self._ensure_services_initialized()
+            dao = self._get_current_dao()
+            dao.flush_play_time()
+
+            result = await asyncio.to_thread(DataImport(dao).import_file, Path(path))
+            if result.imported_sessions or result.games:
+                await self._publish_change("import_data")
+
+            return convert_keys_to_camel_case(result.to_dict())
+        except Exception as e:
+            decky.logger.exception("[import_data] Unhandled exception: %s", e)
+            raise
+
+    async def create_snapshot(self):
+        """
+        Snapshot the current user's database into their `backups` directory,
+        removing the oldest snapshots beyond the kept number.
+        """
+        try:
+            self._ensure_services_initialized()
+            dao = self._get_current_dao()
+            dao.flush_play_time()
+
+            snapshot = await asyncio.to_thread(
+                self.snapshot_manager.create_snapshot,
+                dao,
+                self._get_current_data_dir() / "backups",
+            )
+
+            return convert_keys_to_camel_case(snapshot.to_dict())
+        except Exception as e:
+            decky.logger.exception("[create_snapshot] Unhandled exception: %s", e)
+            raise
+
+    async def list_snapshots(self):
+        try:
+            self._ensure_services_initialized()
+            return convert_keys_to_camel_case(
+                [
+                    snapshot.to_dict()
+                    for snapshot in self.snapshot_manager.list_snapshots(
+                        self._get_current_data_dir() / "backups"
+                    )
+                ]
+            )
+        except Exception as e:
+            decky.logger.exception("[list_snapshots] Unhandled exception: %s", e)
+            raise
+
+    async def restore_snapshot(self, name: str):
+        """
+        Replace the current user's data with a snapshot. The state before the
+        restore is kept as a new snapshot.
+        """
+        try:
+            self._ensure_services_initialized()
+            dao = self._get_current_dao()
+            dao.flush_play_time()
+
+            snapshot = await asyncio.to_thread(
+                self.snapshot_manager.restore_snapshot,
+                dao,
+                self._get_current_data_dir() / "backups",
+                name,
+            )
+            await self._publish_change("restore_snapshot")
+
+            return convert_keys_to_camel_case(snapshot.to_dict())
+        except Exception as e:
+            decky.logger.exception("[restore_snapshot] Unhandled exception: %s", e)
+            raise
+
     async def get_current_user(self) -> str | None:
         """
         Get the current Steam user ID.
@@ -205,14 +511,73 @@ class Plugin:
                 )
                 return
 
-            self.time_tracking.add_time(
+            saved_until = None
+            if dto.session_id is not None:
+                saved_until = self.session_journal.saved_until(dto.session_id)
+
+            if saved_until is not None:
+                # Heartbeats buffered the session up to `saved_until`; all of
+                # it is written before the journal lets go of the session
+                self.time_tracking.add_session_progress(
+                    dto.started_at,
+                    saved_until,
+                    dto.ended_at,
+                    dto.game_id,
+                    dto.game_name,
+                )
+                self.time_tracking.dao.flush_play_time()
+            elif dto.started_at < dto.ended_at:
+                self.time_tracking.add_time(
+                    dto.started_at,
+                    dto.ended_at,
+                    dto.game_id,
+                    dto.game_name,
+                )
+
+            if saved_until is not None or dto.started_at < dto.ended_at:
+                await self._publish_change("add_time", [dto.game_id])
+                self._schedule_prewarm()
+
+            if dto.session_id is not None:
+                await asyncio.to_thread(self.session_journal.close, dto.session_id)
+        except Exception as e:
+            decky.logger.exception("[add_time] Unhandled exception: %s", e)
+            raise
+
+    async def session_heartbeat(self, dto_dict: SessionHeartbeatDict):
+        """
+        Record the progress of a running session, so its playtime can be
+        recovered if the session never reaches `add_time`. The time played
+        since the previous heartbeat is buffered and written behind.
+        """
+        try:
+            self._ensure_services_initialized()
+            dto = SessionHeartbeatDTO.from_dict(dto_dict)
+
+            if not self.tracking_manager.should_track_session(dto.game_id):
+                return
+
+            last_seen_at = (
+                dto.last_seen_at if dto.last_seen_at is not None else time.time()
+            )
+            saved_until = await asyncio.to_thread(
+                self.session_journal.heartbeat,
+                dto.session_id,
+                self.user_manager.current_user_id,
+                dto.game_id,
+                dto.game_name,
                 dto.started_at,
-                dto.ended_at,
+                last_seen_at,
+            )
+            self.time_tracking.add_session_progress(
+                dto.started_at,
+                saved_until,
+                last_seen_at,
                 dto.game_id,
                 dto.game_name,
             )
         except Exception as e:
-            decky.logger.exception("[add_time] Unhandled exception: %s", e)
+            decky.logger.exception("[session_heartbeat] Unhandled exception: %s", e)
             raise
 
     async def daily_statistics_for_period(self, dto_dict: DailyStatisticsForPeriodDict):
@@ -233,11 +598,78 @@ class Plugin:
             )
             raise
 
-    async def statistics_for_last_two_weeks(self):
+    async def stream_daily_statistics_for_period(
+        self, dto_dict: DailyStatisticsForPeriodDict, stream_id: str
+    ):
+        """
+        Like `daily_statistics_for_period`, but the days are sent a week at a
+        time as `statistics_chunk` events of `stream_id`.
+
+        Returns: The paging of the period and the number of chunks sent
+        """
         try:
             self._ensure_services_initialized()
+            dto = DailyStatisticsForPeriodDTO.from_dict(dto_dict)
+            start, end = parse_date(dto.start_date), parse_date(dto.end_date)
+
+            chunks = await self.response_stream.send(
+                stream_id,
+                self.statistics.iter_daily_statistics_for_period(
+                    start, end, dto.game_id
+                ),
+            )
+            paging = self.statistics.daily_statistics_paging(start, end, dto.game_id)
+
             return convert_keys_to_camel_case(
-                self.statistics.get_statistics_for_last_two_weeks()
+                {**paging.to_dict(), "stream_id": stream_id, "chunks": chunks}
+            )
+        except Exception as e:
+            decky.logger.exception(
+                "[stream_daily_statistics_for_period] Unhandled exception: %s", e
+            )
+            raise
+
+    async def statistics_for_period(self, dto_dict: StatisticsForPeriodDict):
+        try:
+            self._ensure_services_initialized()
+            dto = StatisticsForPeriodDTO.from_dict(dto_dict)
+
+            return convert_keys_to_camel_case(
+                self.statistics.statistics_for_period(
+                    parse_date(dto.start_date),
+                    parse_date(dto.end_date),
+                    dto.granularity,
+                    dto.game_id,
+                    dto.week_starts_on,
+                ).to_dict()
+            )
+        except Exception as e:
+            decky.logger.exception("[statistics_for_period] Unhandled exception: %s", e)
+            raise
+
+    async def playtime_heatmap(self, game_id: str | None = None):
+        try:
+            self._ensure_services_initialized()
+            return convert_keys_to_camel_case(
+                self.statistics.playtime_heatmap(game_id).to_dict()
+            )
+        except Exception as e:
+            decky.logger.exception("[playtime_heatmap] Unhandled exception: %s", e)
+            raise
+
+    async def statistics_for_last_two_weeks(self):
+        try:
+            self._ensure_services_initialized()
+            statistics = self.statistics
+
+            def compute(today: datetime):
+                return convert_keys_to_camel_case(
+                    statistics.get_statistics_for_last_two_weeks(today)
+                )
+
+            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            return await self._shared_result(
+                "statistics_for_last_two_weeks", compute, today
             )
 
         except Exception as e:
@@ -246,11 +678,28 @@ class Plugin:
             )
             raise
 
-    async def fetch_playtime_information(self):
+    async def fetch_playtime_information(self, since: int | None = None):
+        """
+        Without `since` returns every game's playtime. With the `generation`
+        of an earlier response (or of a `data_changed` event) returns only
+        the entries upserted and removed after it.
+        """
         try:
             self._ensure_services_initialized()
-            return convert_keys_to_camel_case(
-                self.statistics.fetch_playtime_information()
+            statistics = self.statistics
+
+            def compute(since: int | None):
+                if since is not None:
+                    return convert_keys_to_camel_case(
+                        statistics.fetch_playtime_information_since(since).to_dict()
+                    )
+
+                return convert_keys_to_camel_case(
+                    statistics.fetch_playtime_information()
+                )
+
+            return await self._shared_result(
+                "fetch_playtime_information", compute, since
             )
 
         except Exception as e:
@@ -271,6 +720,28 @@ class Plugin:
             )
             raise
 
+    async def stream_per_game_overall_statistics(self, stream_id: str):
+        """
+        Like `per_game_overall_statistics`, but the games are sent in chunks
+        as `statistics_chunk` events of `stream_id` while they are read.
+
+        Returns: The number of chunks sent
+        """
+        try:
+            self._ensure_services_initialized()
+            chunks = await self.response_stream.send(
+                stream_id, self.statistics.iter_per_game_overall_statistics()
+            )
+
+            return convert_keys_to_camel_case(
+                {"stream_id": stream_id, "chunks": chunks}
+            )
+        except Exception as e:
+            decky.logger.exception(
+                "[stream_per_game_overall_statistics] Unhandled exception: %s", e
+            )
+            raise
+
     async def short_per_game_overall_statistics(self):
         try:
             self._ensure_services_initialized()
@@ -289,15 +760,34 @@ class Plugin:
         try:
             self._ensure_services_initialized()
             dto = ApplyManualTimeCorrectionDTO.from_dict(list_of_game_stats)
-            return self.time_tracking.apply_manual_time_for_games(
+            results = self.time_tracking.apply_manual_time_for_games(
                 list_of_game_stats=dto, source="manually-changed"
             )
+            await self._publish_change(
+                "manual_time_correction", [result.game_id for result in results]
+            )
+
+            return convert_keys_to_camel_case([result.to_dict() for result in results])
         except Exception as e:
             decky.logger.exception(
                 "[apply_manual_time_correction] Unhandled exception: %s", e
             )
             raise
 
+    async def verify_overall_time(self, repair: bool = False):
+        try:
+            self._ensure_services_initialized()
+            drifts = self.time_tracking.verify_overall_time(repair)
+            if repair and drifts:
+                await self._publish_change(
+                    "verify_overall_time", [drift.game_id for drift in drifts]
+                )
+
+            return convert_keys_to_camel_case([drift.to_dict() for drift in drifts])
+        except Exception as e:
+            decky.logger.exception("[verify_overall_time] Unhandled exception: %s", e)
+            raise
+
     async def get_game(self, game_id: GetGameDTO):
         try:
             self._ensure_services_initialized()
@@ -324,20 +814,49 @@ class Plugin:
             decky.logger.exception("[get_file_sha256] Unhandled exception: %s", e)
             raise
 
-    async def get_games_dictionary(self):
+    async def get_games_dictionary(self, since: int | None = None):
+        """Like `fetch_playtime_information`, `since` returns only the changes."""
         try:
             self._ensure_services_initialized()
-            return convert_keys_to_camel_case(self.games.get_dictionary())
+            games = self.games
+
+            def compute(since: int | None):
+                if since is not None:
+                    return convert_keys_to_camel_case(
+                        games.get_dictionary_since(since).to_dict()
+                    )
+
+                return convert_keys_to_camel_case(games.get_dictionary())
+
+            return await self._shared_result("get_games_dictionary", compute, since)
         except Exception as e:
             decky.logger.exception("[get_games_dictionary] Unhandled exception: %s", e)
             raise
 
+    async def search_games(self, query: str, limit: int = 20):
+        """Games matching `query` by name, best match first."""
+        try:
+            self._ensure_services_initialized()
+            games = self.games
+
+            def compute(query: str, limit: int):
+                return convert_keys_to_camel_case(games.search(query, limit))
+
+            # Every keystroke is a new query, keeping them would push the
+            # statistics out of the result cache
+            return await self._shared_result(
+                "search_games", compute, query, limit, cache=False
+            )
+        except Exception as e:
+            decky.logger.exception("[search_games] Unhandled exception: %s", e)
+            raise
+
     async def save_game_checksum(self, dto_dict: AddGameChecksumDict):
         try:
             self._ensure_services_initialized()
             dto = AddGameChecksumDTO.from_dict(dto_dict)
 
-            return self.games.save_game_checksum(
+            result = self.games.save_game_checksum(
                 dto.game_id,
                 dto.checksum,
                 dto.algorithm,
@@ -345,6 +864,9 @@ class Plugin:
                 dto.created_at,
                 dto.updated_at,
             )
+            await self._publish_change("game_checksum", [dto.game_id])
+
+            return result
         except Exception as e:
             decky.logger.exception("[save_game_checksum] Unhandled exception: %s", e)
             raise
@@ -354,7 +876,10 @@ class Plugin:
             self._ensure_services_initialized()
             dtos = [AddGameChecksumDTO.from_dict(dto_dict) for dto_dict in dtos_list]
 
-            return self.games.save_game_checksum_bulk(dtos)
+            result = self.games.save_game_checksum_bulk(dtos)
+            await self._publish_change("game_checksum", [dto.game_id for dto in dtos])
+
+            return result
         except Exception as e:
             decky.logger.exception(
                 "[save_game_checksum_bulk] Unhandled exception: %s", e
@@ -364,9 +889,10 @@ class Plugin:
     async def remove_game_checksum(self, dto: RemoveGameChecksumDTO):
         try:
             self._ensure_services_initialized()
-            return convert_keys_to_camel_case(
-                self.games.remove_game_checksum(dto["game_id"], dto["checksum"])
-            )
+            result = self.games.remove_game_checksum(dto["game_id"], dto["checksum"])
+            await self._publish_change("game_checksum", [dto["game_id"]])
+
+            return convert_keys_to_camel_case(result)
         except Exception as e:
             decky.logger.exception("[remove_game_checksum] Unhandled exception: %s", e)
             raise
@@ -374,9 +900,10 @@ class Plugin:
     async def remove_all_game_checksum(self, game_id: RemoveAllGameChecksumsDTO):
         try:
             self._ensure_services_initialized()
-            return convert_keys_to_camel_case(
-                self.games.remove_all_game_checksums(game_id)
-            )
+            result = self.games.remove_all_game_checksums(game_id)
+            await self._publish_change("game_checksum", [game_id])
+
+            return convert_keys_to_camel_case(result)
         except Exception as e:
             decky.logger.exception("[remove_game_checksum] Unhandled exception: %s", e)
             raise
@@ -384,7 +911,10 @@ class Plugin:
     async def remove_all_checksums(self):
         try:
             self._ensure_services_initialized()
-            return self.games.remove_all_checksums()
+            result = self.games.remove_all_checksums()
+            await self._publish_change("game_checksum")
+
+            return result
         except Exception as e:
             decky.logger.exception("[remove_all_checksums] Unhandled exception: %s", e)
             raise
@@ -404,9 +934,12 @@ class Plugin:
     ):
         try:
             self._ensure_services_initialized()
-            return self.games.link_game_to_game_with_checksum(
+            result = self.games.link_game_to_game_with_checksum(
                 child_game_id, parent_game_id
             )
+            await self._publish_change("game_checksum", [child_game_id, parent_game_id])
+
+            return result
         except Exception as e:
             decky.logger.exception(
                 "[link_game_to_game_with_checksum] Unhandled exception: %s", e
@@ -434,12 +967,39 @@ class Plugin:
         """Get all non-default tracking configurations."""
         try:
             self._ensure_services_initialized()
+            tracking_manager = self.tracking_manager
+
+            def compute():
+                return convert_keys_to_camel_case(
+                    tracking_manager.get_all_tracking_configs()
+                )
+
+            return await self._shared_result("get_all_tracking_configs", compute)
+        except Exception as e:
+            decky.logger.exception(
+                "[get_all_tracking_configs] Unhandled exception: %s", e
+            )
+            raise
+
+    async def get_request_coalescing_stats(self):
+        """
+        How often each coalesced RPC was called and how many of those calls
+        shared the result of a call already running, and how often a result
+        came from the result cache.
+        """
+        try:
             return convert_keys_to_camel_case(
-                self.tracking_manager.get_all_tracking_configs()
+                {
+                    "in_flight": self.single_flight.in_flight,
+                    "cache": self.result_cache.stats().to_dict(),
+                    "calls": [
+                        counters.to_dict() for counters in self.single_flight.counters()
+                    ],
+                }
             )
         except Exception as e:
             decky.logger.exception(
-                "[get_all_tracking_configs] Unhandled exception: %s", e
+                "[get_request_coalescing_stats] Unhandled exception: %s", e
             )
             raise
 
@@ -451,6 +1011,7 @@ class Plugin:
             status = dto_dict.get("status")
 
             self.tracking_manager.set_tracking_status(game_id, status)
+            await self._publish_change("tracking_status", [game_id])
             return True
         except Exception as e:
             decky.logger.exception(
@@ -463,6 +1024,7 @@ class Plugin:
         try:
             self._ensure_services_initialized()
             self.tracking_manager.remove_tracking_status(game_id)
+            await self._publish_change("tracking_status", [game_id])
             return True
         except Exception as e:
             decky.logger.exception(
@@ -512,6 +1074,9 @@ class Plugin:
                     "error": convert_keys_to_camel_case(error.to_dict()),
                 }
 
+            await self._publish_change(
+                "game_association", [parent_game_id, child_game_id]
+            )
             return {"success": True}
         except Exception as e:
             decky.logger.exception(
@@ -519,11 +1084,59 @@ class Plugin:
             )
             raise
 
+    async def create_game_associations(self, dto_list: List[dict]):
+        """
+        Create many parent/child associations in one call, e.g. to group
+        every version of a game. Each pair is reported individually.
+        """
+        try:
+            self._ensure_services_initialized()
+            pairs = [
+                (dto_dict.get("parent_game_id"), dto_dict.get("child_game_id"))
+                for dto_dict in dto_list
+            ]
+
+            errors = self.association_manager.create_associations(pairs)
+
+            results = [
+                {
+                    "parent_game_id": parent_game_id,
+                    "child_game_id": child_game_id,
+                    "success": error is None,
+                    "error": error.to_dict() if error else None,
+                }
+                for (parent_game_id, child_game_id), error in zip(pairs, errors)
+            ]
+
+            changed_game_ids = [
+                game_id
+                for result in results
+                if result["success"]
+                for game_id in (result["parent_game_id"], result["child_game_id"])
+            ]
+            if changed_game_ids:
+                await self._publish_change("game_association", changed_game_ids)
+
+            return convert_keys_to_camel_case(
+                {
+                    "success": all(result["success"] for result in results),
+                    "results": results,
+                }
+            )
+        except Exception as e:
+            decky.logger.exception(
+                "[create_game_associations] Unhandled exception: %s", e
+            )
+            raise
+
     async def remove_game_association(self, child_game_id: str):
         """Remove an association for a child game."""
         try:
             self._ensure_services_initialized()
 
+            parent_game_id = self.association_manager.dao.get_parent_of_child(
+                child_game_id
+            )
             error = self.association_manager.remove_association(child_game_id)
 
             if error:
@@ -532,6 +1145,10 @@ class Plugin:
                     "error": convert_keys_to_camel_case(error.to_dict()),
                 }
 
+            await self._publish_change(
+                "game_association",
+                [child_game_id] + ([parent_game_id] if parent_game_id else []),
+            )
             return {"success": True}
         except Exception as e:
             decky.logger.exception(
@@ -586,6 +1203,21 @@ class Plugin:
             raise
 
     async def _unload(self):
+        self._cancel_prewarm()
+
+        if self.snapshot_task is not None:
+            self.snapshot_task.cancel()
+            self.snapshot_task = None
+
+        if self.write_behind_task is not None:
+            self.write_behind_task.cancel()
+            self.write_behind_task = None
+            self._flush_play_time()
+
+        if self.db_maintenance is not None:
+            await self.db_maintenance.stop()
+            self.db_maintenance = None
+
         decky.logger.info("Goodnight, World!")
 
     async def _uninstall(self):
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
-from py_modules.db.dao import Dao
+from typing import List, Dict, Optional, Tuple
+from py_modules.db.dao import Dao, GameAssociationState
 
 
 @dataclass(slots=True)
@@ -43,55 +43,109 @@ class AssociationManager:
     def create_association(
         self, parent_game_id: str, child_game_id: str
     ) -> Optional[AssociationError]:
+        states = self.dao.get_game_association_states([parent_game_id, child_game_id])
+
+        error = self._validate_association(parent_game_id, child_game_id, states)
+        if error:
+            return error
+
+        self.dao.create_game_association(parent_game_id, child_game_id)
+        return None
+
+    def create_associations(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Optional[AssociationError]]:
+        """
+        Validate and create many associations at once, e.g. to group every
+        version of a game under one parent.
+
+        Pairs are validated in order against a single snapshot of the current
+        associations, so a pair may depend on the ones accepted before it.
+        All accepted pairs are inserted in one transaction.
+
+        Returns one entry per pair: `None` when created, or the error.
+        """
+        game_ids = {game_id for pair in pairs for game_id in pair if game_id}
+        states = self.dao.get_game_association_states(game_ids)
+
+        errors: List[Optional[AssociationError]] = []
+        accepted: List[Tuple[str, str]] = []
+
+        for parent_game_id, child_game_id in pairs:
+            error = self._validate_association(parent_game_id, child_game_id, states)
+            errors.append(error)
+
+            if error:
+                continue
+
+            accepted.append((parent_game_id, child_game_id))
+            states[child_game_id].parent_game_id = parent_game_id
+            states[parent_game_id].has_children = True
+
+        if accepted:
+            self.dao.create_game_associations(accepted)
+
+        return errors
+
+    def _validate_association(
+        self,
+        parent_game_id: str,
+        child_game_id: str,
+        states: Dict[str, GameAssociationState],
+    ) -> Optional[AssociationError]:
+        if not parent_game_id or not child_game_id:
+            return AssociationError(
+                code="MISSING_PARAMS",
+                message="parent_game_id and child_game_id are required",
+            )
+
         if parent_game_id == child_game_id:
             return AssociationError(
                 code="SELF_ASSOCIATION",
                 message="Cannot associate a game with itself.",
             )
 
-        parent_game = self.dao.get_game(parent_game_id)
-        if not parent_game:
+        parent_state = states.get(parent_game_id)
+        if not parent_state or not parent_state.exists:
             return AssociationError(
                 code="PARENT_NOT_FOUND",
                 message=f"Parent game '{parent_game_id}' does not exist.",
             )
 
-        child_game = self.dao.get_game(child_game_id)
-        if not child_game:
+        child_state = states.get(child_game_id)
+        if not child_state or not child_state.exists:
             return AssociationError(
                 code="CHILD_NOT_FOUND",
                 message=f"Child game '{child_game_id}' does not exist.",
             )
 
-        if self.dao.is_game_a_child(child_game_id):
+        if child_state.parent_game_id is not None:
             return AssociationError(
                 code="ALREADY_CHILD",
                 message=f"Game '{child_game_id}' is already associated with another parent.",
             )
 
-        if self.dao.is_game_a_parent(child_game_id):
+        if child_state.has_children:
             return AssociationError(
                 code="IS_PARENT",
                 message=f"Game '{child_game_id}' has children and cannot become a child itself.",
             )
 
-        if self.dao.is_game_a_child(parent_game_id):
+        if parent_state.parent_game_id is not None:
             return AssociationError(
                 code="PARENT_IS_CHILD",
                 message=f"Game '{parent_game_id}' is a child of another game and cannot be a parent.",
             )
 
-        self.dao.create_game_association(parent_game_id, child_game_id)
         return None
 
     def remove_association(self, child_game_id: str) -> Optional[AssociationError]:
-        if not self.dao.is_game_a_child(child_game_id):
+        if not self.dao.remove_game_association(child_game_id):
             return AssociationError(
                 code="NOT_A_CHILD",
                 message=f"Game '{child_game_id}' is not associated with any parent.",
             )
 
-        self.dao.remove_game_association(child_game_id)
         return None
 
     def get_all_associations(self) -> List[Dict]:
@@ -108,34 +162,30 @@ class AssociationManager:
         ]
 
     def get_association_for_game(self, game_id: str) -> Optional[Dict]:
-        # Check if game is a child
-        parent_id = self.dao.get_parent_of_child(game_id)
-        if parent_id:
-            parent_game = self.dao.get_game(parent_id)
-            return {
-                "role": "child",
-                "parent_game_id": parent_id,
-                "parent_game_name": parent_game.name if parent_game else "[Unknown]",
-            }
+        associated_games = self.dao.get_associated_games(game_id)
+
+        if not associated_games:
+            return None
 
-        # Check if game is a parent
-        children = self.dao.get_children_of_parent(game_id)
-        if children:
-            children_info = []
-            for child_id in children:
-                child_game = self.dao.get_game(child_id)
-                children_info.append(
-                    {
-                        "game_id": child_id,
-                        "game_name": child_game.name if child_game else "[Unknown]",
-                    }
-                )
+        # A game is either a child or a parent, never both
+        if associated_games[0].role == "parent":
+            parent_game = associated_games[0]
             return {
-                "role": "parent",
-                "children": children_info,
+                "role": "child",
+                "parent_game_id": parent_game.game_id,
+                "parent_game_name": parent_game.game_name or "[Unknown]",
             }
 
-        return None
+        return {
+            "role": "parent",
+            "children": [
+                {
+                    "game_id": child_game.game_id,
+                    "game_name": child_game.game_name or "[Unknown]",
+                }
+                for child_game in associated_games
+            ],
+        }
 
     def get_combined_playtime(self, game_id: str) -> float:
         return self.dao.get_combined_playtime_for_game(game_id)
@@ -147,6 +197,5 @@ class AssociationManager:
         return not self.dao.is_game_a_child(game_id)
 
     def can_be_child(self, game_id: str) -> bool:
-        return not self.dao.is_game_a_child(game_id) and not self.dao.is_game_a_parent(
-            game_id
-        )
+        state = self.dao.get_game_association_states([game_id])[game_id]
+        return state.parent_game_id is None and not state.has_children
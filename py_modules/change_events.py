@@ -0,0 +1,58 @@
+"""
+Change events pushed to the frontend whenever stored data changes, so it can
+refetch what changed instead of polling.
+
+Event payload (camelCase, as the frontend receives it):
+    {
+        "generation": 42,
+        "reason": "add_time",
+        "gameIds": ["12345"]      # null when every game may be affected
+    }
+"""
+
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+DATA_CHANGED_EVENT = "data_changed"
+
+
+class ChangeNotifier:
+    """
+    Publishes changes through `emit`, each with the change log generation
+    of the database it was stored in. A client that has missed events can
+    catch up with a delta request `since` the last generation it handled.
+    """
+
+    __slots__ = ("_emit", "_logger")
+
+    def __init__(self, emit: Callable[..., Awaitable[None]], logger=None):
+        """
+        Args:
+            emit: Coroutine function sending an event, e.g. `decky.emit`
+            logger: Optional logger instance for debugging
+        """
+        self._emit = emit
+        self._logger = logger
+
+    async def publish(
+        self,
+        reason: str,
+        generation: int,
+        game_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Publishes a change of `game_ids` (None for all games). Failing to
+        deliver is only logged, the change itself has already been stored.
+        """
+        event: Dict = {
+            "generation": generation,
+            "reason": reason,
+            "gameIds": None if game_ids is None else list(dict.fromkeys(game_ids)),
+        }
+
+        try:
+            await self._emit(DATA_CHANGED_EVENT, event)
+        except Exception as e:
+            if self._logger:
+                self._logger.warning(
+                    f"[ChangeNotifier] Failed to publish {reason} change: {e}"
+                )
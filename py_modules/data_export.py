@@ -0,0 +1,87 @@
+import csv
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+
+from py_modules.db.dao import EXPORT_TABLES, Dao
+
+EXPORT_FORMATS = ("jsonl", "csv")
+
+
+@dataclass(slots=True)
+class ExportResult:
+    path: str
+    format: str
+    rows: Dict[str, int]
+
+    def to_dict(self) -> Dict:
+        return {"path": self.path, "format": self.format, "rows": self.rows}
+
+
+class DataExport:
+    """
+    Writes all playtime data of one database to a gzip compressed file,
+    streaming rows so memory use does not grow with the library.
+
+    `jsonl` writes one object per row with a `table` key next to the columns.
+    `csv` writes the tables one after another; each row starts with its table
+    name and every table starts with a header row whose first cell is `table`.
+    """
+
+    __slots__ = ("dao",)
+    dao: Dao
+
+    def __init__(self, dao: Dao) -> None:
+        self.dao = dao
+
+    def export(self, path: Path, export_format: str = "jsonl") -> ExportResult:
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Unknown export format '{export_format}', "
+                f"expected one of {', '.join(EXPORT_FORMATS)}"
+            )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = path.with_name(path.name + ".part")
+        rows = {table: 0 for table in EXPORT_TABLES}
+
+        try:
+            with gzip.open(
+                partial_path, "wt", encoding="utf-8", newline="", compresslevel=6
+            ) as file:
+                if export_format == "jsonl":
+                    self._write_jsonl(file, rows)
+                else:
+                    self._write_csv(file, rows)
+
+            os.replace(partial_path, path)
+        finally:
+            if partial_path.exists():
+                partial_path.unlink()
+
+        return ExportResult(str(path), export_format, rows)
+
+    def _write_jsonl(self, file, rows: Dict[str, int]) -> None:
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+        for table, row in self.dao.iter_export_rows():
+            record = {"table": table}
+            record.update(zip(EXPORT_TABLES[table], row))
+            file.write(encode(record))
+            file.write("\n")
+            rows[table] += 1
+
+    def _write_csv(self, file, rows: Dict[str, int]) -> None:
+        writer = csv.writer(file)
+        current_table = None
+
+        for table, row in self.dao.iter_export_rows():
+            if table != current_table:
+                writer.writerow(("table", *EXPORT_TABLES[table]))
+                current_table = table
+
+            writer.writerow((table, *row))
+            rows[table] += 1
@@ -0,0 +1,151 @@
+import csv
+import gzip
+import io
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from py_modules.db.dao import Dao
+from py_modules.dto.import_rows import ImportGameDTO, ImportSessionDTO
+
+# Number of reported messages about rejected rows
+MAX_IMPORT_ERRORS = 20
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+@dataclass(slots=True)
+class ImportResult:
+    games: int = 0
+    imported_sessions: int = 0
+    duplicate_sessions: int = 0
+    invalid_rows: int = 0
+    skipped_rows: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "games": self.games,
+            "imported_sessions": self.imported_sessions,
+            "duplicate_sessions": self.duplicate_sessions,
+            "invalid_rows": self.invalid_rows,
+            "skipped_rows": self.skipped_rows,
+            "errors": self.errors,
+        }
+
+
+class DataImport:
+    """
+    Reads a file written by `DataExport` (gzip compressed or not) and adds its
+    games and sessions, streaming it in chunks of `chunk_size` sessions, each
+    imported in its own transaction. Sessions already stored with the same
+    game, start and duration are skipped, so importing a file twice is safe.
+
+    Only `game_dict` and `play_time` rows are imported, rows of the other
+    tables are counted as skipped.
+    """
+
+    __slots__ = ("dao", "chunk_size")
+    dao: Dao
+
+    def __init__(self, dao: Dao, chunk_size: int = 20_000) -> None:
+        self.dao = dao
+        self.chunk_size = chunk_size
+
+    def import_file(self, path: Path) -> ImportResult:
+        result = ImportResult()
+        game_names: Dict[str, str] = {}
+        sessions: List[Tuple[str, float, str, str | None]] = []
+
+        for line_number, table, row in self._iter_rows(path):
+            try:
+                if row is None:
+                    raise ValueError("row is not valid JSON")
+                if table == "game_dict":
+                    game = ImportGameDTO.from_dict(row)
+                    game_names[game.game_id] = game.name
+                    result.games += 1
+                elif table == "play_time":
+                    sessions.append(ImportSessionDTO.from_dict(row).to_tuple())
+                else:
+                    result.skipped_rows += 1
+            except (ValueError, TypeError) as e:
+                result.invalid_rows += 1
+                if len(result.errors) < MAX_IMPORT_ERRORS:
+                    result.errors.append(f"line {line_number}: {e}")
+
+            if len(sessions) >= self.chunk_size:
+                self._import_chunk(game_names, sessions, result)
+                game_names, sessions = {}, []
+
+        self._import_chunk(game_names, sessions, result)
+
+        return result
+
+    def _import_chunk(
+        self,
+        game_names: Dict[str, str],
+        sessions: List[Tuple[str, float, str, str | None]],
+        result: ImportResult,
+    ) -> None:
+        if not game_names and not sessions:
+            return
+
+        inserted = self.dao.import_sessions(game_names, sessions)
+        result.imported_sessions += inserted
+        result.duplicate_sessions += len(sessions) - inserted
+
+    def _iter_rows(
+        self, path: Path
+    ) -> Iterator[Tuple[int, Optional[str], Optional[Dict]]]:
+        """Yields `(line, table, row)`; `row` is None for unreadable lines."""
+        with open(path, "rb") as raw:
+            is_gzip = raw.read(2) == _GZIP_MAGIC
+
+        binary = gzip.open(path, "rb") if is_gzip else open(path, "rb")
+
+        with io.TextIOWrapper(binary, encoding="utf-8", newline="") as file:
+            first_line = file.readline()
+
+            if first_line.lstrip().startswith("{"):
+                yield from self._iter_jsonl(first_line, file)
+            else:
+                yield from self._iter_csv(first_line, file)
+
+    def _iter_jsonl(
+        self, first_line: str, file
+    ) -> Iterator[Tuple[int, Optional[str], Optional[Dict]]]:
+        for line_number, line in enumerate(self._lines(first_line, file), start=1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+
+            if not isinstance(record, dict):
+                yield line_number, None, None
+                continue
+
+            yield line_number, record.pop("table", None), record
+
+    def _iter_csv(self, first_line: str, file) -> Iterator[Tuple[int, str, Dict]]:
+        columns: List[str] = []
+
+        reader = csv.reader(self._lines(first_line, file))
+        for line_number, row in enumerate(reader, start=1):
+            if not row:
+                continue
+
+            table, values = row[0], row[1:]
+            if table == "table":
+                columns = values
+                continue
+
+            yield line_number, table, dict(zip(columns, values))
+
+    def _lines(self, first_line: str, file) -> Iterator[str]:
+        yield first_line
+        yield from file
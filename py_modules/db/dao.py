@@ -1,9 +1,23 @@
+import contextlib
 from dataclasses import dataclass
 import datetime
+import re
 import sqlite3
-from typing import Tuple, List, Dict, Optional, Collection
+import threading
+from typing import (
+    Tuple,
+    List,
+    Dict,
+    Optional,
+    Collection,
+    Iterable,
+    Iterator,
+    Generator,
+    Set,
+)
 
 from py_modules.db.sqlite_db import SqlLiteDb
+from py_modules.db.write_buffer import PlayTimeWriteBuffer
 from py_modules.schemas.common import ChecksumAlgorithm
 
 
@@ -97,6 +111,212 @@ class PlaytimeInformation:
     aliases_id: str | None
 
 
+@dataclass(slots=True)
+class PeriodGameTimeDto:
+    period_start: str
+    game_id: str
+    game_name: str | None
+    time: float
+    sessions: int
+
+
+@dataclass(slots=True)
+class OverallTimeDrift:
+    game_id: str
+    stored_time: float | None
+    actual_time: float
+
+    def to_dict(self) -> Dict:
+        return {
+            "game_id": self.game_id,
+            "stored_time": self.stored_time,
+            "actual_time": self.actual_time,
+        }
+
+
+@dataclass(slots=True)
+class ManualTimeCorrectionResult:
+    game_id: str
+    previous_time: float
+    time: float
+    delta: float
+
+    def to_dict(self) -> Dict:
+        return {
+            "game_id": self.game_id,
+            "previous_time": self.previous_time,
+            "time": self.time,
+            "delta": self.delta,
+        }
+
+
+@dataclass(slots=True)
+class DataBoundaries:
+    prev_date: str | None
+    next_date: str | None
+
+
+@dataclass(slots=True)
+class GameAssociationState:
+    game_id: str
+    exists: bool
+    parent_game_id: str | None
+    has_children: bool
+
+
+@dataclass(slots=True)
+class AssociatedGame:
+    role: str
+    game_id: str
+    game_name: str | None
+
+
+# Resolves every game with stored file checksums to a single canonical
+# checksum: the smallest checksum of its alias component (games transitively
+# sharing a checksum). Joining `CanonicalChecksum` instead of
+# `game_file_checksum` keeps one row per game, however many checksums it has.
+#
+# `CanonicalGame` maps every game to the game its playtime is reported under:
+# the smallest game_id of its alias component (`GameComponent`). When any
+# game of the component is an association child, it is the component leader
+# of that child's parent instead (`ComponentParent`).
+#
+# The components are recomputed by every query using them rather than kept in
+# a table updated on checksum and association writes: that takes a few ms for
+# a thousand games with checksums, and read RPC results are cached per change
+# log generation, so it only reruns after a write.
+#
+# Must be placed right after `WITH RECURSIVE`.
+_CANONICAL_CHECKSUM_CTE = """
+    AliasPairs (id1, id2) AS (
+        SELECT DISTINCT gfc1.game_id, gfc2.game_id
+        FROM game_file_checksum gfc1
+        JOIN game_file_checksum gfc2
+            ON gfc1.checksum = gfc2.checksum AND gfc1.algorithm = gfc2.algorithm
+        WHERE gfc1.game_id < gfc2.game_id
+    ),
+    ChecksumComponentLeaders (game_id, leader_id) AS (
+        SELECT game_id, game_id FROM game_file_checksum
+        UNION
+        SELECT ap.id2, cl.leader_id
+        FROM ChecksumComponentLeaders cl JOIN AliasPairs ap ON cl.game_id = ap.id1
+        UNION
+        SELECT ap.id1, cl.leader_id
+        FROM ChecksumComponentLeaders cl JOIN AliasPairs ap ON cl.game_id = ap.id2
+    ),
+    ChecksumComponentMapping (game_id, leader_id) AS (
+        SELECT game_id, MIN(leader_id)
+        FROM ChecksumComponentLeaders
+        GROUP BY game_id
+    ),
+    ComponentChecksum (leader_id, checksum) AS (
+        SELECT ccm.leader_id, MIN(gfc.checksum)
+        FROM ChecksumComponentMapping ccm
+        JOIN game_file_checksum gfc ON gfc.game_id = ccm.game_id
+        GROUP BY ccm.leader_id
+    ),
+    CanonicalChecksum (game_id, checksum) AS (
+        SELECT ccm.game_id, cc.checksum
+        FROM ChecksumComponentMapping ccm
+        JOIN ComponentChecksum cc ON cc.leader_id = ccm.leader_id
+    ),
+    GameComponent (game_id, component_id) AS (
+        SELECT gd.game_id, COALESCE(ccm.leader_id, gd.game_id)
+        FROM game_dict gd
+        LEFT JOIN ChecksumComponentMapping ccm ON ccm.game_id = gd.game_id
+    ),
+    ComponentParent (component_id, parent_game_id) AS (
+        SELECT gc.component_id, MIN(ga.parent_game_id)
+        FROM GameComponent gc
+        JOIN game_association ga ON ga.child_game_id = gc.game_id
+        GROUP BY gc.component_id
+    ),
+    CanonicalGame (game_id, canonical_game_id) AS (
+        SELECT
+            gc.game_id,
+            COALESCE(pgc.component_id, cp.parent_game_id, gc.component_id)
+        FROM GameComponent gc
+        LEFT JOIN ComponentParent cp ON cp.component_id = gc.component_id
+        LEFT JOIN GameComponent pgc ON pgc.game_id = cp.parent_game_id
+    )
+"""
+
+# Keeps the newest session of a game in `game_last_session`. Appended to an
+# INSERT of (game_id, date_time, duration, migrated) rows; on equal start
+# times the later insert wins, like the newest row on the play_time index.
+_LAST_SESSION_UPSERT = """
+    ON CONFLICT (game_id) DO UPDATE SET
+        date_time = excluded.date_time,
+        duration = excluded.duration,
+        migrated = excluded.migrated
+    WHERE excluded.date_time >= game_last_session.date_time
+"""
+
+def _component_game_filter(game_ids: Collection[str]) -> Tuple[str, Dict[str, str]]:
+    """
+    CTEs to follow `_CANONICAL_CHECKSUM_CTE` with, and their parameters.
+    `FilterComponentGame` holds `game_ids` and every game sharing a checksum
+    alias component with one of them.
+    """
+    names = [f"game_id_{i}" for i in range(len(game_ids))]
+    values = ", ".join(f"(:{name})" for name in names)
+
+    return (
+        f"""
+        , FilterGame (game_id) AS (VALUES {values}),
+        FilterComponent (component_id) AS (
+            SELECT COALESCE(ccm.leader_id, fg.game_id)
+            FROM FilterGame fg
+            LEFT JOIN ChecksumComponentMapping ccm
+                ON ccm.game_id = fg.game_id
+        ),
+        FilterComponentGame (game_id) AS (
+            SELECT component_id FROM FilterComponent
+            UNION
+            SELECT ccm.game_id
+            FROM ChecksumComponentMapping ccm
+            JOIN FilterComponent fc ON fc.component_id = ccm.leader_id
+        )
+        """,
+        dict(zip(names, game_ids)),
+    )
+
+
+# Words of a game name search, matched as prefixes by `game_name_search`
+_SEARCH_WORD = re.compile(r"\w+")
+
+# Largest difference in seconds between `overall_time` and the sum of
+# sessions that is still treated as floating point noise rather than drift
+_OVERALL_TIME_DRIFT_TOLERANCE = 0.001
+
+# Tables and columns written by data exports, in export order
+EXPORT_TABLES: Dict[str, Tuple[str, ...]] = {
+    "game_dict": ("game_id", "name"),
+    "play_time": ("date_time", "duration", "game_id", "migrated"),
+    "game_file_checksum": (
+        "game_id",
+        "checksum",
+        "algorithm",
+        "chunk_size",
+        "created_at",
+        "updated_at",
+    ),
+    "game_association": ("parent_game_id", "child_game_id", "created_at"),
+    "game_tracking_status": ("game_id", "status", "updated_at"),
+}
+
+# Rows kept in `change_log`; clients with an older generation get everything
+CHANGE_LOG_LIMIT = 10_000
+
+# SQL expressions mapping `pt.date_time` to the first day of its bucket.
+# Weeks end on the `:week_end_modifier` weekday (e.g. 'weekday 0' for Sunday).
+_PERIOD_BUCKET_EXPRESSIONS = {
+    "week": "DATE(pt.date_time, :week_end_modifier, '-6 days')",
+    "month": "STRFTIME('%Y-%m-01', pt.date_time)",
+    "year": "STRFTIME('%Y-01-01', pt.date_time)",
+}
+
+
 def _row_to_game_time_dto(cursor, row) -> GameTimeDto:
     """Maps row to GameTimeDto: (game_id, game_name, time, checksum)"""
     game_id, game_name, time, checksum = row
@@ -111,10 +331,16 @@ def _row_to_playtime_information(cursor, row) -> PlaytimeInformation:
     )
 
 
-def _row_to_daily_game_time_dto(cursor, row) -> DailyGameTimeDto:
-    """Maps row to DailyGameTimeDto: (date, game_id, game_name, time, sessions, checksum)"""
-    date, game_id, game_name, time, sessions, checksum = row
-    return DailyGameTimeDto(date, game_id, game_name, time, sessions, checksum)
+def _row_to_period_game_time_dto(cursor, row) -> PeriodGameTimeDto:
+    """Maps row to PeriodGameTimeDto: (period_start, game_id, game_name, time, sessions)"""
+    period_start, game_id, game_name, time, sessions = row
+    return PeriodGameTimeDto(period_start, game_id, game_name, time, sessions)
+
+
+def _row_to_overall_time_drift(cursor, row) -> OverallTimeDrift:
+    """Maps row to OverallTimeDrift: (game_id, stored_time, actual_time)"""
+    game_id, stored_time, actual_time = row
+    return OverallTimeDrift(game_id, stored_time, actual_time)
 
 
 def _row_to_game_session_tuple(cursor, row) -> Tuple[str, SessionInformation]:
@@ -123,6 +349,19 @@ def _row_to_game_session_tuple(cursor, row) -> Tuple[str, SessionInformation]:
     return (game_id, SessionInformation(date, duration, migrated, checksum))
 
 
+def _row_to_canonical_game_session_tuple(
+    cursor, row
+) -> Tuple[int, str, str, float, Optional[SessionInformation]]:
+    """Maps row to (sort_key, game_id, game_name, total_time, SessionInformation | None): (sort_key, game_id, game_name, total_time, date, duration, migrated, checksum)"""
+    sort_key, game_id, game_name, total_time, date, duration, migrated, checksum = row
+    session = (
+        SessionInformation(date, duration, migrated, checksum)
+        if date is not None
+        else None
+    )
+    return (sort_key, game_id, game_name, total_time, session)
+
+
 def _row_to_game_info_dto(cursor, row) -> GameInformationDto:
     """Maps row to GameInformationDto: (game_id, name, time)"""
     game_id, name, time = row
@@ -183,24 +422,202 @@ def _row_to_games_checksum(cursor, row) -> GamesChecksum:
     )
 
 
-def _row_to_date_game_session_tuple(cursor, row) -> Tuple[str, str, SessionInformation]:
-    """Maps row to (session_date, game_id, SessionInformation): (session_date, game_id, date_time, duration, migrated, checksum)"""
-    session_date, game_id, date_time, duration, migrated, checksum = row
-    return (
-        session_date,
-        game_id,
-        SessionInformation(date_time, duration, migrated, checksum),
-    )
+def _row_to_game_association_state(cursor, row) -> GameAssociationState:
+    """Maps row to GameAssociationState: (game_id, exists, parent_game_id, has_children)"""
+    game_id, exists, parent_game_id, has_children = row
+    return GameAssociationState(game_id, exists == 1, parent_game_id, has_children == 1)
+
+
+def _row_to_associated_game(cursor, row) -> AssociatedGame:
+    """Maps row to AssociatedGame: (role, game_id, game_name)"""
+    role, game_id, game_name = row
+    return AssociatedGame(role, game_id, game_name)
 
 
 class Dao:
-    def __init__(self, db: SqlLiteDb):
+    def __init__(self, db: SqlLiteDb, write_buffer: PlayTimeWriteBuffer | None = None):
         self._db = db
+        self._write_buffer = (
+            write_buffer if write_buffer is not None else PlayTimeWriteBuffer()
+        )
+        self._write_buffer_lock = threading.Lock()
+
+    @property
+    def db(self) -> SqlLiteDb:
+        return self._db
+
+    @contextlib.contextmanager
+    def _transactional(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        The buffered playtime is written first, in a short transaction of its
+        own, so queries always see it.
+        """
+        self._write_pending_play_time()
+
+        with self._db.transactional() as connection:
+            yield connection
+
+    def _write_pending_play_time(self) -> int:
+        """
+        Writes what is in the buffer when called, returning the number of
+        sessions written. Entries are taken out of the buffer under the lock
+        and put back if the write fails. The lock is not held while writing,
+        so a DAO call made inside another open transaction cannot block it.
+        """
+        if len(self._write_buffer) == 0:
+            return 0
+
+        # Queries also run in worker threads, each entry is written only once
+        with self._write_buffer_lock:
+            pending = self._write_buffer.take()
+
+        if len(pending) == 0:
+            return 0
+
+        try:
+            with self._db.transactional() as connection:
+                self._write_buffered_play_time(connection, pending)
+        except Exception:
+            with self._write_buffer_lock:
+                self._write_buffer.put_back(pending)
+            raise
+
+        return len(pending)
+
+    def buffer_play_time(
+        self,
+        start: datetime.datetime,
+        time_s: float,
+        game_id: str,
+        game_name: str,
+    ) -> None:
+        """
+        Like `save_play_time`, but only queues the time. Time for the same
+        session start is summed into one row. The queue is written once it is
+        full, on `flush_play_time` or with the next query of this DAO.
+        """
+        if game_name is None:
+            raise ValueError(f"Cannot save game '{game_id}' with invalid name.")
+
+        with self._write_buffer_lock:
+            self._write_buffer.add(game_id, start.isoformat(), time_s, game_name)
+
+        if self._write_buffer.is_full:
+            self.flush_play_time()
+
+    def flush_play_time(self, only_if_due: bool = False) -> int:
+        """
+        Writes the buffered playtime, returning the number of sessions written.
+        With `only_if_due` nothing happens until the oldest entry has waited
+        `max_delay_seconds`.
+        """
+        if only_if_due and not self._write_buffer.is_due:
+            return 0
+
+        return self._write_pending_play_time()
+
+    def _write_buffered_play_time(
+        self, connection: sqlite3.Connection, pending: PlayTimeWriteBuffer
+    ) -> None:
+        connection.executemany(
+            """
+            INSERT INTO game_dict (game_id, name)
+            VALUES (:game_id, :game_name)
+            ON CONFLICT (game_id) DO UPDATE SET name = :game_name
+            WHERE name != :game_name
+            """,
+            [
+                {"game_id": game_id, "game_name": game_name}
+                for game_id, game_name in pending.names.items()
+            ],
+        )
+
+        deltas: Dict[str, float] = {}
+        new_sessions: List[Tuple[str, float, str, None]] = []
+
+        for (game_id, date_time), duration in pending.sessions.items():
+            deltas[game_id] = deltas.get(game_id, 0) + duration
+
+            # Continue a session already written by an earlier flush
+            updated = connection.execute(
+                """
+                UPDATE play_time SET duration = duration + ?
+                WHERE game_id = ? AND date_time = ? AND migrated IS NULL
+                """,
+                (duration, game_id, date_time),
+            ).rowcount
+            if updated:
+                connection.execute(
+                    """
+                    UPDATE game_last_session SET duration = duration + ?
+                    WHERE game_id = ? AND date_time = ? AND migrated IS NULL
+                    """,
+                    (duration, game_id, date_time),
+                )
+            else:
+                new_sessions.append((date_time, duration, game_id, None))
+
+        connection.executemany(
+            """
+            INSERT INTO play_time(date_time, duration, game_id, migrated)
+            VALUES (?,?,?,?)
+            """,
+            new_sessions,
+        )
+        self._save_last_sessions(connection, new_sessions)
+        connection.executemany(
+            """
+            INSERT INTO overall_time (game_id, duration)
+            VALUES (:game_id, :delta_time_s)
+            ON CONFLICT (game_id)
+                DO UPDATE SET duration = duration + :delta_time_s
+            """,
+            [
+                {"game_id": game_id, "delta_time_s": delta_time}
+                for game_id, delta_time in deltas.items()
+            ],
+        )
+        self._log_changes(connection, [*pending.names, *deltas])
+
+    def fetch_play_time_durations(
+        self, game_id: str, starts: Collection[datetime.datetime]
+    ) -> Dict[str, float]:
+        """
+        Returns the duration stored for the sessions of `game_id` started at
+        `starts`, keyed by their start in ISO format. Buffered time included.
+        """
+        with self._transactional() as connection:
+            return self._fetch_play_time_durations(connection, game_id, starts)
+
+    def _fetch_play_time_durations(
+        self,
+        connection: sqlite3.Connection,
+        game_id: str,
+        starts: Collection[datetime.datetime],
+    ) -> Dict[str, float]:
+        if not starts:
+            return {}
+
+        placeholders = ", ".join("?" for _ in starts)
+
+        return dict(
+            connection.execute(
+                f"""
+                SELECT date_time, SUM(duration)
+                FROM play_time
+                WHERE game_id = ?
+                    AND date_time IN ({placeholders})
+                    AND migrated IS NULL
+                GROUP BY date_time
+                """,
+                [game_id, *(start.isoformat() for start in starts)],
+            ).fetchall()
+        )
 
     def save_game_dict(self, game_id: str, game_name: str) -> None:
         connection: sqlite3.Connection
 
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             self._save_game_dict(connection, game_id, game_name)
 
     def save_play_time(
@@ -210,7 +627,7 @@ class Dao:
         game_id: str,
         source: str | None = None,
     ) -> None:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             self._save_play_time(connection, start, time_s, game_id, source)
 
     def apply_manual_time_for_game(
@@ -221,36 +638,176 @@ class Dao:
         new_overall_time: float,
         source: str,
     ) -> None:
-        with self._db.transactional() as connection:
-            self._save_game_dict(connection, game_id, game_name)
-            current_time = connection.execute(
-                "SELECT sum(duration) FROM play_time WHERE game_id = ?", (game_id,)
-            ).fetchone()[0]
-            delta_time = new_overall_time - (
-                current_time if current_time is not None else 0
+        self.apply_manual_time_for_games(
+            create_at, [(game_id, game_name, new_overall_time)], source
+        )
+
+    def apply_manual_time_for_games(
+        self,
+        create_at: datetime.datetime,
+        corrections: List[Tuple[str, str, float]],
+        source: str,
+    ) -> List[ManualTimeCorrectionResult]:
+        """
+        Sets the overall time of every `(game_id, game_name, new_overall_time)`
+        by recording the difference as a single `source` session. All games
+        are corrected in one transaction; a later entry for the same game sees
+        the total left by an earlier one.
+        """
+        for game_id, game_name, _ in corrections:
+            if game_name is None:
+                raise ValueError(f"Cannot save game '{game_id}' with invalid name.")
+
+        with self._transactional() as connection:
+            return self._apply_manual_time_for_games(
+                connection, create_at, corrections, source
             )
-            if delta_time != 0:
-                self._save_play_time(connection, create_at, delta_time, game_id, source)
 
-    def fetch_per_day_time_report(
+    def _apply_manual_time_for_games(
         self,
-        begin: datetime.datetime,
-        end: datetime.datetime,
-        game_id: str | None = None,
-    ) -> List[DailyGameTimeDto]:
-        with self._db.transactional() as connection:
-            return self._fetch_per_day_time_report(connection, begin, end, game_id)
+        connection: sqlite3.Connection,
+        create_at: datetime.datetime,
+        corrections: List[Tuple[str, str, float]],
+        source: str,
+    ) -> List[ManualTimeCorrectionResult]:
+        if not corrections:
+            return []
+
+        game_ids = list(dict.fromkeys(game_id for game_id, _, _ in corrections))
+        values = ", ".join("(?)" for _ in game_ids)
+
+        current_times: Dict[str, float] = dict(
+            connection.execute(
+                f"""
+                WITH ids(game_id) AS (VALUES {values})
+                SELECT ot.game_id, ot.duration
+                FROM overall_time ot
+                JOIN ids ON ids.game_id = ot.game_id
+                """,
+                game_ids,
+            ).fetchall()
+        )
+
+        results: List[ManualTimeCorrectionResult] = []
+        names: Dict[str, str] = {}
+        deltas: Dict[str, float] = {}
+        sessions: List[Tuple[str, float, str, str]] = []
+        date_time = create_at.isoformat()
+
+        for game_id, game_name, new_overall_time in corrections:
+            previous_time = current_times.get(game_id, 0)
+            delta_time = new_overall_time - previous_time
+
+            names[game_id] = game_name
+            if delta_time != 0:
+                current_times[game_id] = new_overall_time
+                deltas[game_id] = deltas.get(game_id, 0) + delta_time
+                sessions.append((date_time, delta_time, game_id, source))
+
+            results.append(
+                ManualTimeCorrectionResult(
+                    game_id, previous_time, new_overall_time, delta_time
+                )
+            )
+
+        connection.executemany(
+            """
+            INSERT INTO game_dict (game_id, name)
+            VALUES (:game_id, :game_name)
+            ON CONFLICT (game_id) DO UPDATE SET name = :game_name
+            WHERE name != :game_name
+            """,
+            [
+                {"game_id": game_id, "game_name": game_name}
+                for game_id, game_name in names.items()
+            ],
+        )
+        connection.executemany(
+            """
+            INSERT INTO play_time(date_time, duration, game_id, migrated)
+            VALUES (?,?,?,?)
+            """,
+            sessions,
+        )
+        self._save_last_sessions(connection, sessions)
+        connection.executemany(
+            """
+            INSERT INTO overall_time (game_id, duration)
+            VALUES (:game_id, :delta_time_s)
+            ON CONFLICT (game_id)
+                DO UPDATE SET duration = duration + :delta_time_s
+            """,
+            [
+                {"game_id": game_id, "delta_time_s": delta_time}
+                for game_id, delta_time in deltas.items()
+            ],
+        )
+        self._log_changes(connection, names)
+
+        return results
+
+    def find_overall_time_drift(self) -> List[OverallTimeDrift]:
+        with self._transactional() as connection:
+            return self._find_overall_time_drift(connection)
+
+    def repair_overall_time(self) -> List[OverallTimeDrift]:
+        """
+        Resets every drifted `overall_time` row to the sum of its sessions and
+        returns the rows that were fixed.
+        """
+        with self._transactional() as connection:
+            drift = self._find_overall_time_drift(connection)
+            connection.executemany(
+                """
+                INSERT INTO overall_time (game_id, duration)
+                VALUES (?, ?)
+                ON CONFLICT (game_id)
+                    DO UPDATE SET duration = excluded.duration
+                """,
+                [(d.game_id, d.actual_time) for d in drift],
+            )
+            self._log_changes(connection, [d.game_id for d in drift])
+            return drift
+
+    def _find_overall_time_drift(
+        self, connection: sqlite3.Connection
+    ) -> List[OverallTimeDrift]:
+        connection.row_factory = _row_to_overall_time_drift
+
+        return connection.execute(
+            """
+            WITH SessionTotals AS (
+                SELECT game_id, SUM(duration) AS duration
+                FROM play_time
+                GROUP BY game_id
+            )
+            SELECT st.game_id, ot.duration, st.duration
+            FROM SessionTotals st
+            LEFT JOIN overall_time ot ON ot.game_id = st.game_id
+            WHERE ot.duration IS NULL
+                OR ABS(ot.duration - st.duration) > :tolerance
+            UNION ALL
+            SELECT ot.game_id, ot.duration, 0
+            FROM overall_time ot
+            WHERE ABS(ot.duration) > :tolerance
+                AND NOT EXISTS (
+                    SELECT 1 FROM play_time pt WHERE pt.game_id = ot.game_id
+                )
+            ORDER BY 1
+            """,
+            {"tolerance": _OVERALL_TIME_DRIFT_TOLERANCE},
+        ).fetchall()
 
     def has_data_before(
         self, date: datetime.datetime, game_id: str | None = None
     ) -> bool:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._has_data_before(connection, date, game_id)
 
     def has_data_after(
         self, date: datetime.datetime, game_id: str | None = None
     ) -> bool:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._has_data_after(connection, date, game_id)
 
     def _has_data_before(
@@ -313,13 +870,83 @@ class Dao:
             == 1
         )
 
+    def fetch_data_boundaries(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        game_ids: Collection[str] | None = None,
+    ) -> DataBoundaries:
+        with self._transactional() as connection:
+            return self._fetch_data_boundaries(connection, start, end, game_ids)
+
+    def _fetch_data_boundaries(
+        self,
+        connection: sqlite3.Connection,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        game_ids: Collection[str] | None = None,
+    ) -> DataBoundaries:
+        """
+        Returns the date time of the closest session before `start` and after
+        `end`, optionally limited to `game_ids` and the games sharing a
+        checksum with them. Both probes are answered by `MAX`/`MIN` lookups
+        on the `(game_id, date_time)` index.
+        """
+        if game_ids:
+            filter_cte, filter_params = _component_game_filter(game_ids)
+            connection.row_factory = None
+            game_ids_list = [
+                game_id
+                for (game_id,) in connection.execute(
+                    f"""
+                    WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE} {filter_cte}
+                    SELECT game_id FROM FilterComponentGame
+                    """,
+                    filter_params,
+                )
+            ]
+            placeholders = ", ".join("?" for _ in game_ids_list)
+
+            prev_date, next_date = connection.execute(
+                f"""
+                SELECT
+                    (
+                        SELECT MAX(date_time) FROM play_time
+                        WHERE game_id IN ({placeholders}) AND date_time < ?
+                    ),
+                    (
+                        SELECT MIN(date_time) FROM play_time
+                        WHERE game_id IN ({placeholders}) AND date_time > ?
+                    )
+                """,
+                (
+                    *game_ids_list,
+                    start.isoformat(),
+                    *game_ids_list,
+                    end.isoformat(),
+                ),
+            ).fetchone()
+
+            return DataBoundaries(prev_date, next_date)
+
+        prev_date, next_date = connection.execute(
+            """
+            SELECT
+                (SELECT MAX(date_time) FROM play_time WHERE date_time < ?),
+                (SELECT MIN(date_time) FROM play_time WHERE date_time > ?)
+            """,
+            (start.isoformat(), end.isoformat()),
+        ).fetchone()
+
+        return DataBoundaries(prev_date, next_date)
+
     def _save_game_dict(
         self, connection: sqlite3.Connection, game_id: str, game_name: str
     ):
         if game_name is None:
             raise ValueError(f"Cannot save game '{game_id}' with invalid name.")
 
-        connection.execute(
+        cursor = connection.execute(
             """
                 INSERT INTO game_dict (game_id, name)
                 VALUES (:game_id, :game_name)
@@ -328,9 +955,11 @@ class Dao:
                 """,
             {"game_id": game_id, "game_name": game_name},
         )
+        if cursor.rowcount > 0:
+            self._log_changes(connection, [game_id])
 
     def fetch_overall_playtime(self) -> List[GameTimeDto]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._fetch_overall_playtime(connection)
 
     def _save_play_time(
@@ -341,14 +970,36 @@ class Dao:
         game_id: str,
         source: str | None = None,
     ):
+        session = (start.isoformat(), time_s, game_id, source)
         connection.execute(
             """
                 INSERT INTO play_time(date_time, duration, game_id, migrated)
                 VALUES (?,?,?,?)
                 """,
-            (start.isoformat(), time_s, game_id, source),
+            session,
         )
+        self._save_last_sessions(connection, [session])
         self._append_overall_time(connection, game_id, time_s)
+        self._log_changes(connection, [game_id])
+
+    def _save_last_sessions(
+        self,
+        connection: sqlite3.Connection,
+        sessions: Iterable[Tuple[str, float, str, str | None]],
+    ) -> None:
+        """
+        Records `(date_time, duration, game_id, migrated)` sessions just
+        added to play_time as the last session of their game, unless it
+        already has a newer one.
+        """
+        connection.executemany(
+            f"""
+            INSERT INTO game_last_session (date_time, duration, game_id, migrated)
+            VALUES (?,?,?,?)
+            {_LAST_SESSION_UPSERT}
+            """,
+            sessions,
+        )
 
     # TODO: Add `_remove_play_time`
 
@@ -372,7 +1023,8 @@ class Dao:
         connection.row_factory = _row_to_game_time_dto
 
         return connection.execute(
-            """
+            f"""
+            WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE}
             SELECT
                 ot.game_id,
                 gd.name AS game_name,
@@ -382,16 +1034,13 @@ class Dao:
                 overall_time ot
             JOIN 
                 game_dict gd ON ot.game_id = gd.game_id
-            LEFT JOIN (
-                SELECT game_id, MIN(checksum) AS checksum
-                FROM game_file_checksum
-                GROUP BY game_id
-            ) gfc ON ot.game_id = gfc.game_id;
+            LEFT JOIN
+                CanonicalChecksum gfc ON ot.game_id = gfc.game_id;
             """
         ).fetchall()
 
     def fetch_playtime_information(self) -> List[PlaytimeInformation]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._fetch_playtime_information(connection)
 
     def _fetch_playtime_information(
@@ -481,7 +1130,7 @@ class Dao:
         start_time: datetime.datetime,
         end_time: datetime.datetime,
     ) -> List[PlaytimeInformation]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._fetch_playtime_information_for_period(
                 connection, start_time, end_time
             )
@@ -490,26 +1139,28 @@ class Dao:
         self,
         start_time: datetime.datetime,
         end_time: datetime.datetime,
-        game_id: str | None = None,
+        game_ids: Optional[Collection[str]] = None,
     ) -> tuple[
         List[DailyGameTimeDto],
         Dict[str, Dict[str, List[SessionInformation]]],
         Dict[str, SessionInformation],
     ]:
-        with self._db.transactional() as connection:
-            # Fetch daily reports
-            daily_reports = self._fetch_per_day_time_report(
-                connection, start_time, end_time, game_id
+        """
+        Daily reports, their sessions and the last sessions of their games,
+        with games sharing a checksum already merged per day. When
+        `game_ids` is given only their checksum alias components are read.
+        """
+        with self._transactional() as connection:
+            # Fetch daily reports and their sessions
+            daily_reports, sessions_by_day_and_game = (
+                self._fetch_canonical_day_sessions(
+                    connection, start_time, end_time, game_ids
+                )
             )
 
             # Extract game IDs
             game_ids_in_period = {report.game_id for report in daily_reports}
 
-            # Fetch sessions for period
-            sessions_by_day_and_game = self._fetch_sessions_for_period(
-                connection, start_time, end_time, game_id
-            )
-
             # Fetch last sessions
             last_sessions_map = self._fetch_last_sessions_for_games(
                 connection, game_ids_in_period
@@ -517,6 +1168,129 @@ class Dao:
 
             return daily_reports, sessions_by_day_and_game, last_sessions_map
 
+    def _fetch_canonical_day_sessions(
+        self,
+        connection: sqlite3.Connection,
+        begin: datetime.datetime,
+        end: datetime.datetime,
+        game_ids: Optional[Collection[str]] = None,
+    ) -> Tuple[List[DailyGameTimeDto], Dict[str, Dict[str, List[SessionInformation]]]]:
+        """
+        Daily reports and their sessions by day and game, with the games of a
+        checksum alias component merged. A component's entry for a day is its
+        played game with the smallest id. Sessions of merged entries are
+        newest first, those of a single game oldest first; sessions of games
+        only manually corrected that day are left out.
+        """
+        params = {"begin": begin.isoformat(), "end": end.isoformat()}
+        filter_cte = ""
+        game_filter = ""
+
+        if game_ids:
+            filter_cte, filter_params = _component_game_filter(game_ids)
+            params.update(filter_params)
+            game_filter = """
+                AND pt.game_id IN (SELECT game_id FROM FilterComponentGame)
+            """
+
+        connection.row_factory = None
+        report_rows = connection.execute(
+            f"""
+            WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE} {filter_cte},
+            DayCanonicalGame AS (
+                SELECT
+                    STRFTIME('%Y-%m-%d', pt.date_time) AS date,
+                    COALESCE(ccm.leader_id, pt.game_id) AS component_id,
+                    MIN(pt.game_id) AS game_id,
+                    SUM(pt.duration) AS total_time,
+                    COUNT(*) AS sessions,
+                    GROUP_CONCAT(DISTINCT pt.game_id) AS played_game_ids
+                FROM play_time pt
+                LEFT JOIN ChecksumComponentMapping ccm ON ccm.game_id = pt.game_id
+                WHERE pt.date_time BETWEEN :begin AND :end
+                    AND pt.migrated IS NULL
+                    {game_filter}
+                GROUP BY 1, 2
+            )
+            SELECT
+                dcg.date,
+                dcg.game_id,
+                gd.name,
+                dcg.total_time,
+                dcg.sessions,
+                cc.checksum,
+                dcg.played_game_ids
+            FROM DayCanonicalGame dcg
+            LEFT JOIN game_dict gd ON gd.game_id = dcg.game_id
+            LEFT JOIN ComponentChecksum cc ON cc.leader_id = dcg.component_id
+            ORDER BY dcg.date, dcg.game_id;
+            """,
+            params,
+        ).fetchall()
+
+        daily_reports: List[DailyGameTimeDto] = []
+        sessions_by_day_and_game: Dict[str, Dict[str, List[SessionInformation]]] = {}
+        # (date, played game) -> sessions and checksum of its day's entry
+        entries: Dict[Tuple[str, str], Tuple[List[SessionInformation], str | None]] = {}
+        merged_sessions: List[List[SessionInformation]] = []
+        played_game_ids: Set[str] = set()
+
+        for date, game_id, name, time_s, count, checksum, played in report_rows:
+            daily_reports.append(
+                DailyGameTimeDto(date, game_id, name, time_s, count, checksum)
+            )
+            sessions: List[SessionInformation] = []
+            sessions_by_day_and_game.setdefault(date, {})[game_id] = sessions
+
+            played_ids = played.split(",")
+            for played_id in played_ids:
+                entries[(date, played_id)] = (sessions, checksum)
+            if len(played_ids) > 1:
+                merged_sessions.append(sessions)
+            played_game_ids.update(played_ids)
+
+        if not daily_reports:
+            return daily_reports, sessions_by_day_and_game
+
+        session_filter = ""
+        session_params: Dict[str, str] = {
+            "begin": params["begin"],
+            "end": params["end"],
+        }
+        if game_ids:
+            names = [f"game_id_{i}" for i in range(len(played_game_ids))]
+            session_params.update(zip(names, played_game_ids))
+            session_filter = f"AND game_id IN ({', '.join(':' + n for n in names)})"
+
+        session_rows = connection.execute(
+            f"""
+            SELECT
+                STRFTIME('%Y-%m-%d', date_time),
+                game_id,
+                date_time,
+                duration,
+                migrated
+            FROM play_time
+            WHERE date_time BETWEEN :begin AND :end
+                {session_filter}
+            ORDER BY date_time;
+            """,
+            session_params,
+        )
+
+        for date, game_id, date_time, duration, migrated in session_rows:
+            entry = entries.get((date, game_id))
+            if entry is not None:
+                sessions, checksum = entry
+                sessions.append(
+                    SessionInformation(date_time, duration, migrated, checksum)
+                )
+
+        for sessions in merged_sessions:
+            sessions.reverse()
+
+        return daily_reports, sessions_by_day_and_game
+
     def _fetch_playtime_information_for_period(
         self,
         connection: sqlite3.Connection,
@@ -587,101 +1361,146 @@ class Dao:
             },
         ).fetchall()
 
-    def _fetch_per_day_time_report(
+    def iter_session_intervals(
+        self,
+        game_id: str | None = None,
+        batch_size: int = 5000,
+    ) -> Iterator[Tuple[int, float]]:
+        """
+        Yields `(start, duration)` for every tracked session, where `start` is
+        the local wall-clock start time as integer seconds since the epoch.
+        Manual corrections are skipped as they are not real sessions.
+
+        When `game_id` is given only sessions of its canonical game (checksum
+        aliases and association children included) are returned.
+        """
+        game_id_filter = ""
+        params = {}
+
+        if game_id:
+            game_id_filter = """
+                AND COALESCE(cg.canonical_game_id, pt.game_id) = COALESCE(
+                    (SELECT canonical_game_id FROM CanonicalGame WHERE game_id = :game_id),
+                    :game_id
+                )
+            """
+            params["game_id"] = game_id
+
+        with self._transactional() as connection:
+            cursor = connection.execute(
+                f"""
+                WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE}
+                SELECT
+                    CAST(STRFTIME('%s', pt.date_time) AS INTEGER),
+                    pt.duration
+                FROM play_time pt
+                LEFT JOIN CanonicalGame cg ON cg.game_id = pt.game_id
+                WHERE pt.migrated IS NULL
+                    AND pt.duration > 0
+                    {game_id_filter}
+                """,
+                params,
+            )
+            cursor.arraysize = batch_size
+
+            while rows := cursor.fetchmany():
+                yield from rows
+
+    def fetch_period_time_report(
+        self,
+        begin: datetime.datetime,
+        end: datetime.datetime,
+        granularity: str,
+        game_id: str | None = None,
+        week_starts_on: int = 1,
+    ) -> List[PeriodGameTimeDto]:
+        with self._transactional() as connection:
+            return self._fetch_period_time_report(
+                connection, begin, end, granularity, game_id, week_starts_on
+            )
+
+    def _fetch_period_time_report(
         self,
         connection: sqlite3.Connection,
         begin: datetime.datetime,
         end: datetime.datetime,
+        granularity: str,
         game_id: str | None = None,
-    ) -> List[DailyGameTimeDto]:
-        connection.row_factory = _row_to_daily_game_time_dto
+        week_starts_on: int = 1,
+    ) -> List[PeriodGameTimeDto]:
+        """
+        Sums playtime per `week`, `month` or `year` bucket and canonical game,
+        so checksum aliases and association children are already merged.
 
-        if game_id:
-            return connection.execute(
-                """
-                SELECT
-                    STRFTIME('%Y-%m-%d', pt.date_time) AS date,
-                    pt.game_id,
-                    gd.name AS game_name,
-                    SUM(pt.duration) AS total_time,
-                    COUNT(*) AS sessions,
-                    gfc.checksum
-                FROM
-                    play_time pt
-                    LEFT JOIN game_dict gd ON pt.game_id = gd.game_id
-                    LEFT JOIN game_file_checksum gfc ON gfc.game_id = pt.game_id
-                WHERE
-                    EXISTS (SELECT 1 FROM game_file_checksum WHERE game_id = :game_id)
-                    AND pt.game_id IN (
-                        SELECT DISTINCT gfc_alias.game_id
-                        FROM game_file_checksum gfc_alias
-                        WHERE gfc_alias.checksum IN (
-                            SELECT gfc_base.checksum
-                            FROM game_file_checksum gfc_base
-                            WHERE gfc_base.game_id = :game_id
-                        )
-                    )
-                    AND pt.date_time BETWEEN :begin AND :end
-                    AND pt.migrated IS NULL
-                GROUP BY
-                    date, pt.game_id, gd.name, gfc.checksum
-                UNION ALL
-                SELECT
-                    STRFTIME('%Y-%m-%d', pt.date_time) AS date,
-                    pt.game_id,
-                    gd.name AS game_name,
-                    SUM(pt.duration) AS total_time,
-                    COUNT(*) AS sessions,
-                    NULL AS checksum -- Checksum is guaranteed to be NULL in this case
-                FROM
-                    play_time pt
-                    LEFT JOIN game_dict gd ON pt.game_id = gd.game_id
-                WHERE
-                    NOT EXISTS (SELECT 1 FROM game_file_checksum WHERE game_id = :game_id)
-                    AND pt.game_id = :game_id
-                    AND pt.date_time BETWEEN :begin AND :end
-                    AND pt.migrated IS NULL
-                GROUP BY
-                    date, pt.game_id, gd.name
-                ORDER BY
-                    date, game_name;
-            """,
-                {
-                    "begin": begin.isoformat(),
-                    "end": end.isoformat(),
-                    "game_id": game_id,
-                },
-            ).fetchall()
+        `week_starts_on` uses SQLite weekday numbering (0 = Sunday).
+        """
+        if granularity not in _PERIOD_BUCKET_EXPRESSIONS:
+            raise ValueError(
+                f"Invalid granularity '{granularity}'. Must be one of: "
+                f"{', '.join(_PERIOD_BUCKET_EXPRESSIONS)}"
+            )
 
-        result = connection.execute(
+        game_id_filter = ""
+        params = {
+            "begin": begin.isoformat(),
+            "end": end.isoformat(),
+            "week_end_modifier": f"weekday {(week_starts_on + 6) % 7}",
+        }
+
+        if game_id:
+            game_id_filter = """
+                AND COALESCE(cg.canonical_game_id, pt.game_id) = COALESCE(
+                    (SELECT canonical_game_id FROM CanonicalGame WHERE game_id = :game_id),
+                    :game_id
+                )
             """
+            params["game_id"] = game_id
+
+        connection.row_factory = _row_to_period_game_time_dto
+
+        return connection.execute(
+            f"""
+            WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE}
             SELECT
-                STRFTIME('%Y-%m-%d', pt.date_time) AS date,
-                pt.game_id,
+                {_PERIOD_BUCKET_EXPRESSIONS[granularity]} AS period_start,
+                COALESCE(cg.canonical_game_id, pt.game_id) AS canonical_game_id,
                 gd.name AS game_name,
                 SUM(pt.duration) AS total_time,
-                COUNT(*) AS sessions,
-                gfc.checksum
+                COUNT(*) AS sessions
             FROM play_time pt
-            LEFT JOIN game_dict gd ON pt.game_id = gd.game_id
-            LEFT JOIN game_file_checksum gfc ON gfc.game_id = pt.game_id
+            LEFT JOIN CanonicalGame cg ON cg.game_id = pt.game_id
+            LEFT JOIN game_dict gd
+                ON gd.game_id = COALESCE(cg.canonical_game_id, pt.game_id)
             WHERE pt.date_time BETWEEN :begin AND :end
                 AND pt.migrated IS NULL
+                {game_id_filter}
             GROUP BY
-                STRFTIME('%Y-%m-%d', pt.date_time),
-                pt.game_id,
-                gfc.checksum;
+                period_start, canonical_game_id
+            ORDER BY
+                period_start, total_time DESC;
             """,
-            {"begin": begin.isoformat(), "end": end.isoformat()},
+            params,
         ).fetchall()
-        return result
 
     def fetch_all_game_sessions_report(self) -> List[tuple[str, SessionInformation]]:
-        with self._db.transactional() as connection:
+        return list(self.iter_game_sessions())
+
+    def iter_game_sessions(
+        self, batch_size: int = 1000
+    ) -> Iterator[Tuple[str, SessionInformation]]:
+        """
+        Yields `(game_id, SessionInformation)` for every session, ordered by
+        `(game_id, date_time)`, reading `batch_size` rows at a time.
+
+        The read transaction stays open until the generator is exhausted or
+        closed, so consume it promptly.
+        """
+        with self._transactional() as connection:
             connection.row_factory = _row_to_game_session_tuple
 
-            return connection.execute(
-                """
+            cursor = connection.execute(
+                f"""
+                WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE}
                 SELECT
                     pt.game_id,
                     pt.date_time,
@@ -691,143 +1510,274 @@ class Dao:
                 FROM
                     play_time pt
                 LEFT JOIN
-                    game_file_checksum gfc
+                    CanonicalChecksum gfc
                 ON
                     pt.game_id = gfc.game_id
                 ORDER BY
                     pt.game_id, pt.date_time;
             """
-            ).fetchall()
+            )
+            cursor.arraysize = batch_size
+
+            while rows := cursor.fetchmany():
+                yield from rows
+
+    def iter_canonical_game_sessions(
+        self, batch_size: int = 100
+    ) -> Iterator[Tuple[str, str, float, Optional[SessionInformation]]]:
+        """
+        Yields `(game_id, game_name, total_time, session)` for the sessions of
+        every game reported on its own, i.e. with checksum aliases and
+        association children (see `CanonicalGame`) merged into it. Each
+        game's sessions arrive together. A game without sessions has a single
+        row with `session` None.
+
+        Games come in the order they were first played, sessions ordered by
+        `(game_id, date_time)`, or newest first when association children are
+        merged in. Reads `batch_size` games at a time, each batch in its own
+        short transaction keyed on the last game read, so no transaction is
+        held open while the caller consumes the rows.
+        """
+        after_sort_key = 0
+
+        while rows := self._fetch_canonical_game_sessions(after_sort_key, batch_size):
+            for _, *row in rows:
+                yield tuple(row)
+            after_sort_key = rows[-1][0]
+
+    def _fetch_canonical_game_sessions(
+        self, after_sort_key: int, limit: int
+    ) -> List[Tuple[int, str, str, float, Optional[SessionInformation]]]:
+        with self._transactional() as connection:
+            connection.row_factory = _row_to_canonical_game_session_tuple
+
+            return connection.execute(
+                f"""
+                WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE},
+                CanonicalTotal (game_id, duration, sort_key, merges_children) AS (
+                    SELECT
+                        cg.canonical_game_id,
+                        SUM(ot.duration),
+                        -- First played game of its own alias component, not
+                        -- of a merged child, unless only children were played
+                        COALESCE(
+                            MIN(
+                                CASE WHEN gc.component_id = cgc.component_id
+                                THEN ot.rowid END
+                            ),
+                            MIN(ot.rowid)
+                        ) AS sort_key,
+                        MAX(gc.component_id != cgc.component_id)
+                    FROM CanonicalGame cg
+                    JOIN GameComponent gc ON gc.game_id = cg.game_id
+                    JOIN GameComponent cgc ON cgc.game_id = cg.canonical_game_id
+                    JOIN overall_time ot ON ot.game_id = cg.game_id
+                    GROUP BY cg.canonical_game_id
+                    HAVING sort_key > :after_sort_key
+                    ORDER BY sort_key
+                    LIMIT :limit
+                )
+                SELECT
+                    ct.sort_key,
+                    ct.game_id,
+                    gd.name,
+                    ct.duration,
+                    pt.date_time,
+                    pt.duration,
+                    pt.migrated,
+                    cc.checksum
+                FROM
+                    CanonicalTotal ct
+                JOIN
+                    game_dict gd ON gd.game_id = ct.game_id
+                JOIN
+                    CanonicalGame cg ON cg.canonical_game_id = ct.game_id
+                LEFT JOIN
+                    play_time pt ON pt.game_id = cg.game_id
+                LEFT JOIN
+                    CanonicalChecksum cc ON cc.game_id = pt.game_id
+                ORDER BY
+                    ct.sort_key,
+                    CASE WHEN ct.merges_children THEN NULL ELSE pt.game_id END,
+                    CASE WHEN ct.merges_children THEN pt.date_time END DESC,
+                    pt.date_time;
+                """,
+                {"after_sort_key": after_sort_key, "limit": limit},
+            ).fetchall()
+
+    def iter_export_rows(self, batch_size: int = 5000) -> Iterator[Tuple[str, tuple]]:
+        """
+        Yields `(table, row)` for every row of `EXPORT_TABLES`, table by table,
+        with the row values in `EXPORT_TABLES` column order. All tables are
+        read in one transaction, so the rows form a consistent snapshot.
+
+        Meant to run on a worker thread, so the write buffer is not touched;
+        call `flush_play_time` before exporting.
+        """
+        with self._db.transactional() as connection:
+            for table, columns in EXPORT_TABLES.items():
+                cursor = connection.execute(
+                    f"SELECT {', '.join(columns)} FROM {table} ORDER BY rowid"
+                )
+                cursor.arraysize = batch_size
+
+                while rows := cursor.fetchmany():
+                    for row in rows:
+                        yield table, row
+
+    def import_sessions(
+        self,
+        game_names: Dict[str, str],
+        sessions: List[Tuple[str, float, str, str | None]],
+    ) -> int:
+        """
+        Imports `(date_time, duration, game_id, migrated)` sessions in one
+        transaction, skipping those already stored with the same game, start
+        and duration. Returns the number of sessions inserted.
+
+        Like `iter_export_rows` this bypasses the write buffer so it can run
+        on a worker thread.
+        """
+        with self._db.transactional() as connection:
+            return self._import_sessions(connection, game_names, sessions)
+
+    def _import_sessions(
+        self,
+        connection: sqlite3.Connection,
+        game_names: Dict[str, str],
+        sessions: List[Tuple[str, float, str, str | None]],
+    ) -> int:
+        connection.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS import_game_dict(
+                game_id TEXT PRIMARY KEY, name TEXT
+            )
+            """
+        )
+        connection.execute("DELETE FROM temp.import_game_dict")
+        connection.executemany(
+            "INSERT INTO temp.import_game_dict VALUES (?, ?)", game_names.items()
+        )
+        renamed_game_ids = [
+            game_id
+            for (game_id,) in connection.execute(
+                """
+                SELECT i.game_id
+                FROM temp.import_game_dict i
+                LEFT JOIN game_dict gd ON gd.game_id = i.game_id
+                WHERE gd.name IS NOT i.name
+                """
+            )
+        ]
+        connection.execute(
+            """
+            INSERT INTO game_dict (game_id, name)
+            SELECT game_id, name
+            FROM temp.import_game_dict
+            WHERE true
+            ON CONFLICT (game_id) DO UPDATE SET name = excluded.name
+            WHERE name != excluded.name
+            """
+        )
+
+        self._log_changes(connection, renamed_game_ids)
+
+        if not sessions:
+            return 0
+
+        connection.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS import_play_time(
+                date_time TEXT, duration INT, game_id TEXT, migrated TEXT
+            )
+            """
+        )
+        connection.execute("DELETE FROM temp.import_play_time")
+        connection.executemany(
+            "INSERT INTO temp.import_play_time VALUES (?, ?, ?, ?)", sessions
+        )
+
+        connection.execute(
+            """
+            CREATE TEMP TABLE import_new_play_time AS
+            SELECT DISTINCT i.date_time, i.duration, i.game_id, i.migrated
+            FROM temp.import_play_time i
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM play_time pt
+                WHERE pt.game_id = i.game_id
+                    AND pt.date_time = i.date_time
+                    AND pt.duration = i.duration
+            )
+            """
+        )
+        inserted = connection.execute(
+            """
+            INSERT INTO play_time (date_time, duration, game_id, migrated)
+            SELECT date_time, duration, game_id, migrated
+            FROM temp.import_new_play_time
+            """
+        ).rowcount
+        connection.execute(
+            f"""
+            INSERT INTO game_last_session (date_time, duration, game_id, migrated)
+            SELECT date_time, duration, game_id, migrated
+            FROM temp.import_new_play_time
+            WHERE true
+            {_LAST_SESSION_UPSERT}
+            """
+        )
+        connection.execute(
+            """
+            INSERT INTO overall_time (game_id, duration)
+            SELECT game_id, SUM(duration)
+            FROM temp.import_new_play_time
+            WHERE true
+            GROUP BY game_id
+            ON CONFLICT (game_id)
+                DO UPDATE SET duration = duration + excluded.duration
+            """
+        )
+        self._log_changes(
+            connection,
+            [
+                game_id
+                for (game_id,) in connection.execute(
+                    "SELECT DISTINCT game_id FROM temp.import_new_play_time"
+                )
+            ],
+        )
+        connection.execute("DROP TABLE temp.import_new_play_time")
+
+        return inserted
 
     def fetch_all_last_playtime_session_information(
         self,
     ) -> Dict[str, SessionInformation]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             connection.row_factory = _row_to_game_session_tuple
 
             return dict(
                 connection.execute(
-                    """
+                    f"""
+                WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE}
                 SELECT
                     pt.game_id,
                     pt.date_time,
                     pt.duration,
                     pt.migrated,
                     gfc.checksum
-                FROM (
-                    SELECT
-                        *,
-                        ROW_NUMBER() OVER (PARTITION BY game_id ORDER BY date_time DESC) AS rn
-                    FROM play_time
-                ) pt
-                LEFT JOIN game_file_checksum gfc ON gfc.game_id = pt.game_id
-                WHERE pt.rn = 1;
+                FROM game_last_session pt
+                LEFT JOIN CanonicalChecksum gfc ON gfc.game_id = pt.game_id;
                 """
                 ).fetchall()
             )
 
-    def fetch_sessions_for_period(
-        self,
-        start_time: datetime.datetime,
-        end_time: datetime.datetime,
-        game_id: Optional[str] = None,
-    ) -> Dict[str, Dict[str, List[SessionInformation]]]:
-        with self._db.transactional() as connection:
-            return self._fetch_sessions_for_period(
-                connection,
-                start_time,
-                end_time,
-                game_id,
-            )
-
-    def _fetch_sessions_for_period(
-        self,
-        connection: sqlite3.Connection,
-        start_time: datetime.datetime,
-        end_time: datetime.datetime,
-        game_id: Optional[str] = None,
-    ) -> Dict[str, Dict[str, List[SessionInformation]]]:
-        query = ""
-
-        if game_id is not None:
-            query = """
-            WITH TargetChecksums AS (
-                SELECT DISTINCT checksum
-                FROM game_file_checksum
-                WHERE game_id = :game_id
-            )
-            SELECT
-                strftime('%Y-%m-%d', pt.date_time) as session_date,
-                pt.game_id,
-                pt.date_time,
-                pt.duration,
-                pt.migrated,
-                gfc.checksum
-            FROM
-                play_time pt
-            LEFT JOIN
-                game_file_checksum gfc ON pt.game_id = gfc.game_id
-            WHERE
-                pt.date_time >= :start AND pt.date_time < :end
-                AND (
-                    pt.game_id = :game_id
-                    OR
-                    gfc.checksum IN (SELECT checksum FROM TargetChecksums)
-                )
-            ORDER BY
-                session_date, pt.game_id, pt.date_time;
-            """
-        else:
-            query = """
-            SELECT
-                strftime('%Y-%m-%d', pt.date_time) as session_date,
-                pt.game_id,
-                pt.date_time,
-                pt.duration,
-                pt.migrated,
-                gfc.checksum
-            FROM
-                play_time pt
-            LEFT JOIN
-                game_file_checksum gfc ON pt.game_id = gfc.game_id
-            WHERE
-                pt.date_time >= :start AND pt.date_time < :end
-            ORDER BY
-                session_date, pt.game_id, pt.date_time;
-            """
-
-        params = {
-            "start": start_time.isoformat(),
-            "end": end_time.isoformat(),
-        }
-
-        game_id_filter = ""
-        if game_id is not None:
-            game_id_filter = "AND pt.game_id = :game_id"
-            params["game_id"] = game_id
-
-        query = query.format(game_id_filter=game_id_filter)
-
-        sessions_by_day_and_game: Dict[str, Dict[str, List[SessionInformation]]] = {}
-
-        connection.row_factory = _row_to_date_game_session_tuple
-
-        rows = connection.execute(query, params).fetchall()
-
-        for session_date, game_id_val, session_info in rows:
-            if session_date not in sessions_by_day_and_game:
-                sessions_by_day_and_game[session_date] = {}
-            if game_id_val not in sessions_by_day_and_game[session_date]:
-                sessions_by_day_and_game[session_date][game_id_val] = []
-            sessions_by_day_and_game[session_date][game_id_val].append(session_info)
-
-        return sessions_by_day_and_game
-
     def fetch_last_sessions_for_games(
         self,
         game_ids: Collection[str],
     ) -> Dict[str, SessionInformation]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._fetch_last_sessions_for_games(
                 connection,
                 game_ids,
@@ -839,26 +1789,26 @@ class Dao:
         game_ids: Collection[str],
     ) -> Dict[str, SessionInformation]:
         game_ids_list = list(game_ids)
-        placeholders = ", ".join("?" for _ in game_ids_list)
+
+        if not game_ids_list:
+            return {}
+
+        values = ", ".join("(?)" for _ in game_ids_list)
 
         connection.row_factory = _row_to_game_session_tuple
 
         query = f"""
+            WITH RECURSIVE {_CANONICAL_CHECKSUM_CTE},
+            ids(game_id) AS (VALUES {values})
             SELECT
                 pt.game_id,
                 pt.date_time,
                 pt.duration,
                 pt.migrated,
                 gfc.checksum
-            FROM (
-                SELECT
-                    *,
-                    ROW_NUMBER() OVER (PARTITION BY game_id ORDER BY date_time DESC) AS rn
-                FROM play_time
-                WHERE game_id IN ({placeholders})
-            ) pt
-            LEFT JOIN game_file_checksum gfc ON gfc.game_id = pt.game_id
-            WHERE pt.rn = 1;
+            FROM ids
+            JOIN game_last_session pt ON pt.game_id = ids.game_id
+            LEFT JOIN CanonicalChecksum gfc ON gfc.game_id = pt.game_id;
         """
 
         rows = connection.execute(query, game_ids_list).fetchall()
@@ -866,7 +1816,7 @@ class Dao:
         return dict(rows)
 
     def get_game(self, game_id: str) -> GameInformationDto | None:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_game(connection, game_id)
 
     def _get_game(
@@ -890,27 +1840,109 @@ class Dao:
             (game_id,),
         ).fetchone()
 
-    def get_games_dictionary(self) -> List[GameDictionary]:
-        with self._db.transactional() as connection:
-            return self._get_games_dictionary(connection)
+    def get_games_dictionary(
+        self, game_ids: Collection[str] | None = None
+    ) -> List[GameDictionary]:
+        with self._transactional() as connection:
+            return self._get_games_dictionary(connection, game_ids)
 
     def _get_games_dictionary(
-        self, connection: sqlite3.Connection
+        self, connection: sqlite3.Connection, game_ids: Collection[str] | None = None
     ) -> List[GameDictionary]:
+        """Every game, or only `game_ids` if given."""
         connection.row_factory = _row_to_game_dictionary
 
+        game_ids_list = list(game_ids) if game_ids is not None else []
+        game_filter = (
+            f"WHERE gd.game_id IN ({', '.join('?' for _ in game_ids_list)})"
+            if game_ids is not None
+            else ""
+        )
+
         return connection.execute(
-            """
+            f"""
             SELECT
                 gd.game_id,
                 gd.name
             FROM
-                game_dict gd;
+                game_dict gd
+            {game_filter};
+            """,
+            game_ids_list,
+        ).fetchall()
+
+    def search_games(self, query: str, limit: int) -> List[GameInformationDto]:
+        with self._transactional() as connection:
+            return self._search_games(connection, query, limit)
+
+    def _search_games(
+        self, connection: sqlite3.Connection, query: str, limit: int
+    ) -> List[GameInformationDto]:
+        """
+        Games whose name has a word starting with every word of `query`, best
+        match first. Like the games dictionary, association children are left
+        out and their time is counted for their parent. Without the
+        `game_name_search` index (SQLite built without FTS5) names are matched
+        with LIKE and ordered by name.
+        """
+        words = _SEARCH_WORD.findall(query)
+
+        if not words:
+            return []
+
+        has_search_index = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'game_name_search'"
+        ).fetchone()
+
+        if has_search_index:
+            source = (
+                "game_name_search gns JOIN game_dict gd ON gd.rowid = gns.rowid"
+            )
+            condition = "game_name_search MATCH :match"
+            order = "gns.rank"
+            params = {"match": " ".join(f'"{word}"*' for word in words)}
+        else:
+            source = "game_dict gd"
+            condition = " AND ".join(
+                f"gd.name LIKE :word_{i} ESCAPE '\\'" for i in range(len(words))
+            )
+            order = "gd.name"
+            params = {
+                f"word_{i}": "%" + word.replace("_", "\\_") + "%"
+                for i, word in enumerate(words)
+            }
+
+        connection.row_factory = _row_to_game_info_dto
+
+        return connection.execute(
+            f"""
+            SELECT
+                gd.game_id,
+                gd.name,
+                COALESCE(ot.duration, 0) + COALESCE(
+                    (
+                        SELECT SUM(cot.duration)
+                        FROM game_association ga
+                        JOIN overall_time cot ON cot.game_id = ga.child_game_id
+                        WHERE ga.parent_game_id = gd.game_id
+                    ),
+                    0
+                ) AS time
+            FROM {source}
+            LEFT JOIN overall_time ot ON ot.game_id = gd.game_id
+            WHERE {condition}
+                AND NOT EXISTS (
+                    SELECT 1 FROM game_association ga
+                    WHERE ga.child_game_id = gd.game_id
+                )
+            ORDER BY {order}
+            LIMIT :limit
             """,
+            {**params, "limit": limit},
         ).fetchall()
 
     def get_game_files_checksum(self, game_id: str) -> List[FileChecksum]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_game_files_checksum(connection, game_id)
 
     def _get_game_files_checksum(
@@ -938,6 +1970,57 @@ class Dao:
             (game_id,),
         ).fetchall()
 
+    def get_all_game_files_checksum(
+        self, game_ids: Collection[str] | None = None
+    ) -> Dict[str, List[FileChecksum]]:
+        with self._transactional() as connection:
+            return self._get_all_game_files_checksum(connection, game_ids)
+
+    def _get_all_game_files_checksum(
+        self, connection: sqlite3.Connection, game_ids: Collection[str] | None = None
+    ) -> Dict[str, List[FileChecksum]]:
+        """Checksums of every game, or only of `game_ids` if given."""
+        connection.row_factory = _row_to_file_checksum
+
+        game_ids_list = list(game_ids) if game_ids is not None else []
+        game_filter = (
+            f"WHERE gfc.game_id IN ({', '.join('?' for _ in game_ids_list)})"
+            if game_ids is not None
+            else ""
+        )
+
+        cursor = connection.execute(
+            f"""
+            SELECT
+                gfc.checksum_id,
+                gfc.game_id,
+                gd.name,
+                gfc.checksum,
+                gfc.algorithm,
+                gfc.chunk_size,
+                gfc.created_at,
+                gfc.updated_at
+            FROM
+                game_file_checksum gfc
+            LEFT JOIN game_dict gd ON gd.game_id = gfc.game_id
+            {game_filter}
+            ORDER BY
+                gfc.game_id, gfc.checksum_id
+            """,
+            game_ids_list,
+        )
+
+        checksums_by_game: Dict[str, List[FileChecksum]] = {}
+
+        # Iterate the cursor instead of `fetchall()` so rows are grouped as
+        # they are read, without an intermediate list of every checksum.
+        for file_checksum in cursor:
+            if file_checksum.game_id not in checksums_by_game:
+                checksums_by_game[file_checksum.game_id] = []
+            checksums_by_game[file_checksum.game_id].append(file_checksum)
+
+        return checksums_by_game
+
     def save_game_checksum(
         self,
         game_id: str,
@@ -947,7 +2030,7 @@ class Dao:
         hash_created_at: None | str,
         hash_updated_at: None | str,
     ) -> None:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             self._save_game_checksum(
                 connection,
                 game_id,
@@ -982,12 +2065,13 @@ class Dao:
                 hash_updated_at,
             ),
         )
+        self._log_checksum_changes(connection, [game_id], [hash_checksum])
 
     def save_game_checksum_bulk(
         self,
         checksums_data: List[Tuple[str, str, str, int, Optional[str], Optional[str]]],
     ) -> None:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             self._save_game_checksum_bulk(connection, checksums_data)
 
     def _save_game_checksum_bulk(
@@ -1002,13 +2086,18 @@ class Dao:
             """,
             checksums_data,
         )
+        self._log_checksum_changes(
+            connection,
+            [data[0] for data in checksums_data],
+            [data[1] for data in checksums_data],
+        )
 
     def remove_game_checksum(
         self,
         game_id: str,
         checksum: str,
     ) -> None:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             self._remove_game_checksum(
                 connection,
                 game_id,
@@ -1021,6 +2110,7 @@ class Dao:
         game_id: str,
         checksum: str,
     ):
+        self._log_checksum_changes(connection, [game_id], [checksum])
         connection.execute(
             """
                 DELETE FROM game_file_checksum WHERE game_id = ? AND checksum = ?
@@ -1035,7 +2125,7 @@ class Dao:
         self,
         game_id: str,
     ) -> None:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             self._remove_all_game_checksums(
                 connection,
                 game_id,
@@ -1046,6 +2136,14 @@ class Dao:
         connection: sqlite3.Connection,
         game_id: str,
     ):
+        checksums = [
+            checksum
+            for (checksum,) in connection.execute(
+                "SELECT checksum FROM game_file_checksum WHERE game_id = ?",
+                (game_id,),
+            )
+        ]
+        self._log_checksum_changes(connection, [game_id], checksums)
         connection.execute(
             """
                 DELETE FROM game_file_checksum WHERE game_id = ?
@@ -1056,7 +2154,7 @@ class Dao:
     def get_games_checksum(
         self,
     ) -> List[GamesChecksum]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_games_checksum(
                 connection,
             )
@@ -1089,7 +2187,7 @@ class Dao:
     def remove_all_checksums(
         self,
     ) -> int:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._remove_all_checksums(
                 connection,
             )
@@ -1105,13 +2203,15 @@ class Dao:
                 game_file_checksum;
             """,
         )
+        if cursor.rowcount > 0:
+            self._log_changes(connection, None)
 
         return cursor.rowcount
 
     def link_game_to_game_with_checksum(
         self, child_game_id: str, parent_game_id: str
     ) -> None:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             self._link_game_to_game_with_checksum(
                 connection, child_game_id, parent_game_id
             )
@@ -1122,7 +2222,7 @@ class Dao:
         child_game_id,
         parent_game_id,
     ):
-        return connection.execute(
+        cursor = connection.execute(
             """
                 INSERT INTO game_file_checksum(game_id, checksum, algorithm, chunk_size)
                 SELECT
@@ -1141,10 +2241,21 @@ class Dao:
                 parent_game_id,
             ),
         )
+        checksums = [
+            checksum
+            for (checksum,) in connection.execute(
+                "SELECT checksum FROM game_file_checksum WHERE game_id = ?",
+                (child_game_id,),
+            )
+        ]
+        self._log_checksum_changes(
+            connection, [child_game_id, parent_game_id], checksums
+        )
+        return cursor
 
     def upsert_tracking_status(self, game_id: str, status: str) -> None:
         """Insert or update tracking status for a game."""
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             connection.execute(
                 """
                 INSERT INTO game_tracking_status (game_id, status, updated_at)
@@ -1155,10 +2266,11 @@ class Dao:
                 """,
                 (game_id, status),
             )
+            self._log_changes(connection, [game_id])
 
     def get_tracking_status(self, game_id: str) -> Optional[str]:
         """Get tracking status for a game. Returns None if not set (meaning default)."""
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             result = connection.execute(
                 """
                 SELECT status FROM game_tracking_status WHERE game_id = ?
@@ -1169,17 +2281,19 @@ class Dao:
 
     def delete_tracking_status(self, game_id: str) -> None:
         """Delete tracking status for a game (revert to default)."""
-        with self._db.transactional() as connection:
-            connection.execute(
+        with self._transactional() as connection:
+            cursor = connection.execute(
                 """
                 DELETE FROM game_tracking_status WHERE game_id = ?
                 """,
                 (game_id,),
             )
+            if cursor.rowcount > 0:
+                self._log_changes(connection, [game_id])
 
     def get_all_tracking_configs(self) -> List[Dict[str, str]]:
         """Get all non-default tracking configurations with game names."""
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             rows = connection.execute(
                 """
                 SELECT gts.game_id, gd.name as game_name, gts.status
@@ -1199,7 +2313,7 @@ class Dao:
             ]
 
     def create_game_association(self, parent_game_id: str, child_game_id: str) -> None:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             self._create_game_association(connection, parent_game_id, child_game_id)
 
     def _create_game_association(
@@ -1215,25 +2329,129 @@ class Dao:
             """,
             (parent_game_id, child_game_id),
         )
+        self._log_changes(connection, [parent_game_id, child_game_id])
 
-    def remove_game_association(self, child_game_id: str) -> None:
-        with self._db.transactional() as connection:
-            self._remove_game_association(connection, child_game_id)
+    def create_game_associations(self, pairs: List[Tuple[str, str]]) -> None:
+        with self._transactional() as connection:
+            self._create_game_associations(connection, pairs)
+
+    def _create_game_associations(
+        self,
+        connection: sqlite3.Connection,
+        pairs: List[Tuple[str, str]],
+    ) -> None:
+        connection.executemany(
+            """
+            INSERT INTO game_association (parent_game_id, child_game_id)
+            VALUES (?, ?)
+            """,
+            pairs,
+        )
+        self._log_changes(connection, [game_id for pair in pairs for game_id in pair])
+
+    def remove_game_association(self, child_game_id: str) -> bool:
+        with self._transactional() as connection:
+            return self._remove_game_association(connection, child_game_id)
 
     def _remove_game_association(
         self,
         connection: sqlite3.Connection,
         child_game_id: str,
-    ) -> None:
-        connection.execute(
+    ) -> bool:
+        parent_game_id = self._get_parent_of_child(connection, child_game_id)
+        cursor = connection.execute(
             """
             DELETE FROM game_association WHERE child_game_id = ?
             """,
             (child_game_id,),
         )
+        if cursor.rowcount > 0:
+            self._log_changes(connection, [child_game_id, parent_game_id])
+
+        return cursor.rowcount > 0
+
+    def get_game_association_states(
+        self, game_ids: Collection[str]
+    ) -> Dict[str, GameAssociationState]:
+        with self._transactional() as connection:
+            return self._get_game_association_states(connection, game_ids)
+
+    def _get_game_association_states(
+        self,
+        connection: sqlite3.Connection,
+        game_ids: Collection[str],
+    ) -> Dict[str, GameAssociationState]:
+        game_ids_list = list(dict.fromkeys(game_ids))
+
+        if not game_ids_list:
+            return {}
+
+        values = ", ".join("(?)" for _ in game_ids_list)
+
+        connection.row_factory = _row_to_game_association_state
+
+        # `exists` mirrors `_get_game`: a game only counts as existing once it
+        # has both a name and an overall time entry.
+        rows = connection.execute(
+            f"""
+            WITH ids(game_id) AS (VALUES {values})
+            SELECT
+                ids.game_id,
+                EXISTS(
+                    SELECT 1
+                    FROM game_dict gd
+                    INNER JOIN overall_time ot ON gd.game_id = ot.game_id
+                    WHERE gd.game_id = ids.game_id
+                ),
+                (
+                    SELECT ga.parent_game_id
+                    FROM game_association ga
+                    WHERE ga.child_game_id = ids.game_id
+                ),
+                EXISTS(
+                    SELECT 1 FROM game_association ga
+                    WHERE ga.parent_game_id = ids.game_id
+                )
+            FROM ids
+            """,
+            game_ids_list,
+        ).fetchall()
+
+        return {state.game_id: state for state in rows}
+
+    def get_associated_games(self, game_id: str) -> List[AssociatedGame]:
+        with self._transactional() as connection:
+            return self._get_associated_games(connection, game_id)
+
+    def _get_associated_games(
+        self,
+        connection: sqlite3.Connection,
+        game_id: str,
+    ) -> List[AssociatedGame]:
+        """
+        Returns the parent of `game_id` (role `parent`) when it is a child,
+        or its children (role `child`) by name when it is a parent.
+        """
+        connection.row_factory = _row_to_associated_game
+
+        return connection.execute(
+            """
+            SELECT 'parent', ga.parent_game_id, gd.name
+            FROM game_association ga
+            LEFT JOIN game_dict gd ON gd.game_id = ga.parent_game_id
+            WHERE ga.child_game_id = :game_id
+            UNION ALL
+            SELECT 'child', ga.child_game_id, gd.name
+            FROM game_association ga
+            LEFT JOIN game_dict gd ON gd.game_id = ga.child_game_id
+            WHERE ga.parent_game_id = :game_id
+            ORDER BY 1 DESC, 3, 2
+            """,
+            {"game_id": game_id},
+        ).fetchall()
 
     def get_game_association(self, game_id: str) -> Optional[Dict[str, str]]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_game_association(connection, game_id)
 
     def _get_game_association(
@@ -1255,7 +2473,7 @@ class Dao:
         return None
 
     def is_game_a_child(self, game_id: str) -> bool:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._is_game_a_child(connection, game_id)
 
     def _is_game_a_child(
@@ -1272,7 +2490,7 @@ class Dao:
         return result[0] == 1
 
     def is_game_a_parent(self, game_id: str) -> bool:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._is_game_a_parent(connection, game_id)
 
     def _is_game_a_parent(
@@ -1289,7 +2507,7 @@ class Dao:
         return result[0] == 1
 
     def get_children_of_parent(self, parent_game_id: str) -> List[str]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_children_of_parent(connection, parent_game_id)
 
     def _get_children_of_parent(
@@ -1306,7 +2524,7 @@ class Dao:
         return [row[0] for row in rows]
 
     def get_parent_of_child(self, child_game_id: str) -> Optional[str]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_parent_of_child(connection, child_game_id)
 
     def _get_parent_of_child(
@@ -1323,7 +2541,7 @@ class Dao:
         return row[0] if row else None
 
     def get_all_game_associations(self) -> List[Dict[str, str]]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_all_game_associations(connection)
 
     def _get_all_game_associations(
@@ -1357,7 +2575,7 @@ class Dao:
         ]
 
     def get_associated_game_ids(self, game_id: str) -> List[str]:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_associated_game_ids(connection, game_id)
 
     def _get_associated_game_ids(
@@ -1382,7 +2600,7 @@ class Dao:
         return [game_id]
 
     def get_combined_playtime_for_game(self, game_id: str) -> float:
-        with self._db.transactional() as connection:
+        with self._transactional() as connection:
             return self._get_combined_playtime_for_game(connection, game_id)
 
     def _get_combined_playtime_for_game(
@@ -1403,3 +2621,110 @@ class Dao:
         ).fetchone()
 
         return result[0] if result else 0.0
+
+    def get_generation(self) -> int:
+        """Generation of the latest logged change, 0 before the first one."""
+        with self._transactional() as connection:
+            return self._get_generation(connection)
+
+    def _get_generation(self, connection: sqlite3.Connection) -> int:
+        return connection.execute(
+            "SELECT IFNULL(MAX(generation), 0) FROM change_log"
+        ).fetchone()[0]
+
+    def get_changes_since(self, generation: int) -> Tuple[int, Optional[Set[str]]]:
+        """
+        Returns the current generation and the ids of the games changed after
+        `generation`. The ids are None when those changes are not known: the
+        log was capped past `generation`, a change affected every game, or
+        `generation` was never handed out by this database.
+        """
+        with self._transactional() as connection:
+            oldest, current = connection.execute(
+                "SELECT MIN(generation), IFNULL(MAX(generation), 0) FROM change_log"
+            ).fetchone()
+
+            if (
+                generation < 0
+                or generation > current
+                or (oldest is not None and generation < oldest - 1)
+            ):
+                return current, None
+
+            changed_game_ids: Set[str] = set()
+            for (game_id,) in connection.execute(
+                "SELECT game_id FROM change_log WHERE generation > ?", (generation,)
+            ):
+                if game_id is None:
+                    return current, None
+                changed_game_ids.add(game_id)
+
+            return current, changed_game_ids
+
+    def log_full_change(self, after_generation: int = 0) -> int:
+        """
+        Logs a change of every game and returns its generation, which is above
+        `after_generation` as well. Used when the whole database was replaced
+        and its log may be behind generations already handed out.
+        """
+        with self._transactional() as connection:
+            connection.execute(
+                """
+                INSERT INTO change_log (generation, game_id)
+                SELECT MAX(?, IFNULL(MAX(generation), 0)) + 1, NULL
+                FROM change_log
+                """,
+                (after_generation,),
+            )
+            return self._get_generation(connection)
+
+    def _log_changes(
+        self, connection: sqlite3.Connection, game_ids: Optional[Iterable[str]]
+    ) -> None:
+        """Logs a change of `game_ids`, None meaning every game."""
+        if game_ids is None:
+            rows = [(None,)]
+        else:
+            rows = [(game_id,) for game_id in dict.fromkeys(game_ids) if game_id]
+
+        if not rows:
+            return
+
+        connection.executemany("INSERT INTO change_log (game_id) VALUES (?)", rows)
+        connection.execute(
+            """
+            DELETE FROM change_log
+            WHERE generation <= (SELECT MAX(generation) FROM change_log) - ?
+            """,
+            (CHANGE_LOG_LIMIT,),
+        )
+
+    def _log_checksum_changes(
+        self,
+        connection: sqlite3.Connection,
+        game_ids: List[str],
+        checksums: List[str],
+    ) -> None:
+        """
+        Logs `game_ids` together with every game sharing one of `checksums`,
+        as those are grouped with them in statistics.
+        """
+        checksums = list(dict.fromkeys(checksums))
+        sharing_game_ids: List[str] = []
+
+        if checksums:
+            values = ", ".join("(?)" for _ in checksums)
+            sharing_game_ids = [
+                game_id
+                for (game_id,) in connection.execute(
+                    f"""
+                    WITH checksums(checksum) AS (VALUES {values})
+                    SELECT DISTINCT gfc.game_id
+                    FROM game_file_checksum gfc
+                    JOIN checksums ON checksums.checksum = gfc.checksum
+                    """,
+                    checksums,
+                )
+            ]
+
+        self._log_changes(connection, [*game_ids, *sharing_game_ids])
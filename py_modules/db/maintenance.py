@@ -0,0 +1,84 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from py_modules.db.sqlite_db import SqlLiteDb
+
+
+@dataclass(slots=True)
+class MaintenanceSettings:
+    # How often the databases are looked at
+    interval_seconds: float = 300
+    # Databases written to more recently than this are left alone
+    idle_seconds: float = 60
+    # WAL size that triggers a truncating checkpoint
+    checkpoint_wal_bytes: int = 4 * 1024 * 1024
+    # Rows changed since the last ANALYZE that trigger a full ANALYZE;
+    # below it only the cheap `PRAGMA optimize` runs
+    analyze_after_changes: int = 10_000
+
+
+class DbMaintenance:
+    """
+    Periodically checkpoints the WAL and refreshes planner statistics of
+    every open database, but only once it has not been written to for
+    `idle_seconds`, so the work never competes with a session being saved.
+    """
+
+    __slots__ = ("_databases", "_settings", "_logger", "_task")
+
+    def __init__(
+        self,
+        databases: Callable[[], Iterable[SqlLiteDb]],
+        settings: Optional[MaintenanceSettings] = None,
+        logger=None,
+    ):
+        self._databases = databases
+        self._settings = settings or MaintenanceSettings()
+        self._logger = logger
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._settings.interval_seconds)
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:  # pylint: disable=broad-except
+                if self._logger:
+                    self._logger.exception("[DbMaintenance] Failed: %s", e)
+
+    def run_once(self) -> None:
+        for db in list(self._databases()):
+            self.maintain(db)
+
+    def maintain(self, db: SqlLiteDb) -> bool:
+        """Returns False when the database was skipped as not idle."""
+        settings = self._settings
+
+        if db.seconds_since_last_write < settings.idle_seconds:
+            return False
+
+        if db.wal_size >= settings.checkpoint_wal_bytes:
+            db.checkpoint("TRUNCATE")
+
+        if db.changes_since_analyze >= settings.analyze_after_changes:
+            db.optimize(analyze=True)
+        elif db.changes_since_optimize:
+            db.optimize()
+
+        return True
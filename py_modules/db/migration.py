@@ -1,3 +1,4 @@
+import sqlite3
 from dataclasses import dataclass
 from typing import List
 from py_modules.db.sqlite_db import SqlLiteDb
@@ -7,6 +8,9 @@ from py_modules.db.sqlite_db import SqlLiteDb
 class Migration:
     version: int
     statements: List[str]
+    # Recorded as applied even if a statement fails, e.g. for a feature the
+    # SQLite build lacks; none of its statements is kept then
+    optional: bool = False
 
 
 _migrations = [
@@ -187,6 +191,111 @@ _migrations = [
             """,
         ],
     ),
+    Migration(
+        11,
+        [
+            """
+            CREATE TABLE change_log(
+                generation INTEGER PRIMARY KEY AUTOINCREMENT,
+                game_id TEXT
+            );
+            """,
+        ],
+    ),
+    Migration(
+        12,
+        [
+            """
+            CREATE TABLE game_last_session(
+                game_id TEXT PRIMARY KEY,
+                date_time TEXT NOT NULL,
+                duration INT,
+                migrated TEXT
+            );
+            """,
+            """
+            INSERT INTO game_last_session (game_id, date_time, duration, migrated)
+            SELECT pt.game_id, pt.date_time, pt.duration, pt.migrated
+            FROM (SELECT DISTINCT game_id FROM play_time) g
+            JOIN play_time pt ON pt.rowid = (
+                SELECT rowid
+                FROM play_time
+                WHERE game_id = g.game_id
+                ORDER BY date_time DESC
+                LIMIT 1
+            );
+            """,
+        ],
+    ),
+    Migration(
+        13,
+        [
+            """
+            CREATE INDEX IF NOT EXISTS
+                play_time_date_time_covering_idx
+            ON
+                play_time(date_time, game_id, duration, migrated);
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS
+                play_time_game_id_date_time_covering_idx
+            ON
+                play_time(game_id, date_time, duration, migrated);
+            """,
+            """
+            DROP INDEX IF EXISTS play_time_date_time_idx;
+            """,
+            """
+            DROP INDEX IF EXISTS play_time_game_id_date_time_idx;
+            """,
+            """
+            DROP INDEX IF EXISTS idx_play_time_migrated;
+            """,
+        ],
+    ),
+    Migration(
+        14,
+        [
+            # External content table: the index reads names from game_dict by
+            # rowid, which upserts on game_dict keep stable
+            """
+            CREATE VIRTUAL TABLE game_name_search USING fts5(
+                name,
+                content = 'game_dict',
+                content_rowid = 'rowid',
+                tokenize = 'unicode61 remove_diacritics 2'
+            );
+            """,
+            """
+            INSERT INTO game_name_search (game_name_search) VALUES ('rebuild');
+            """,
+            """
+            CREATE TRIGGER game_name_search_insert AFTER INSERT ON game_dict
+            BEGIN
+                INSERT INTO game_name_search (rowid, name)
+                VALUES (new.rowid, new.name);
+            END;
+            """,
+            """
+            CREATE TRIGGER game_name_search_update AFTER UPDATE OF name ON game_dict
+            BEGIN
+                INSERT INTO game_name_search (game_name_search, rowid, name)
+                VALUES ('delete', old.rowid, old.name);
+                INSERT INTO game_name_search (rowid, name)
+                VALUES (new.rowid, new.name);
+            END;
+            """,
+            """
+            CREATE TRIGGER game_name_search_delete AFTER DELETE ON game_dict
+            BEGIN
+                INSERT INTO game_name_search (game_name_search, rowid, name)
+                VALUES ('delete', old.rowid, old.name);
+            END;
+            """,
+        ],
+        # SQLite builds without FTS5 search game names with LIKE instead
+        optional=True,
+    ),
 ]
 
 
@@ -214,13 +323,27 @@ class DbMigration:
 
         if migration.version > version:
             with self.db.transactional() as connection:
-                for stm in migration.statements:
-                    connection.execute(stm)
+                if migration.optional:
+                    self._apply_optional(connection, migration)
+                else:
+                    for stm in migration.statements:
+                        connection.execute(stm)
 
                 connection.execute(
                     "INSERT INTO migration (id) VALUES (?)", [migration.version]
                 )
 
+    def _apply_optional(self, connection: sqlite3.Connection, migration: Migration):
+        connection.execute("SAVEPOINT optional_migration")
+
+        try:
+            for stm in migration.statements:
+                connection.execute(stm)
+        except sqlite3.OperationalError:
+            connection.execute("ROLLBACK TO optional_migration")
+
+        connection.execute("RELEASE optional_migration")
+
     def migrate(self):
         for migration in _migrations:
             self._migration(migration)
@@ -1,13 +1,27 @@
 import contextlib
+import os
 import sqlite3
-from typing import Generator
+import time
+from typing import Generator, Tuple
+
+
+class _BackupRestarted(Exception):
+    """Raised to abort an incremental backup that keeps being restarted."""
 
 
 class SqlLiteDb:
-    __slots__ = ("_database_path",)
+    __slots__ = (
+        "_database_path",
+        "_last_write_at",
+        "_changes_since_optimize",
+        "_changes_since_analyze",
+    )
 
     def __init__(self, database_path: str):
         self._database_path = database_path
+        self._last_write_at = 0.0
+        self._changes_since_optimize = 0
+        self._changes_since_analyze = 0
 
         self._init_db_settings()
 
@@ -21,6 +35,26 @@ class SqlLiteDb:
         finally:
             conn.close()
 
+    @property
+    def seconds_since_last_write(self) -> float:
+        return time.monotonic() - self._last_write_at
+
+    @property
+    def changes_since_optimize(self) -> int:
+        return self._changes_since_optimize
+
+    @property
+    def changes_since_analyze(self) -> int:
+        return self._changes_since_analyze
+
+    @property
+    def wal_size(self) -> int:
+        """Size of the `-wal` file in bytes, 0 when it does not exist."""
+        try:
+            return os.path.getsize(f"{self._database_path}-wal")
+        except OSError:
+            return 0
+
     @contextlib.contextmanager
     def transactional(self) -> Generator[sqlite3.Connection, None, None]:
         connection = sqlite3.connect(self._database_path, isolation_level=None)
@@ -32,8 +66,93 @@ class SqlLiteDb:
             connection.execute("BEGIN")
             yield connection
             connection.execute("COMMIT")
+
+            if connection.total_changes:
+                self._last_write_at = time.monotonic()
+                self._changes_since_optimize += connection.total_changes
+                self._changes_since_analyze += connection.total_changes
         except Exception:
             connection.execute("ROLLBACK")
             raise
         finally:
             connection.close()
+
+    def checkpoint(self, mode: str = "PASSIVE") -> Tuple[int, int, int]:
+        """
+        Copies WAL content back into the database file. `TRUNCATE` also
+        resets the `-wal` file to zero bytes when no reader is using it.
+
+        Returns `(busy, wal_frames, checkpointed_frames)` as reported by SQLite.
+        """
+        if mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+            raise ValueError(f"Unknown checkpoint mode '{mode}'")
+
+        with contextlib.closing(
+            sqlite3.connect(self._database_path, isolation_level=None)
+        ) as connection:
+            return connection.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+
+    def backup_to(
+        self,
+        target_path: str,
+        pages_per_step: int = 64,
+        sleep_seconds: float = 0.005,
+        max_restarts: int = 3,
+    ) -> None:
+        """
+        Copies the database into `target_path` with the online backup API,
+        `pages_per_step` pages at a time, so writers only wait for one step.
+
+        A write from another connection restarts an incremental backup. After
+        `max_restarts` the rest is copied in a single step instead; in WAL
+        mode that step only holds a read snapshot, which does not block
+        writers either.
+        """
+        restarts = 0
+        last_remaining = None
+
+        def on_progress(status: int, remaining: int, total: int) -> None:
+            nonlocal restarts, last_remaining
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > max_restarts:
+                    raise _BackupRestarted()
+            last_remaining = remaining
+
+        with contextlib.closing(
+            sqlite3.connect(self._database_path)
+        ) as source, contextlib.closing(sqlite3.connect(target_path)) as target:
+            try:
+                source.backup(
+                    target,
+                    pages=pages_per_step,
+                    progress=on_progress,
+                    sleep=sleep_seconds,
+                )
+            except _BackupRestarted:
+                source.backup(target, pages=-1)
+
+    def restore_from(
+        self, source_path: str, pages_per_step: int = 64, sleep_seconds: float = 0.005
+    ) -> None:
+        """Replaces the database content with the one of `source_path`."""
+        with contextlib.closing(
+            sqlite3.connect(source_path)
+        ) as source, contextlib.closing(sqlite3.connect(self._database_path)) as target:
+            source.backup(target, pages=pages_per_step, sleep=sleep_seconds)
+
+        self._last_write_at = time.monotonic()
+
+    def optimize(self, analyze: bool = False) -> None:
+        """
+        Refreshes query planner statistics. `PRAGMA optimize` only analyzes
+        tables it considers stale; `analyze` forces a full `ANALYZE`.
+        """
+        with contextlib.closing(
+            sqlite3.connect(self._database_path, isolation_level=None)
+        ) as connection:
+            connection.execute("ANALYZE" if analyze else "PRAGMA optimize")
+
+        self._changes_since_optimize = 0
+        if analyze:
+            self._changes_since_analyze = 0
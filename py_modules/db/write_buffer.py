@@ -0,0 +1,75 @@
+import time
+from typing import Dict, Tuple
+
+
+class PlayTimeWriteBuffer:
+    """
+    Holds playtime that is not written to the database yet.
+
+    Time added for the same game and session start is summed up, so a long
+    session checkpointed every minute still becomes one `play_time` row.
+    The buffer is owned by a `Dao`, which writes it out in a transaction of
+    its own before its next query. Buffered time only lives in memory until
+    then; the heartbeats it comes from are recorded in the session journal,
+    which recovers what a crash lost from the buffer.
+    """
+
+    __slots__ = (
+        "max_pending",
+        "max_delay_seconds",
+        "names",
+        "sessions",
+        "_first_added_at",
+    )
+
+    def __init__(self, max_pending: int = 100, max_delay_seconds: float = 30):
+        self.max_pending = max_pending
+        self.max_delay_seconds = max_delay_seconds
+        self.names: Dict[str, str] = {}
+        # (game_id, session start in ISO format) -> seconds
+        self.sessions: Dict[Tuple[str, str], float] = {}
+        self._first_added_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def add(self, game_id: str, date_time: str, duration: float, game_name: str):
+        if not self.sessions:
+            self._first_added_at = time.monotonic()
+
+        key = (game_id, date_time)
+        self.sessions[key] = self.sessions.get(key, 0) + duration
+        self.names[game_id] = game_name
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.sessions) >= self.max_pending
+
+    @property
+    def is_due(self) -> bool:
+        return (
+            bool(self.sessions)
+            and time.monotonic() - self._first_added_at >= self.max_delay_seconds
+        )
+
+    def take(self) -> "PlayTimeWriteBuffer":
+        """Moves the pending entries into a new buffer, leaving this one empty."""
+        taken = PlayTimeWriteBuffer(self.max_pending, self.max_delay_seconds)
+        taken.names, self.names = self.names, {}
+        taken.sessions, self.sessions = self.sessions, {}
+        taken._first_added_at = self._first_added_at
+
+        return taken
+
+    def put_back(self, taken: "PlayTimeWriteBuffer") -> None:
+        """Returns entries of `take` that could not be written."""
+        if not taken.sessions:
+            return
+
+        if not self.sessions or taken._first_added_at < self._first_added_at:
+            self._first_added_at = taken._first_added_at
+
+        for key, duration in taken.sessions.items():
+            self.sessions[key] = self.sessions.get(key, 0) + duration
+        # Names added since are newer
+        self.names = {**taken.names, **self.names}
@@ -0,0 +1,71 @@
+"""
+Delta responses for clients that already hold an earlier response.
+
+A client passes the `generation` of the last response it applied as `since`
+and receives only the entries of games changed after it:
+
+    {
+        "generation": 57,
+        "full": false,
+        "upserted": [...],   # entries to add or replace, keyed by game id
+        "removed": ["123"]   # keys of entries to drop
+    }
+
+With `full` set, `upserted` holds every entry and replaces what the client
+has, e.g. when `since` is older than the kept change log.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+
+@dataclass(slots=True)
+class DeltaResponse:
+    generation: int
+    full: bool
+    upserted: List[Dict]
+    removed: List[str]
+
+    def to_dict(self) -> Dict:
+        return {
+            "generation": self.generation,
+            "full": self.full,
+            "upserted": self.upserted,
+            "removed": self.removed,
+        }
+
+
+def build_delta_response(
+    generation: int,
+    changed_game_ids: Optional[Set[str]],
+    entries: Callable[[], List[Dict]],
+    entry_game_ids: Callable[[Dict], List[str]],
+) -> DeltaResponse:
+    """
+    Args:
+        generation: Generation the changes were read at
+        changed_game_ids: Games changed since the client's generation, None
+            when unknown and a full response is needed
+        entries: Builds the full response, only called if anything changed
+        entry_game_ids: Games an entry is built from, its key first
+    """
+    if changed_game_ids is None:
+        return DeltaResponse(generation, True, entries(), [])
+
+    if not changed_game_ids:
+        return DeltaResponse(generation, False, [], [])
+
+    keys: Set[str] = set()
+    upserted: List[Dict] = []
+    # Games merged into a changed entry may have had an entry of their own
+    stale_keys = set(changed_game_ids)
+
+    for entry in entries():
+        game_ids = entry_game_ids(entry)
+        keys.add(game_ids[0])
+
+        if not changed_game_ids.isdisjoint(game_ids):
+            upserted.append(entry)
+            stale_keys.update(game_ids)
+
+    return DeltaResponse(generation, False, upserted, sorted(stale_keys - keys))
@@ -0,0 +1,87 @@
+import math
+from datetime import datetime
+from typing import Optional
+
+
+class ImportGameDTO:
+    __slots__ = ("game_id", "name")
+
+    def __init__(self, **kwargs):
+        self.game_id = kwargs.get("game_id", None)
+        self.name = kwargs.get("name", None)
+
+        self.validate_required_fields()
+
+    def _validate_field(
+        self, field_name: str, field_value: Optional[str], custom_message: str
+    ):
+        if field_value is None or field_value == "":
+            raise ValueError(f'"{field_name}" {custom_message}')
+
+    def validate_required_fields(self):
+        fields = [
+            ("game_id", self.game_id, '"game_id" can not be null'),
+            ("name", self.name, '"name" must be a valid value'),
+        ]
+
+        for field_name, field_value, message in fields:
+            self._validate_field(field_name, field_value, message)
+
+    @classmethod
+    def from_dict(cls, dict_obj):
+        return cls(**dict_obj)
+
+
+class ImportSessionDTO:
+    """
+    A `play_time` row read from an export. Values may come in as CSV strings;
+    they are normalised to the types and formats the database stores.
+    """
+
+    __slots__ = ("date_time", "duration", "game_id", "migrated")
+
+    def __init__(self, **kwargs):
+        self.date_time = kwargs.get("date_time", None)
+        self.duration = kwargs.get("duration", None)
+        self.game_id = kwargs.get("game_id", None)
+        self.migrated = kwargs.get("migrated", None) or None
+
+        self.validate_required_fields()
+
+    def _validate_field(
+        self, field_name: str, field_value: Optional[str], custom_message: str
+    ):
+        if field_value is None or field_value == "":
+            raise ValueError(f'"{field_name}" {custom_message}')
+
+    def validate_required_fields(self):
+        fields = [
+            ("date_time", self.date_time, '"date_time" must be a valid date'),
+            ("duration", self.duration, '"duration" must be a number'),
+            ("game_id", self.game_id, '"game_id" can not be null'),
+        ]
+
+        for field_name, field_value, message in fields:
+            self._validate_field(field_name, field_value, message)
+
+        try:
+            self.date_time = datetime.fromisoformat(str(self.date_time)).isoformat()
+        except ValueError as e:
+            raise ValueError('"date_time" must be a valid date') from e
+
+        try:
+            duration = float(self.duration)
+        except (TypeError, ValueError) as e:
+            raise ValueError('"duration" must be a number') from e
+
+        if not math.isfinite(duration):
+            raise ValueError('"duration" must be a number')
+
+        self.duration = int(duration) if duration.is_integer() else duration
+
+    def to_tuple(self):
+        return (self.date_time, self.duration, self.game_id, self.migrated)
+
+    @classmethod
+    def from_dict(cls, dict_obj):
+        return cls(**dict_obj)
@@ -0,0 +1,52 @@
+from typing import Optional
+
+GRANULARITIES = ("week", "month", "year")
+
+
+class StatisticsForPeriodDTO:
+    __slots__ = ("start_date", "end_date", "granularity", "game_id", "week_starts_on")
+
+    def __init__(self, **kwargs):
+        self.start_date = kwargs.get("start_date", None)
+        self.end_date = kwargs.get("end_date", None)
+        self.granularity = kwargs.get("granularity", None)
+        self.game_id = kwargs.get("game_id", None)
+        self.week_starts_on = kwargs.get("week_starts_on", None)
+
+        if self.week_starts_on is None:
+            self.week_starts_on = 1
+
+        self.validate_required_fields()
+
+    def _validate_field(
+        self, field_name: str, field_value: Optional[str], custom_message: str
+    ):
+        if field_value is None:
+            raise ValueError(f'"{field_name}" {custom_message}')
+
+    def validate_required_fields(self):
+        fields = [
+            ("start_date", self.start_date, '"start_date" must be a valid date'),
+            ("end_date", self.end_date, '"end_date" must be a valid date'),
+            (
+                "granularity",
+                self.granularity,
+                "\"granularity\" must be: 'week', 'month', 'year'",
+            ),
+        ]
+
+        for field_name, field_value, message in fields:
+            self._validate_field(field_name, field_value, message)
+
+        if self.granularity not in GRANULARITIES:
+            raise ValueError("\"granularity\" must be: 'week', 'month', 'year'")
+
+        if self.week_starts_on not in (0, 1):
+            raise ValueError('"week_starts_on" must be 0 (Sunday) or 1 (Monday)')
+
+    def to_dict(self):
+        return self.__dict__
+
+    @classmethod
+    def from_dict(cls, dict_obj):
+        return cls(**dict_obj)
@@ -2,13 +2,14 @@ from typing import Optional
 
 
 class AddTimeDTO:
-    __slots__ = ("started_at", "ended_at", "game_id", "game_name")
+    __slots__ = ("started_at", "ended_at", "game_id", "game_name", "session_id")
 
     def __init__(self, **kwargs):
         self.started_at = kwargs.get("started_at", None)
         self.ended_at = kwargs.get("ended_at", None)
         self.game_id = kwargs.get("game_id", None)
         self.game_name = kwargs.get("game_name", None)
+        self.session_id = kwargs.get("session_id", None)
 
         self.validate_required_fields()
 
@@ -1,5 +1,6 @@
 from py_modules.db.dao import Dao
-from typing import Dict, List, Optional, Set
+from py_modules.delta_sync import DeltaResponse, build_delta_response
+from typing import Collection, Dict, List, Optional, Set
 import dataclasses
 from py_modules.schemas.common import Game
 from py_modules.schemas.response import (
@@ -50,8 +51,11 @@ class Games:
             Game(response.game_id, response.name), total_time=total_time
         )
 
-    def get_dictionary(self) -> List[Dict[str, GameDictionary]]:
-        data = self.dao.get_games_dictionary()
+    def get_dictionary(
+        self, game_ids: Collection[str] | None = None
+    ) -> List[Dict[str, GameDictionary]]:
+        data = self.dao.get_games_dictionary(game_ids)
+        checksums_by_game = self.dao.get_all_game_files_checksum(game_ids)
 
         child_game_ids = self._get_child_game_ids()
 
@@ -61,10 +65,7 @@ class Games:
             if game.id in child_game_ids:
                 continue
 
-            game_files_checksum = self.dao.get_game_files_checksum(game.id)
-
-            # Use generator expression to avoid building intermediate list
-            file_checksums = (
+            file_checksums = [
                 FileChecksum(
                     Game(gfc.game_id, gfc.game_name),
                     gfc.checksum,
@@ -73,17 +74,35 @@ class Games:
                     gfc.created_at,
                     gfc.updated_at,
                 )
-                for gfc in game_files_checksum
-            )
+                for gfc in checksums_by_game.get(game.id, ())
+            ]
 
             result.append(
-                GameDictionary(
-                    Game(game.id, game.name), files=list(file_checksums)
-                ).to_dict()
+                GameDictionary(Game(game.id, game.name), files=file_checksums).to_dict()
             )
 
         return result
 
+    def search(self, query: str, limit: int) -> List[Dict]:
+        if limit < 1:
+            raise ValueError("At least one search result has to be requested")
+
+        return [
+            GamePlaytimeSummary(Game(game.game_id, game.name), game.time).to_dict()
+            for game in self.dao.search_games(query, limit)
+        ]
+
+    def get_dictionary_since(self, generation: int) -> DeltaResponse:
+        """`get_dictionary` limited to games changed after `generation`."""
+        current_generation, changed_game_ids = self.dao.get_changes_since(generation)
+
+        return build_delta_response(
+            current_generation,
+            changed_game_ids,
+            lambda: self.get_dictionary(changed_game_ids),
+            lambda entry: [entry["game"]["id"]],
+        )
+
     def save_game_checksum(
         self,
         game_id: str,
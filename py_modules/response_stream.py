@@ -0,0 +1,67 @@
+"""
+Sends large responses to the frontend in chunks over `decky.emit`, so it can
+render the first part while the rest is still being read.
+
+Every chunk is a `statistics_chunk` event (camelCase, as received):
+    {"streamId": "abc", "index": 0, "items": [...], "done": false}
+
+The stream ends with an event without items and `done` set, carrying an
+`error` message if producing the chunks failed.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+
+from py_modules.utils.camel_case import convert_keys_to_camel_case
+
+STATISTICS_CHUNK_EVENT = "statistics_chunk"
+
+
+class ResponseStream:
+    __slots__ = ("_emit",)
+
+    def __init__(self, emit: Callable[..., Awaitable[None]]):
+        """
+        Args:
+            emit: Coroutine function sending an event, e.g. `decky.emit`
+        """
+        self._emit = emit
+
+    async def send(self, stream_id: str, chunks: Iterable[List[Dict[str, Any]]]) -> int:
+        """
+        Emits every chunk as soon as it is produced and returns the number of
+        chunks sent. The client picks the `stream_id` so it can tell its
+        events apart before this call returns.
+        """
+        index = 0
+
+        try:
+            for chunk in chunks:
+                await self._emit(
+                    STATISTICS_CHUNK_EVENT,
+                    {
+                        "streamId": stream_id,
+                        "index": index,
+                        "items": convert_keys_to_camel_case(chunk),
+                        "done": False,
+                    },
+                )
+                index += 1
+        except Exception as e:
+            await self._emit(
+                STATISTICS_CHUNK_EVENT,
+                {
+                    "streamId": stream_id,
+                    "index": index,
+                    "items": [],
+                    "done": True,
+                    "error": str(e),
+                },
+            )
+            raise
+
+        await self._emit(
+            STATISTICS_CHUNK_EVENT,
+            {"streamId": stream_id, "index": index, "items": [], "done": True},
+        )
+
+        return index
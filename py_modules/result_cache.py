@@ -0,0 +1,60 @@
+"""
+Results of read RPCs, kept for a user's change log generation.
+
+Every stored change moves the generation on, so results are looked up with
+it in their key and never have to be invalidated. Entries of older
+generations are dropped once more than `max_entries` results are kept.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Tuple
+
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class ResultCacheStats:
+    entries: int
+    hits: int
+    misses: int
+
+    def to_dict(self) -> Dict:
+        return {"entries": self.entries, "hits": self.hits, "misses": self.misses}
+
+
+class ResultCache:
+    __slots__ = ("_max_entries", "_results", "_hits", "_misses")
+
+    def __init__(self, max_entries: int = 32):
+        if max_entries < 1:
+            raise ValueError("At least one result has to be kept")
+
+        self._max_entries = max_entries
+        # Ordered from least to most recently used
+        self._results: Dict[Tuple[str, Hashable], Any] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, name: str, key: Hashable, default: Any = None) -> Any:
+        result = self._results.pop((name, key), _MISSING)
+
+        if result is _MISSING:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        self._results[(name, key)] = result
+        return result
+
+    def put(self, name: str, key: Hashable, result: Any) -> None:
+        self._results.pop((name, key), None)
+        self._results[(name, key)] = result
+
+        while len(self._results) > self._max_entries:
+            del self._results[next(iter(self._results))]
+
+    def clear(self) -> None:
+        self._results = {}
+
+    def stats(self) -> ResultCacheStats:
+        return ResultCacheStats(len(self._results), self._hits, self._misses)
@@ -8,6 +8,15 @@ class AddTimeDict(TypedDict):
     ended_at: int
     game_id: str
     game_name: str
+    session_id: Optional[str]
+
+
+class SessionHeartbeatDict(TypedDict):
+    session_id: str
+    started_at: int
+    last_seen_at: Optional[int]
+    game_id: str
+    game_name: str
 
 
 class DailyStatisticsForPeriodDict(TypedDict):
@@ -16,6 +25,14 @@ class DailyStatisticsForPeriodDict(TypedDict):
     game_id: Optional[str]
 
 
+class StatisticsForPeriodDict(TypedDict):
+    start_date: str
+    end_date: str
+    granularity: str
+    game_id: Optional[str]
+    week_starts_on: Optional[int]
+
+
 @dataclass(slots=True)
 class ApplyManualTimeCorrectionList:
     game: Game
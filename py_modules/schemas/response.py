@@ -78,12 +78,75 @@ class PagedDayStatistics:
     data: List[DayStatistics]
     has_prev: bool
     has_next: bool
+    prev_date: str | None = None
+    next_date: str | None = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "data": [d.to_dict() for d in self.data],
             "has_prev": self.has_prev,
             "has_next": self.has_next,
+            "prev_date": self.prev_date,
+            "next_date": self.next_date,
+        }
+
+
+@dataclass(slots=True)
+class GamePeriodTotal(GamePlaytimeSummary):
+    sessions: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "game": {"id": self.game.id, "name": self.game.name},
+            "total_time": self.total_time,
+            "sessions": self.sessions,
+        }
+
+
+@dataclass(slots=True)
+class PeriodStatistics:
+    period_start: str
+    games: List[GamePeriodTotal]
+    total: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "period_start": self.period_start,
+            "games": [g.to_dict() for g in self.games],
+            "total": self.total,
+        }
+
+
+@dataclass(slots=True)
+class PagedPeriodStatistics:
+    granularity: str
+    data: List[PeriodStatistics]
+    has_prev: bool
+    has_next: bool
+    prev_date: str | None = None
+    next_date: str | None = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "granularity": self.granularity,
+            "data": [d.to_dict() for d in self.data],
+            "has_prev": self.has_prev,
+            "has_next": self.has_next,
+            "prev_date": self.prev_date,
+            "next_date": self.next_date,
+        }
+
+
+@dataclass(slots=True)
+class PlaytimeHeatmap:
+    # 7 rows (Monday first) of 24 hourly playtime sums in seconds
+    grid: List[List[float]]
+    total: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "grid": self.grid,
+            "total": self.total,
         }
 
 
@@ -0,0 +1,212 @@
+"""
+Session Journal Module
+
+Keeps a record of sessions that are still running, so the playtime of a
+session survives a crash or power loss before the frontend gets to call
+`add_time`.
+
+The file holds one JSON line per open session with its latest heartbeat.
+Every heartbeat or finished session rewrites it from the sessions kept in
+memory, into a temporary file that replaces the journal, so the file never
+grows past the open sessions and a crash mid-write leaves the previous
+version in place. Once no session is open the file is truncated. Whatever
+is still open when the plugin starts was interrupted and is handed back by
+`recover`; the journal is only emptied by `commit_recovered` once those
+sessions are saved. `saved_until` tells how much of a session was already
+handed over to be saved, by its heartbeats or on recovery when it was in
+fact still running (the plugin was only reloaded), so it is not counted
+twice.
+
+Writes block on disk, so call `heartbeat` and `close` off the event loop.
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+@dataclass(slots=True)
+class JournalSession:
+    session_id: str
+    user_id: str | None
+    game_id: str
+    game_name: str
+    started_at: float
+    last_seen_at: float
+
+
+class SessionJournal:
+    __slots__ = (
+        "_path",
+        "_fsync",
+        "_sessions",
+        "_failed",
+        "_recovered_until",
+        "_lock",
+        "_logger",
+    )
+
+    def __init__(self, path: Path, fsync: bool = True, logger=None):
+        """
+        Args:
+            path: Journal file, created on the first heartbeat
+            fsync: Flush every write to disk, needed to survive power loss
+            logger: Optional logger instance for debugging
+        """
+        self._path = path
+        self._fsync = fsync
+        self._sessions: Dict[str, JournalSession] = {}
+        # Interrupted sessions that failed to save, kept for the next start
+        self._failed: Dict[str, JournalSession] = {}
+        self._recovered_until: Dict[str, float] = {}
+        # Heartbeats are written from worker threads
+        self._lock = threading.Lock()
+        self._logger = logger
+
+    def _write(self) -> None:
+        sessions = {**self._failed, **self._sessions}
+
+        if not sessions:
+            self._truncate()
+            return
+
+        temporary_path = self._path.with_name(self._path.name + ".tmp")
+
+        with open(temporary_path, "w", encoding="utf-8") as journal:
+            for session in sessions.values():
+                journal.write(json.dumps(asdict(session), separators=(",", ":")))
+                journal.write("\n")
+            journal.flush()
+            if self._fsync:
+                os.fsync(journal.fileno())
+
+        os.replace(temporary_path, self._path)
+
+        if self._fsync:
+            directory = os.open(self._path.parent, os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    def heartbeat(
+        self,
+        session_id: str,
+        user_id: Optional[str],
+        game_id: str,
+        game_name: str,
+        started_at: float,
+        last_seen_at: float,
+    ) -> float:
+        """
+        Records that the session ran until `last_seen_at`. Returns the time it
+        was recorded until before, so the caller saves only what was played
+        since; `last_seen_at` itself for an outdated heartbeat.
+        """
+        with self._lock:
+            saved_until = self._saved_until(session_id)
+
+            # Heartbeats written from worker threads may arrive out of order
+            if saved_until is not None and saved_until >= last_seen_at:
+                return last_seen_at
+
+            self._sessions[session_id] = JournalSession(
+                session_id, user_id, game_id, game_name, started_at, last_seen_at
+            )
+            self._failed.pop(session_id, None)
+            self._recovered_until.pop(session_id, None)
+            self._write()
+
+            return started_at if saved_until is None else max(saved_until, started_at)
+
+    def saved_until(self, session_id: str) -> Optional[float]:
+        """
+        Timestamp up to which the playtime of the session was handed over to
+        be saved, by its last heartbeat or on recovery.
+        """
+        with self._lock:
+            return self._saved_until(session_id)
+
+    def _saved_until(self, session_id: str) -> Optional[float]:
+        session = self._sessions.get(session_id)
+
+        if session is not None:
+            return session.last_seen_at
+
+        return self._recovered_until.get(session_id)
+
+    def close(self, session_id: str) -> None:
+        """Marks the session as saved."""
+        with self._lock:
+            self._recovered_until.pop(session_id, None)
+            failed = self._failed.pop(session_id, None)
+
+            if self._sessions.pop(session_id, None) is not None or failed is not None:
+                self._write()
+
+    def recover(self) -> List[JournalSession]:
+        """
+        Returns the sessions that were never closed, leaving the journal as
+        it is until `commit_recovered` is called once they are saved.
+        An unreadable record is skipped.
+        """
+        try:
+            with open(self._path, "r", encoding="utf-8") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return []
+
+        sessions: Dict[str, JournalSession] = {}
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+                sessions[record["session_id"]] = JournalSession(
+                    record["session_id"],
+                    record["user_id"],
+                    record["game_id"],
+                    record["game_name"],
+                    record["started_at"],
+                    record["last_seen_at"],
+                )
+            except (ValueError, KeyError, TypeError):
+                if self._logger:
+                    self._logger.warning(
+                        f"[SessionJournal] Skipping unreadable record: {line!r}"
+                    )
+
+        return list(sessions.values())
+
+    def commit_recovered(
+        self,
+        recovered: List[JournalSession],
+        failed: Iterable[JournalSession] = (),
+    ) -> None:
+        """
+        Empties the journal once the `recovered` sessions are saved. The
+        `failed` ones are kept, so the next start tries them again.
+        """
+        failed_ids = {session.session_id for session in failed}
+
+        with self._lock:
+            for session in recovered:
+                current = self._sessions.get(session.session_id)
+
+                if session.session_id in failed_ids:
+                    if current is None:
+                        self._failed[session.session_id] = session
+                    continue
+
+                self._recovered_until[session.session_id] = session.last_seen_at
+                # Keep the session only if it went on after the recovered part
+                if current is not None and current.last_seen_at <= session.last_seen_at:
+                    del self._sessions[session.session_id]
+
+            self._write()
+
+    def _truncate(self) -> None:
+        with open(self._path, "w", encoding="utf-8"):
+            pass
@@ -0,0 +1,70 @@
+"""
+Request coalescing for RPCs the frontend fires several times at once.
+
+Identical calls made while one is still running wait for it and share its
+result instead of computing it again. The computation keeps running if the
+caller that started it is cancelled, as long as others wait for it.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class CoalescingCounters:
+    name: str
+    calls: int = 0
+    coalesced: int = 0
+
+    def to_dict(self) -> Dict:
+        return {"name": self.name, "calls": self.calls, "coalesced": self.coalesced}
+
+
+class SingleFlight:
+    __slots__ = ("_in_flight", "_counters")
+
+    def __init__(self):
+        self._in_flight: Dict[Tuple[str, Hashable], asyncio.Future] = {}
+        self._counters: Dict[str, CoalescingCounters] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def counters(self) -> List[CoalescingCounters]:
+        return sorted(self._counters.values(), key=lambda c: c.name)
+
+    async def run(
+        self, name: str, key: Hashable, compute: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Awaits `compute()`, or the computation already running for the same
+        `name` and `key`. The result is shared, callers must not modify it.
+        """
+        counters = self._counters.get(name)
+        if counters is None:
+            counters = self._counters[name] = CoalescingCounters(name)
+        counters.calls += 1
+
+        flight_key = (name, key)
+        future = self._in_flight.get(flight_key)
+
+        if future is None:
+            future = asyncio.ensure_future(compute())
+            self._in_flight[flight_key] = future
+            future.add_done_callback(lambda done: self._land(flight_key, done))
+        else:
+            counters.coalesced += 1
+
+        return await asyncio.shield(future)
+
+    def _land(self, flight_key: Tuple[str, Hashable], future: asyncio.Future):
+        if self._in_flight.get(flight_key) is future:
+            del self._in_flight[flight_key]
+
+        # Retrieved here, in case every caller was cancelled meanwhile
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,146 @@
+"""
+Snapshot Manager Module
+
+Keeps point-in-time copies of a user's database in a `backups` directory
+next to it, taken with SQLite's online backup API so tracking can go on
+while a snapshot is written.
+
+Directory Structure:
+    users/76561198012345678/
+    ├── storage.db
+    └── backups/
+        ├── snapshot-20250101-030000.db
+        └── snapshot-20250102-030000.db
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from py_modules.db.dao import Dao
+from py_modules.db.migration import DbMigration
+
+SNAPSHOT_PREFIX = "snapshot-"
+SNAPSHOT_SUFFIX = ".db"
+
+
+@dataclass(slots=True)
+class SnapshotInfo:
+    name: str
+    created_at: str
+    size: int
+
+    def to_dict(self) -> Dict:
+        return {"name": self.name, "created_at": self.created_at, "size": self.size}
+
+
+class SnapshotManager:
+    __slots__ = ("_keep", "_logger")
+
+    def __init__(self, keep: int = 5, logger=None):
+        """
+        Args:
+            keep: Number of snapshots kept, older ones are removed
+            logger: Optional logger instance for debugging
+        """
+        if keep < 1:
+            raise ValueError("At least one snapshot has to be kept")
+
+        self._keep = keep
+        self._logger = logger
+
+    def _log(self, message: str):
+        if self._logger:
+            self._logger.info(f"[SnapshotManager] {message}")
+
+    def list_snapshots(self, backups_dir: Path) -> List[SnapshotInfo]:
+        """Snapshots in `backups_dir`, newest first."""
+        if not backups_dir.exists():
+            return []
+
+        snapshots = []
+        for path in backups_dir.glob(f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}"):
+            stat = path.stat()
+            snapshots.append(
+                SnapshotInfo(
+                    path.name,
+                    datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    stat.st_size,
+                )
+            )
+
+        return sorted(snapshots, key=lambda s: (s.created_at, s.name), reverse=True)
+
+    def latest_snapshot(self, backups_dir: Path) -> Optional[SnapshotInfo]:
+        snapshots = self.list_snapshots(backups_dir)
+        return snapshots[0] if snapshots else None
+
+    def create_snapshot(self, dao: Dao, backups_dir: Path) -> SnapshotInfo:
+        """
+        Writes a snapshot of the DAO's database and removes the snapshots
+        beyond `keep`. Buffered playtime has to be flushed by the caller.
+        """
+        return self._create_snapshot(dao, backups_dir)
+
+    def _create_snapshot(
+        self, dao: Dao, backups_dir: Path, protected: Optional[str] = None
+    ) -> SnapshotInfo:
+        backups_dir.mkdir(parents=True, exist_ok=True)
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        name = f"{SNAPSHOT_PREFIX}{stamp}{SNAPSHOT_SUFFIX}"
+        counter = 1
+        while (backups_dir / name).exists():
+            name = f"{SNAPSHOT_PREFIX}{stamp}-{counter}{SNAPSHOT_SUFFIX}"
+            counter += 1
+
+        path = backups_dir / name
+        partial_path = backups_dir / f"{name}.part"
+
+        try:
+            dao.db.backup_to(str(partial_path))
+            os.replace(partial_path, path)
+        finally:
+            if partial_path.exists():
+                partial_path.unlink()
+
+        self._log(f"Created snapshot {path}")
+        self._rotate(backups_dir, protected)
+
+        return next(s for s in self.list_snapshots(backups_dir) if s.name == name)
+
+    def restore_snapshot(self, dao: Dao, backups_dir: Path, name: str) -> SnapshotInfo:
+        """
+        Replaces the DAO's database with the snapshot `name`. The current
+        state is snapshotted first, so a restore can itself be undone.
+        """
+        snapshot = next(
+            (s for s in self.list_snapshots(backups_dir) if s.name == name), None
+        )
+        if snapshot is None:
+            raise ValueError(f"Snapshot '{name}' does not exist")
+
+        self._create_snapshot(dao, backups_dir, protected=name)
+        generation = dao.get_generation()
+
+        dao.db.restore_from(str(backups_dir / name))
+        # Snapshots taken by an older version need the newer tables
+        DbMigration(dao.db).migrate()
+        # The restored change log is behind generations clients already have
+        dao.log_full_change(after_generation=generation)
+
+        self._log(f"Restored snapshot {name}")
+        return snapshot
+
+    def _rotate(self, backups_dir: Path, protected: Optional[str] = None) -> None:
+        snapshots = [s for s in self.list_snapshots(backups_dir) if s.name != protected]
+        keep = max(self._keep - 1, 1) if protected is not None else self._keep
+
+        for snapshot in snapshots[keep:]:
+            for suffix in ("", "-wal", "-shm"):
+                path = backups_dir / f"{snapshot.name}{suffix}"
+                if path.exists():
+                    path.unlink()
+            self._log(f"Removed old snapshot {snapshot.name}")
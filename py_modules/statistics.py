@@ -1,20 +1,33 @@
 import dataclasses
 from datetime import datetime, date, time, timedelta
-from typing import Dict, List, Any, Optional
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterator, List, Any, Optional
 from py_modules.db.dao import DailyGameTimeDto, Dao, GameTimeDto
+from py_modules.delta_sync import DeltaResponse, build_delta_response
 from py_modules.helpers import format_date
 from py_modules.schemas.common import Game
 from py_modules.schemas.response import (
     DayStatistics,
+    GamePeriodTotal,
     GamePlaytimeDetails,
     SessionInformation,
     PagedDayStatistics,
+    PagedPeriodStatistics,
+    PeriodStatistics,
+    PlaytimeHeatmap,
     GamePlaytimeReport,
 )
 from dataclasses import dataclass
 from py_modules.helpers import start_of_week, end_of_week
 
 
+SECONDS_PER_HOUR = 3600
+HOURS_PER_WEEK = 7 * 24
+# 1970-01-01 was a Thursday, 72 hours after the start of its week (Monday)
+EPOCH_HOUR_OF_WEEK = 3 * 24
+
+
 @dataclass(slots=True)
 class PlayTimeWithHash:
     game_id: str
@@ -243,6 +256,15 @@ class Statistics:
                 parent_to_children[parent_id] = []
             parent_to_children[parent_id].append(child_id)
 
+        # Parents not played on a day are named from the association list.
+        # Like `get_game`, they only count once they have an overall time.
+        parent_states = self.dao.get_game_association_states(parent_to_children)
+        parent_names: Dict[str, str] = {
+            assoc["parent_game_id"]: assoc["parent_game_name"]
+            for assoc in all_associations
+            if parent_states[assoc["parent_game_id"]].exists
+        }
+
         result_days = []
 
         for day in days:
@@ -263,8 +285,8 @@ class Statistics:
                         parent_id not in processed_parents
                         and parent_id not in games_by_id
                     ):
-                        parent_game_info = self.dao.get_game(parent_id)
-                        if parent_game_info:
+                        parent_name = parent_names.get(parent_id)
+                        if parent_name is not None:
                             total_time = 0.0
                             all_sessions: List[SessionInformation] = []
                             last_session = None
@@ -286,7 +308,7 @@ class Statistics:
                                 all_sessions.sort(key=lambda s: s.date, reverse=True)
                                 merged_games.append(
                                     GamePlaytimeDetails(
-                                        game=Game(parent_id, parent_game_info.name),
+                                        game=Game(parent_id, parent_name),
                                         total_time=total_time,
                                         sessions=all_sessions,
                                         last_session=last_session,
@@ -333,93 +355,15 @@ class Statistics:
 
         return result_days
 
-    def combine_games_by_checksum_per_day(
-        self, days: List[DayStatistics]
-    ) -> List[DayStatistics]:
-        """
-        Combines games played on the same day that share the same file checksum.
-        This version is slightly cleaner and adds comments on its assumptions.
-        """
-        result_days = []
-
-        for day in days:
-            # Group games by checksum for the current day
-            checksum_to_games: Dict[Optional[str], List[GamePlaytimeDetails]] = {}
-            for gwt in day.games:
-                # Assumption: The checksum of the first session is representative
-                # for the purpose of grouping. Handle cases with no sessions.
-                checksum = gwt.sessions[0].checksum if gwt.sessions else None
-                if checksum not in checksum_to_games:
-                    checksum_to_games[checksum] = []
-                checksum_to_games[checksum].append(gwt)
-
-            merged_games: List[GamePlaytimeDetails] = []
-            for checksum, game_group in checksum_to_games.items():
-                # If checksum is None or only one game has it, no merging is needed
-                if checksum is None or len(game_group) == 1:
-                    merged_games.extend(game_group)
-                    continue
-
-                # Merge multiple games with the same checksum
-                # Assumption: The game identity (name, id) of the first game in the
-                # group is used for the merged entry.
-                representative_game = game_group[0]
-
-                total_time = sum(g.total_time for g in game_group)
-
-                all_sessions = [s for g in game_group for s in g.sessions]
-                all_sessions.sort(key=lambda s: s.date, reverse=True)
-
-                merged_games.append(
-                    GamePlaytimeDetails(
-                        game=representative_game.game,
-                        total_time=total_time,
-                        sessions=all_sessions,
-                        # Last session is kept from the representative game
-                        last_session=representative_game.last_session,
-                    )
-                )
-
-            # Re-calculate total time for the day after merging
-            total_day_time = sum(gwt.total_time for gwt in merged_games)
-            result_days.append(
-                DayStatistics(date=day.date, games=merged_games, total=total_day_time)
-            )
-
-        return result_days
-
     def _get_statistics_for_period(
         self,
         start_time: datetime,
         end_time: datetime,
         game_ids: Optional[List[str]] = None,
     ):
-        if game_ids and len(game_ids) > 1:
-            daily_reports, sessions_by_day_and_game, last_sessions_map = (
-                self.dao.fetch_statistics_data_batch(start_time, end_time, None)
-            )
-            game_ids_set = set(game_ids)
-            daily_reports = [r for r in daily_reports if r.game_id in game_ids_set]
-            filtered_sessions: Dict[str, Dict[str, List[SessionInformation]]] = {}
-            for date_str, games_dict in sessions_by_day_and_game.items():
-                filtered_sessions[date_str] = {
-                    gid: sessions
-                    for gid, sessions in games_dict.items()
-                    if gid in game_ids_set
-                }
-            sessions_by_day_and_game = filtered_sessions
-            last_sessions_map = {
-                gid: session
-                for gid, session in last_sessions_map.items()
-                if gid in game_ids_set
-            }
-        else:
-            fetch_game_id = game_ids[0] if game_ids else None
-            daily_reports, sessions_by_day_and_game, last_sessions_map = (
-                self.dao.fetch_statistics_data_batch(
-                    start_time, end_time, fetch_game_id
-                )
-            )
+        daily_reports, sessions_by_day_and_game, last_sessions_map = (
+            self.dao.fetch_statistics_data_batch(start_time, end_time, game_ids)
+        )
 
         reports_by_date: Dict[str, List[DailyGameTimeDto]] = {}
 
@@ -457,8 +401,7 @@ class Statistics:
                 DayStatistics(date=date_str, games=day_games, total=total_day_time)
             )
 
-        combined_days = self.combine_games_by_checksum_per_day(result_days)
-        return self._apply_associations_to_daily_statistics(combined_days)
+        return self._apply_associations_to_daily_statistics(result_days)
 
     def daily_statistics_for_period(
         self, start: date, end: date, game_id: Optional[str] = None
@@ -470,48 +413,162 @@ class Statistics:
 
         combined_data = self._get_statistics_for_period(start_time, end_time, game_ids)
 
-        # For has_prev/has_next, check any of the game IDs
-        has_prev = False
-        has_next = False
-        if game_ids:
-            for gid in game_ids:
-                if self.dao.has_data_before(start_time, gid):
-                    has_prev = True
-                if self.dao.has_data_after(end_time, gid):
-                    has_next = True
-                if has_prev and has_next:
-                    break
-        else:
-            has_prev = self.dao.has_data_before(start_time, None)
-            has_next = self.dao.has_data_after(end_time, None)
+        boundaries = self.dao.fetch_data_boundaries(start_time, end_time, game_ids)
 
         return PagedDayStatistics(
             data=combined_data,
-            has_prev=has_prev,
-            has_next=has_next,
+            has_prev=boundaries.prev_date is not None,
+            has_next=boundaries.next_date is not None,
+            prev_date=boundaries.prev_date,
+            next_date=boundaries.next_date,
         )
 
-    def get_last_sessions_from_grouped_sessions(
-        self, sessions_by_checksum: Dict[str, List[SessionInformation]]
-    ) -> Dict[str, SessionInformation]:
+    def iter_daily_statistics_for_period(
+        self, start: date, end: date, game_id: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Gets the last session for each checksum from the grouped sessions.
-        Returns a dictionary mapping checksum to the most recent SessionInformation based on date.
+        Yields the days of `daily_statistics_for_period` one week (Monday to
+        Sunday) at a time, so only one week is held in memory. Paging is left
+        to `daily_statistics_paging`.
         """
-        last_sessions_by_checksum: Dict[str, SessionInformation] = {}
+        game_ids = self._get_game_ids_with_children(game_id)
+        week_start = start
+
+        while week_start <= end:
+            week_end = min(week_start + timedelta(days=6 - week_start.weekday()), end)
+
+            yield [
+                day.to_dict()
+                for day in self._get_statistics_for_period(
+                    datetime.combine(week_start, time.min),
+                    datetime.combine(week_end, time.max),
+                    game_ids,
+                )
+            ]
+
+            week_start = week_end + timedelta(days=1)
+
+    def daily_statistics_paging(
+        self, start: date, end: date, game_id: Optional[str] = None
+    ) -> PagedDayStatistics:
+        """`daily_statistics_for_period` without its days."""
+        boundaries = self.dao.fetch_data_boundaries(
+            datetime.combine(start, time.min),
+            datetime.combine(end, time.max),
+            self._get_game_ids_with_children(game_id),
+        )
+
+        return PagedDayStatistics(
+            data=[],
+            has_prev=boundaries.prev_date is not None,
+            has_next=boundaries.next_date is not None,
+            prev_date=boundaries.prev_date,
+            next_date=boundaries.next_date,
+        )
+
+    def statistics_for_period(
+        self,
+        start: date,
+        end: date,
+        granularity: str,
+        game_id: Optional[str] = None,
+        week_starts_on: int = 1,
+    ) -> PagedPeriodStatistics:
+        """
+        Returns per-game playtime totals for every week, month or year bucket
+        between `start` and `end`. Totals are summed in SQL with checksum
+        aliases and association children already merged into their game.
+        """
+        start_time = datetime.combine(start, time.min)
+        end_time = datetime.combine(end, time.max)
+
+        reports = self.dao.fetch_period_time_report(
+            start_time, end_time, granularity, game_id, week_starts_on
+        )
+
+        reports_by_period: Dict[str, List[GamePeriodTotal]] = {}
+
+        for report in reports:
+            if report.period_start not in reports_by_period:
+                reports_by_period[report.period_start] = []
+            reports_by_period[report.period_start].append(
+                GamePeriodTotal(
+                    game=Game(report.game_id, report.game_name or "[Unknown]"),
+                    total_time=report.time,
+                    sessions=report.sessions,
+                )
+            )
 
-        for checksum, sessions in sessions_by_checksum.items():
-            if sessions:
-                last_session = max(
-                    sessions,
-                    key=lambda s: datetime.fromisoformat(s.date.replace("Z", "+00:00")),
+        result_periods: List[PeriodStatistics] = []
+
+        for period_start in self._generate_period_range(
+            start, end, granularity, week_starts_on
+        ):
+            period_start_str = format_date(period_start)
+            period_games = reports_by_period.get(period_start_str, [])
+
+            result_periods.append(
+                PeriodStatistics(
+                    period_start=period_start_str,
+                    games=period_games,
+                    total=sum(g.total_time for g in period_games),
                 )
-                last_sessions_by_checksum[checksum] = last_session
+            )
+
+        boundaries = self.dao.fetch_data_boundaries(
+            start_time, end_time, self._get_game_ids_with_children(game_id)
+        )
 
-        return last_sessions_by_checksum
+        return PagedPeriodStatistics(
+            granularity=granularity,
+            data=result_periods,
+            has_prev=boundaries.prev_date is not None,
+            has_next=boundaries.next_date is not None,
+            prev_date=boundaries.prev_date,
+            next_date=boundaries.next_date,
+        )
 
-    def get_statistics_for_last_two_weeks(self):
-        now = datetime.now()
+    def playtime_heatmap(self, game_id: Optional[str] = None) -> PlaytimeHeatmap:
+        """
+        Sums session playtime into a 7 x 24 weekday/hour-of-day grid (Monday
+        first). Sessions are split on hour boundaries: one from 10:30 to 12:15
+        adds 30, 60 and 15 minutes to the 10, 11 and 12 o'clock cells.
+
+        Only integer arithmetic on the session start timestamps is used, no
+        datetime objects are created per session.
+        """
+        # Flat grid indexed by hours since Monday 00:00
+        cells = [0.0] * HOURS_PER_WEEK
+        total = 0.0
+
+        for start, duration in self.dao.iter_session_intervals(game_id):
+            total += duration
+
+            hours_since_epoch, seconds_into_hour = divmod(start, SECONDS_PER_HOUR)
+            cell = (hours_since_epoch + EPOCH_HOUR_OF_WEEK) % HOURS_PER_WEEK
+
+            chunk = min(duration, SECONDS_PER_HOUR - seconds_into_hour)
+            cells[cell] += chunk
+            remaining = duration - chunk
+
+            # Sessions lasting whole weeks add the same time to every cell
+            full_weeks, remaining = divmod(remaining, HOURS_PER_WEEK * SECONDS_PER_HOUR)
+            if full_weeks:
+                cells = [c + full_weeks * SECONDS_PER_HOUR for c in cells]
+
+            while remaining > 0:
+                cell = (cell + 1) % HOURS_PER_WEEK
+                chunk = min(remaining, SECONDS_PER_HOUR)
+                cells[cell] += chunk
+                remaining -= chunk
+
+        return PlaytimeHeatmap(
+            grid=[cells[day * 24 : (day + 1) * 24] for day in range(7)],
+            total=total,
+        )
+
+    def get_statistics_for_last_two_weeks(self, now: Optional[datetime] = None):
+        now = now or datetime.now()
 
         start_current_week = start_of_week(now)
         two_weeks_ago_start = start_current_week - timedelta(weeks=1)
@@ -573,131 +630,108 @@ class Statistics:
             )
         return results
 
+    def fetch_playtime_information_since(self, generation: int) -> DeltaResponse:
+        """`fetch_playtime_information` limited to games changed after `generation`."""
+        current_generation, changed_game_ids = self.dao.get_changes_since(generation)
+
+        return build_delta_response(
+            current_generation,
+            changed_game_ids,
+            self.fetch_playtime_information,
+            lambda report: [
+                report["game"]["id"],
+                *(report["aliases_id"].split(",") if report["aliases_id"] else ()),
+            ],
+        )
+
     def per_game_overall_statistic(self) -> List[Dict[str, Any]]:
         """
-        Returns overall statistics per game, grouped by checksum (or game_id if checksum is missing).
-        Filters out games based on tracking status (hidden/ignore are excluded).
-        Applies game associations: child games are merged into parent games.
+        Returns overall statistics per game, with checksum aliases and
+        association children merged into their canonical game (see
+        `CanonicalGame`). Hidden and ignored games are left out.
         """
-        data = self.dao.fetch_overall_playtime()
-        all_sessions = self.dao.fetch_all_game_sessions_report()
-
-        all_associations = self.dao.get_all_game_associations()
-        parent_to_children: Dict[str, List[str]] = {}
-        child_to_parent: Dict[str, str] = {}
-
-        for assoc in all_associations:
-            parent_id = assoc["parent_game_id"]
-            child_id = assoc["child_game_id"]
-            child_to_parent[child_id] = parent_id
-            if parent_id not in parent_to_children:
-                parent_to_children[parent_id] = []
-            parent_to_children[parent_id].append(child_id)
-
-        games_by_key: Dict[str, List[GameTimeDto]] = {}
-
-        for game_stat in data:
-            key = game_stat.checksum or game_stat.game_id
-            if key not in games_by_key:
-                games_by_key[key] = []
-            games_by_key[key].append(game_stat)
-
-        sessions_by_key: Dict[str, List[SessionInformation]] = {}
-
-        for game_id, session in all_sessions:
-            key = session.checksum or game_id
-            if key not in sessions_by_key:
-                sessions_by_key[key] = []
-            sessions_by_key[key].append(
-                SessionInformation(
-                    date=session.date,
-                    duration=session.duration,
-                    migrated=session.migrated,
-                    checksum=session.checksum,
+        return [
+            game
+            for chunk in self.iter_per_game_overall_statistics()
+            for game in chunk
+        ]
+
+    def iter_per_game_overall_statistics(
+        self, chunk_size: int = 25
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields `per_game_overall_statistic` in chunks of up to `chunk_size`
+        games, read in short per-batch transactions so only one batch's
+        sessions are in memory and no read stays open between chunks.
+        """
+        chunk: List[GamePlaytimeDetails] = []
+
+        for game_id, rows in groupby(
+            self.dao.iter_canonical_game_sessions(), key=itemgetter(0)
+        ):
+            game_name = None
+            total_time = 0.0
+            sessions: List[SessionInformation] = []
+
+            for _, game_name, total_time, session in rows:
+                if session is not None:
+                    sessions.append(session)
+
+            chunk.append(
+                GamePlaytimeDetails(
+                    game=Game(game_id, game_name),
+                    total_time=total_time,
+                    sessions=sessions,
+                    last_session=(
+                        max(sessions, key=attrgetter("date")) if sessions else None
+                    ),
                 )
             )
 
-        # Get last session per group
-        last_sessions_by_key = self.get_last_sessions_from_grouped_sessions(
-            sessions_by_key
-        )
+            if len(chunk) >= chunk_size:
+                if visible := self._visible_game_details(chunk):
+                    yield visible
+                chunk = []
 
-        visibility_map = {}
-        if self.tracking_manager:
-            game_ids = [game_stats[0].game_id for game_stats in games_by_key.values()]
-            visibility_map = self.tracking_manager.get_bulk_visibility(game_ids)
-
-        # Build intermediate results by game_id using GamePlaytimeDetails
-        results_by_game_id: Dict[str, GamePlaytimeDetails] = {}
-
-        for key, game_stats in games_by_key.items():
-            game_id = game_stats[0].game_id
-
-            # Filter based on tracking status if tracking_manager is available
-            if self.tracking_manager and not visibility_map.get(game_id, True):
-                continue
-
-            results_by_game_id[game_id] = GamePlaytimeDetails(
-                game=Game(game_id, game_stats[0].game_name),
-                total_time=sum(g.time for g in game_stats),
-                sessions=sessions_by_key.get(key, []),
-                last_session=(
-                    last_sessions_by_key.get(key) or last_sessions_by_key.get(game_id)
-                ),
-            )
+        if chunk and (visible := self._visible_game_details(chunk)):
+            yield visible
 
-        # Apply associations: merge children into parents, remove child games
-        final_results = []
-
-        for game_id, game_details in results_by_game_id.items():
-            # Skip child games (will be merged into parent)
-            if game_id in child_to_parent:
-                continue
-
-            # If this is a parent, merge children's data
-            if game_id in parent_to_children:
-                merged_details = self._merge_game_details(
-                    game_details, parent_to_children[game_id], results_by_game_id
-                )
-                final_results.append(merged_details.to_dict())
-            else:
-                final_results.append(game_details.to_dict())
+    def _visible_game_details(
+        self, games: List[GamePlaytimeDetails]
+    ) -> List[Dict[str, Any]]:
+        if not self.tracking_manager:
+            return [game.to_dict() for game in games]
 
-        return final_results
-
-    def _merge_game_details(
-        self,
-        parent: GamePlaytimeDetails,
-        children_ids: List[str],
-        games_by_id: Dict[str, GamePlaytimeDetails],
-    ) -> GamePlaytimeDetails:
-        total_time = parent.total_time
-        all_sessions = list(parent.sessions)
-        last_session = parent.last_session
-
-        for child_id in children_ids:
-            if child_id in games_by_id:
-                child = games_by_id[child_id]
-                total_time += child.total_time
-                all_sessions.extend(child.sessions)
-
-                if child.last_session:
-                    if not last_session:
-                        last_session = child.last_session
-                    elif child.last_session.date > last_session.date:
-                        last_session = child.last_session
-
-        all_sessions.sort(key=lambda s: s.date, reverse=True)
-
-        return GamePlaytimeDetails(
-            game=parent.game,
-            total_time=total_time,
-            sessions=all_sessions,
-            last_session=last_session,
+        visibility_map = self.tracking_manager.get_bulk_visibility(
+            [game.game.id for game in games]
         )
+        return [
+            game.to_dict() for game in games if visibility_map.get(game.game.id, True)
+        ]
 
     def _generate_date_range(self, start_date, end_date):
         curr_date = start_date
         while curr_date <= end_date:
             yield curr_date
             curr_date += timedelta(days=1)
+
+    def _generate_period_range(
+        self, start_date: date, end_date: date, granularity: str, week_starts_on: int
+    ):
+        if granularity == "week":
+            # `week_starts_on` is 0 for Sunday, `date.weekday()` is 0 for Monday
+            days_since_week_start = (start_date.weekday() - week_starts_on + 1) % 7
+            curr_date = start_date - timedelta(days=days_since_week_start)
+            while curr_date <= end_date:
+                yield curr_date
+                curr_date += timedelta(weeks=1)
+        elif granularity == "month":
+            curr_date = start_date.replace(day=1)
+            while curr_date <= end_date:
+                yield curr_date
+                curr_date = (curr_date + timedelta(days=32)).replace(day=1)
+        else:
+            curr_date = start_date.replace(month=1, day=1)
+            while curr_date <= end_date:
+                yield curr_date
+                curr_date = curr_date.replace(year=curr_date.year + 1)
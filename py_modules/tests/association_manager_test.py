@@ -141,6 +141,70 @@ class TestAssociationManager(AbstractDatabaseTest):
         associations = self.association_manager.get_all_associations()
         self.assertEqual(len(associations), 3)
 
+    # ========== create_associations tests ==========
+
+    def test_create_associations_creates_all_valid_pairs(self):
+        """Test that a batch of valid pairs is created at once."""
+        self._create_game("parent_game", "Parent Game")
+        self._create_game("child_1", "Child 1")
+        self._create_game("child_2", "Child 2")
+
+        result = self.association_manager.create_associations(
+            [("parent_game", "child_1"), ("parent_game", "child_2")]
+        )
+
+        self.assertEqual(result, [None, None])
+        associations = self.association_manager.get_all_associations()
+        self.assertEqual(len(associations), 2)
+
+    def test_create_associations_reports_errors_per_pair(self):
+        """Test that invalid pairs are reported without blocking valid ones."""
+        self._create_game("parent_game", "Parent Game")
+        self._create_game("child_1", "Child 1")
+        self._create_game("child_2", "Child 2")
+
+        result = self.association_manager.create_associations(
+            [
+                ("parent_game", "child_1"),
+                ("parent_game", "nonexistent"),
+                ("child_2", "child_2"),
+                ("child_2", None),
+                ("parent_game", "child_2"),
+            ]
+        )
+
+        self.assertIsNone(result[0])
+        self.assertEqual(result[1].code, "CHILD_NOT_FOUND")
+        self.assertEqual(result[2].code, "SELF_ASSOCIATION")
+        self.assertEqual(result[3].code, "MISSING_PARAMS")
+        self.assertIsNone(result[4])
+
+        associations = self.association_manager.get_all_associations()
+        self.assertEqual(len(associations), 2)
+
+    def test_create_associations_validates_against_earlier_pairs(self):
+        """Test that pairs in the same batch see the ones accepted before them."""
+        self._create_game("game_a", "Game A")
+        self._create_game("game_b", "Game B")
+        self._create_game("game_c", "Game C")
+
+        result = self.association_manager.create_associations(
+            [
+                ("game_a", "game_b"),
+                ("game_c", "game_b"),
+                ("game_b", "game_c"),
+                ("game_c", "game_a"),
+            ]
+        )
+
+        self.assertIsNone(result[0])
+        self.assertEqual(result[1].code, "ALREADY_CHILD")
+        self.assertEqual(result[2].code, "PARENT_IS_CHILD")
+        self.assertEqual(result[3].code, "IS_PARENT")
+
+        associations = self.association_manager.get_all_associations()
+        self.assertEqual(len(associations), 1)
+
     # ========== remove_association tests ==========
 
     def test_remove_association_success(self):
@@ -180,7 +244,28 @@ class TestAssociationManager(AbstractDatabaseTest):
 
         self.assertIsNotNone(result)
         self.assertEqual(result["role"], "parent")
-        self.assertEqual(len(result["children"]), 2)
+        self.assertEqual(
+            result["children"],
+            [
+                {"game_id": "child_1", "game_name": "Child 1"},
+                {"game_id": "child_2", "game_name": "Child 2"},
+            ],
+        )
+
+    def test_get_association_for_parent_game_orders_children_by_name(self):
+        self._create_game("parent_game", "Parent Game")
+        self._create_game("child_1", "Zelda II")
+        self._create_game("child_2", "Celeste")
+
+        self.association_manager.create_association("parent_game", "child_1")
+        self.association_manager.create_association("parent_game", "child_2")
+
+        result = self.association_manager.get_association_for_game("parent_game")
+
+        self.assertEqual(
+            [child["game_name"] for child in result["children"]],
+            ["Celeste", "Zelda II"],
+        )
 
     def test_get_association_for_child_game(self):
         """Test getting association info for a child game."""
@@ -194,6 +279,7 @@ class TestAssociationManager(AbstractDatabaseTest):
         self.assertIsNotNone(result)
         self.assertEqual(result["role"], "child")
         self.assertEqual(result["parent_game_id"], "parent_game")
+        self.assertEqual(result["parent_game_name"], "Parent Game")
 
     def test_get_association_for_unassociated_game(self):
         """Test getting association info for a game with no associations."""
@@ -747,6 +833,38 @@ class TestDailyStatisticsForSpecificGame(AbstractDatabaseTest):
         # Sessions should include child's session
         self.assertEqual(len(parent_result["sessions"]), 1)
 
+    def test_daily_statistics_for_parent_pages_over_children_data(self):
+        """Test that paging flags and dates consider child game sessions."""
+        from py_modules.statistics import Statistics
+        from datetime import date
+
+        self._create_game_with_session_on_date(
+            "parent_game", "Parent Game", datetime(2023, 1, 15, 10, 0), 3600
+        )
+        self._create_game_with_session_on_date(
+            "child_game", "Child Game", datetime(2023, 1, 5, 10, 0), 1800
+        )
+        self._create_game_with_session_on_date(
+            "other_game", "Other Game", datetime(2023, 1, 25, 10, 0), 900
+        )
+
+        self.association_manager.create_association("parent_game", "child_game")
+
+        statistics = Statistics(
+            dao=self.dao,
+            tracking_manager=None,
+            association_manager=self.association_manager,
+        )
+
+        result = statistics.daily_statistics_for_period(
+            date(2023, 1, 15), date(2023, 1, 15), game_id="parent_game"
+        )
+
+        self.assertTrue(result.has_prev)
+        self.assertFalse(result.has_next)
+        self.assertEqual(result.prev_date, "2023-01-05T10:00:00")
+        self.assertIsNone(result.next_date)
+
     def test_daily_statistics_no_filter_excludes_children(self):
         """Test that calling without game_id excludes children and merges into parents."""
         from py_modules.statistics import Statistics
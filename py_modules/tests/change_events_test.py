@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call
+
+from py_modules.change_events import DATA_CHANGED_EVENT, ChangeNotifier
+
+
+class TestChangeNotifier(unittest.IsolatedAsyncioTestCase):
+    async def test_should_publish_unique_game_ids_with_generation(self):
+        emit = AsyncMock()
+        notifier = ChangeNotifier(emit)
+
+        await notifier.publish("add_time", 7, ["101", "102", "101"])
+        await notifier.publish("restore_snapshot", 9)
+
+        emit.assert_has_awaits(
+            [
+                call(
+                    DATA_CHANGED_EVENT,
+                    {"generation": 7, "reason": "add_time", "gameIds": ["101", "102"]},
+                ),
+                call(
+                    DATA_CHANGED_EVENT,
+                    {"generation": 9, "reason": "restore_snapshot", "gameIds": None},
+                ),
+            ]
+        )
+
+    async def test_should_only_log_failed_delivery(self):
+        logger = MagicMock()
+        notifier = ChangeNotifier(
+            AsyncMock(side_effect=ConnectionError("closed")), logger
+        )
+
+        await notifier.publish("add_time", 1, ["101"])
+
+        logger.warning.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
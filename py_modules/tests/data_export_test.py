@@ -0,0 +1,106 @@
+import csv
+import gzip
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from py_modules.data_export import DataExport
+from py_modules.db.dao import Dao
+from py_modules.db.migration import DbMigration
+from py_modules.tests.helpers import AbstractDatabaseTest
+
+
+class TestDataExport(AbstractDatabaseTest):
+    dao: Dao
+
+    def setUp(self) -> None:
+        super().setUp()
+        DbMigration(db=self.database).migrate()
+        self.dao = Dao(db=self.database)
+        self.export_dir = Path(tempfile.mkdtemp())
+
+        self.dao.save_game_dict("101", "Zelda BOTW")
+        self.dao.save_game_dict("102", "Zelda DLC")
+        self.dao.save_play_time(datetime(2024, 1, 1, 10, 0), 3600, "101")
+        self.dao.save_play_time(datetime(2024, 1, 2, 10, 0), 600, "102")
+        self.dao.save_game_checksum("101", "checksum_a", "SHA256", 1024, None, None)
+        self.dao.create_game_association("101", "102")
+        self.dao.upsert_tracking_status("102", "hidden")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.export_dir)
+        super().tearDown()
+
+    def test_should_export_all_tables_as_json_lines(self):
+        path = self.export_dir / "export.jsonl.gz"
+
+        result = DataExport(self.dao).export(path, "jsonl")
+
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+
+        self.assertEqual(
+            result.rows,
+            {
+                "game_dict": 2,
+                "play_time": 2,
+                "game_file_checksum": 1,
+                "game_association": 1,
+                "game_tracking_status": 1,
+            },
+        )
+        self.assertEqual(len(records), 7)
+        self.assertEqual(
+            records[2],
+            {
+                "table": "play_time",
+                "date_time": "2024-01-01T10:00:00",
+                "duration": 3600,
+                "game_id": "101",
+                "migrated": None,
+            },
+        )
+        self.assertEqual(
+            [(r["parent_game_id"], r["child_game_id"]) for r in records[5:6]],
+            [("101", "102")],
+        )
+        self.assertFalse(path.with_name(path.name + ".part").exists())
+
+    def test_should_export_tables_as_csv_sections(self):
+        path = self.export_dir / "export.csv.gz"
+
+        DataExport(self.dao).export(path, "csv")
+
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as file:
+            rows = list(csv.reader(file))
+
+        self.assertEqual(
+            rows[:6],
+            [
+                ["table", "game_id", "name"],
+                ["game_dict", "101", "Zelda BOTW"],
+                ["game_dict", "102", "Zelda DLC"],
+                ["table", "date_time", "duration", "game_id", "migrated"],
+                ["play_time", "2024-01-01T10:00:00", "3600", "101", ""],
+                ["play_time", "2024-01-02T10:00:00", "600", "102", ""],
+            ],
+        )
+        self.assertEqual(
+            [row[:3] for row in rows if row[0] == "game_tracking_status"],
+            [["game_tracking_status", "102", "hidden"]],
+        )
+
+    def test_should_reject_unknown_format(self):
+        path = self.export_dir / "export.xml.gz"
+
+        with self.assertRaises(ValueError):
+            DataExport(self.dao).export(path, "xml")
+
+        self.assertEqual(list(self.export_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from py_modules.data_export import DataExport
+from py_modules.data_import import DataImport
+from py_modules.db.dao import Dao
+from py_modules.db.migration import DbMigration
+from py_modules.db.sqlite_db import SqlLiteDb
+from py_modules.tests.helpers import AbstractDatabaseTest
+
+
+class TestDataImport(AbstractDatabaseTest):
+    dao: Dao
+
+    def setUp(self) -> None:
+        super().setUp()
+        DbMigration(db=self.database).migrate()
+        self.dao = Dao(db=self.database)
+        self.directory = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def _export_from_other_device(self, export_format: str) -> Path:
+        source = Dao(SqlLiteDb(str(self.directory / "source.db")))
+        DbMigration(source.db).migrate()
+        source.save_game_dict("101", "Zelda BOTW")
+        source.save_game_dict("102", "DOOM")
+        source.save_play_time(datetime(2024, 1, 1, 10, 0), 3600, "101")
+        source.save_play_time(datetime(2024, 1, 2, 10, 0), 1800, "101")
+        source.save_play_time(datetime(2024, 1, 2, 12, 0), 600, "102")
+        source.upsert_tracking_status("102", "hidden")
+
+        path = self.directory / f"export.{export_format}.gz"
+        DataExport(source).export(path, export_format)
+        return path
+
+    def _write(self, name: str, content: str) -> Path:
+        path = self.directory / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_should_import_export_and_skip_existing_sessions(self):
+        path = self._export_from_other_device("jsonl")
+        self.dao.save_game_dict("101", "Zelda BOTW")
+        self.dao.save_play_time(datetime(2024, 1, 1, 10, 0), 3600, "101")
+
+        result = DataImport(self.dao, chunk_size=2).import_file(path)
+
+        self.assertEqual(
+            result.to_dict(),
+            {
+                "games": 2,
+                "imported_sessions": 2,
+                "duplicate_sessions": 1,
+                "invalid_rows": 0,
+                "skipped_rows": 1,
+                "errors": [],
+            },
+        )
+        self.assertEqual(self.dao.get_game("101").time, 5400)
+        self.assertEqual(self.dao.get_game("102").time, 600)
+        self.assertEqual(self.dao.find_overall_time_drift(), [])
+
+        again = DataImport(self.dao).import_file(path)
+
+        self.assertEqual((again.imported_sessions, again.duplicate_sessions), (0, 3))
+        self.assertEqual(self.dao.get_game("101").time, 5400)
+
+    def test_should_import_csv_export(self):
+        path = self._export_from_other_device("csv")
+
+        result = DataImport(self.dao).import_file(path)
+
+        self.assertEqual(result.imported_sessions, 3)
+        self.assertEqual(
+            [
+                (s.date, s.duration, s.migrated)
+                for game_id, s in self.dao.iter_game_sessions()
+                if game_id == "101"
+            ],
+            [("2024-01-01T10:00:00", 3600, None), ("2024-01-02T10:00:00", 1800, None)],
+        )
+
+    def test_should_report_invalid_rows(self):
+        path = self._write(
+            "broken.jsonl",
+            '{"table":"game_dict","game_id":"101","name":"Zelda BOTW"}\n'
+            '{"table":"play_time","date_time":"yesterday","duration":60,"game_id":"101"}\n'
+            '{"table":"play_time","date_time":"2024-01-01T10:00:00","duration":"x","game_id":"101"}\n'
+            '{"table":"play_time","date_time":"2024-01-01T10:00:00","duration":60}\n'
+            '{"table":"play_time","date_time":"2024-01-01 11:00:00","duration":"60","game_id":"101"}\n'
+            '{"table":"play_t\n',
+        )
+
+        result = DataImport(self.dao).import_file(path)
+
+        self.assertEqual(result.imported_sessions, 1)
+        self.assertEqual(result.invalid_rows, 4)
+        self.assertEqual(
+            result.errors,
+            [
+                'line 2: "date_time" must be a valid date',
+                'line 3: "duration" must be a number',
+                'line 4: "game_id" "game_id" can not be null',
+                "line 6: row is not valid JSON",
+            ],
+        )
+        self.assertEqual(
+            [(s.date, s.duration) for _, s in self.dao.iter_game_sessions()],
+            [("2024-01-01T11:00:00", 60)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 import sqlite3
+import threading
 from contextlib import closing
 from datetime import datetime
+from unittest.mock import patch
 from py_modules.db.dao import Dao
 from py_modules.db.migration import DbMigration
+from py_modules.db.write_buffer import PlayTimeWriteBuffer
 from py_modules.tests.helpers import AbstractDatabaseTest
 
 
@@ -25,6 +28,56 @@ class TestDao(AbstractDatabaseTest):
         self.assertEqual(result[0], "1001")
         self.assertEqual(result[1], "Zelda BOTW - updated")
 
+    def test_should_search_games_by_name_prefix(self):
+        self.dao.save_game_dict("1001", "The Legend of Zelda: Breath of the Wild")
+        self.dao.save_play_time(datetime(2023, 1, 1, 10, 0), 600, "1001")
+        self.dao.save_game_dict("1002", "Zelda II")
+        self.dao.save_game_dict("1003", "Zelda BOTW (copy)")
+        self.dao.save_play_time(datetime(2023, 1, 2, 10, 0), 300, "1003")
+        self.dao.save_game_dict("2001", "Pokémon Legends: Arceus")
+        self.dao.create_game_association("1001", "1003")
+
+        self.assertEqual(
+            [(g.game_id, g.time) for g in self.dao.search_games("zel", 10)],
+            [("1002", 0), ("1001", 900)],
+        )
+        self.assertEqual(
+            [g.name for g in self.dao.search_games("pokemon LEG", 10)],
+            ["Pokémon Legends: Arceus"],
+        )
+        self.assertEqual(len(self.dao.search_games("zel", 1)), 1)
+        self.assertEqual(self.dao.search_games('" * (', 10), [])
+
+    def test_should_search_games_by_current_name(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1001", "Tears of the Kingdom")
+
+        self.assertEqual(self.dao.search_games("zelda", 10), [])
+        self.assertEqual(
+            [g.game_id for g in self.dao.search_games("tears", 10)], ["1001"]
+        )
+
+    def test_should_search_games_without_search_index(self):
+        with closing(sqlite3.connect(self.database_file)) as connection, connection:
+            for trigger in ("insert", "update", "delete"):
+                connection.execute(f"DROP TRIGGER game_name_search_{trigger}")
+            connection.execute("DROP TABLE game_name_search")
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "Zelda II")
+        self.dao.save_game_dict("1003", "Bad_Zelda")
+        self.dao.save_game_dict("2001", "DOOM")
+
+        self.assertEqual(
+            [g.name for g in self.dao.search_games("zelda", 10)],
+            ["Bad_Zelda", "Zelda BOTW", "Zelda II"],
+        )
+        self.assertEqual(
+            [g.name for g in self.dao.search_games("d_z", 10)], ["Bad_Zelda"]
+        )
+        self.assertEqual(
+            [g.name for g in self.dao.search_games("ZEL ii", 10)], ["Zelda II"]
+        )
+
     def test_should_add_new_interval(self):
         self.dao.save_game_dict("1001", "Zelda BOTW")
         self.dao.save_play_time(datetime(2023, 1, 1, 10, 0), 3600, "1001")
@@ -36,45 +89,6 @@ class TestDao(AbstractDatabaseTest):
         self.assertEqual(result[1], "1001")
         self.assertEqual(result[2], 3600)
 
-    def test_should_calculate_per_day_time_report(self):
-        self.dao.save_game_dict("1001", "Zelda BOTW")
-        self.dao.save_game_dict("1002", "DOOM")
-        self.dao.save_play_time(datetime(2023, 1, 1, 9, 0), 3600, "1001")
-        self.dao.save_play_time(datetime(2023, 1, 1, 11, 0), 1800, "1001")
-        self.dao.save_play_time(datetime(2023, 1, 2, 10, 0), 2000, "1002")
-        result = self.dao.fetch_per_day_time_report(
-            datetime(2023, 1, 1, 0, 0), datetime(2023, 1, 2, 23, 59)
-        )
-        self.assertEqual(len(result), 2)
-
-        self.assertEqual(result[0].date, "2023-01-01")
-        self.assertEqual(result[0].game_id, "1001")
-        self.assertEqual(result[0].game_name, "Zelda BOTW")
-        self.assertEqual(result[0].time, 5400)
-
-        self.assertEqual(result[1].date, "2023-01-02")
-        self.assertEqual(result[1].game_id, "1002")
-        self.assertEqual(result[1].game_name, "DOOM")
-        self.assertEqual(result[1].time, 2000)
-
-    def test_should_calculate_per_day_time_report_with_game_id(self):
-        self.dao.save_game_dict("1001", "Zelda BOTW")
-        self.dao.save_game_dict("1002", "DOOM")
-        self.dao.save_play_time(datetime(2023, 1, 1, 9, 0), 3600, "1001")
-        self.dao.save_play_time(datetime(2023, 1, 1, 11, 0), 1800, "1001")
-        self.dao.save_play_time(datetime(2023, 1, 2, 10, 0), 2000, "1002")
-
-        result = self.dao.fetch_per_day_time_report(
-            datetime(2023, 1, 1, 0, 0), datetime(2023, 1, 2, 23, 59), "1001"
-        )
-
-        self.assertEqual(len(result), 1)
-
-        self.assertEqual(result[0].date, "2023-01-01")
-        self.assertEqual(result[0].game_id, "1001")
-        self.assertEqual(result[0].game_name, "Zelda BOTW")
-        self.assertEqual(result[0].time, 5400)
-
     def test_should_manually_added_playtime_for_tracked_game(self):
         self.dao.save_game_dict("1001", "Zelda BOTW")
         self.dao.save_play_time(datetime(2023, 1, 1, 11, 0), 1800, "1001")
@@ -100,6 +114,61 @@ class TestDao(AbstractDatabaseTest):
 
         self.assertEqual(self._get_overall_time_for_game("1001"), 3600)
 
+    def test_should_fetch_data_boundaries(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "DOOM")
+        self.dao.save_play_time(datetime(2023, 1, 1), 3600, "1001")
+        self.dao.save_play_time(datetime(2023, 1, 20), 3600, "1002")
+        self.dao.save_play_time(datetime(2023, 2, 10), 3600, "1001")
+        self.dao.save_play_time(datetime(2023, 3, 1), 3600, "1002")
+
+        boundaries = self.dao.fetch_data_boundaries(
+            datetime(2023, 2, 1), datetime(2023, 2, 28, 23, 59)
+        )
+
+        self.assertEqual(boundaries.prev_date, "2023-01-20T00:00:00")
+        self.assertEqual(boundaries.next_date, "2023-03-01T00:00:00")
+
+    def test_should_fetch_data_boundaries_for_game_ids(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "DOOM")
+        self.dao.save_game_dict("1003", "Celeste")
+        self.dao.save_play_time(datetime(2023, 1, 1), 3600, "1001")
+        self.dao.save_play_time(datetime(2023, 1, 20), 3600, "1003")
+        self.dao.save_play_time(datetime(2023, 3, 1), 3600, "1002")
+        self.dao.save_play_time(datetime(2023, 3, 5), 3600, "1001")
+
+        boundaries = self.dao.fetch_data_boundaries(
+            datetime(2023, 2, 1), datetime(2023, 2, 28, 23, 59), ["1001", "1002"]
+        )
+
+        self.assertEqual(boundaries.prev_date, "2023-01-01T00:00:00")
+        self.assertEqual(boundaries.next_date, "2023-03-01T00:00:00")
+
+        boundaries = self.dao.fetch_data_boundaries(
+            datetime(2023, 2, 1), datetime(2023, 2, 28, 23, 59), ["1003"]
+        )
+
+        self.assertEqual(boundaries.prev_date, "2023-01-20T00:00:00")
+        self.assertIsNone(boundaries.next_date)
+
+    def test_should_fetch_data_boundaries_of_checksum_aliases(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "Zelda BOTW (copy)")
+        self.dao.save_game_dict("1003", "DOOM")
+        self.dao.save_game_checksum("1001", "checksum_a", "SHA256", 1024, None, None)
+        self.dao.save_game_checksum("1002", "checksum_a", "SHA256", 1024, None, None)
+        self.dao.save_play_time(datetime(2023, 1, 1), 3600, "1002")
+        self.dao.save_play_time(datetime(2023, 1, 20), 3600, "1003")
+        self.dao.save_play_time(datetime(2023, 3, 1), 3600, "1002")
+
+        boundaries = self.dao.fetch_data_boundaries(
+            datetime(2023, 2, 1), datetime(2023, 2, 28, 23, 59), ["1001"]
+        )
+
+        self.assertEqual(boundaries.prev_date, "2023-01-01T00:00:00")
+        self.assertEqual(boundaries.next_date, "2023-03-01T00:00:00")
+
     def test_should_have_date_before(self):
         self.dao.save_game_dict("1001", "Zelda BOTW")
         self.dao.save_play_time(datetime(2023, 1, 1), 3600, "1001")
@@ -318,6 +387,125 @@ class TestDao(AbstractDatabaseTest):
 
         self.assertEqual(len(result), 0)
 
+    def test_should_get_all_game_files_checksum_grouped_by_game(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "DOOM")
+        self.dao.save_game_dict("1003", "Celeste")
+        self.dao.save_game_checksum(
+            "1001", "checksum_a", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_game_checksum(
+            "1002", "checksum_c", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_game_checksum(
+            "1001", "checksum_b", "SHA256", 16 * 1024 * 1024, None, None
+        )
+
+        result = self.dao.get_all_game_files_checksum()
+
+        self.assertEqual(set(result.keys()), {"1001", "1002"})
+        self.assertEqual(
+            [c.checksum for c in result["1001"]], ["checksum_a", "checksum_b"]
+        )
+        self.assertEqual(result["1001"][0].game_name, "Zelda BOTW")
+        self.assertEqual([c.checksum for c in result["1002"]], ["checksum_c"])
+
+    def _save_game_with_two_checksums(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_checksum(
+            "1001", "checksum_b", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_game_checksum(
+            "1001", "checksum_a", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_play_time(datetime(2023, 1, 1, 9, 0), 3600, "1001")
+        self.dao.save_play_time(datetime(2023, 1, 1, 11, 0), 1800, "1001")
+
+    def test_all_game_sessions_report_returns_sessions_once_for_multi_checksum_game(
+        self,
+    ):
+        self._save_game_with_two_checksums()
+
+        result = self.dao.fetch_all_game_sessions_report()
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(
+            [session.checksum for _, session in result], ["checksum_a", "checksum_a"]
+        )
+
+    def test_iter_game_sessions_yields_sessions_in_game_and_date_order(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "DOOM")
+        self.dao.save_play_time(datetime(2023, 1, 3, 9, 0), 300, "1002")
+        self.dao.save_play_time(datetime(2023, 1, 2, 9, 0), 200, "1001")
+        self.dao.save_play_time(datetime(2023, 1, 1, 9, 0), 100, "1002")
+        self.dao.save_play_time(datetime(2023, 1, 1, 9, 0), 400, "1001")
+
+        result = [
+            (game_id, session.duration)
+            for game_id, session in self.dao.iter_game_sessions(batch_size=3)
+        ]
+
+        self.assertEqual(
+            result, [("1001", 400), ("1001", 200), ("1002", 100), ("1002", 300)]
+        )
+
+    def test_iter_canonical_game_sessions_reads_each_batch_in_own_transaction(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "DOOM")
+        self.dao.save_play_time(datetime(2023, 1, 2, 9, 0), 200, "1001")
+        self.dao.save_play_time(datetime(2023, 1, 1, 9, 0), 400, "1001")
+        self.dao.save_play_time(datetime(2023, 1, 1, 9, 0), 100, "1002")
+        result = []
+
+        for game_id, _, total_time, session in self.dao.iter_canonical_game_sessions(
+            batch_size=1
+        ):
+            if not result:
+                self.dao.save_play_time(datetime(2023, 1, 2, 9, 0), 300, "1002")
+            result.append((game_id, total_time, session.duration))
+
+        self.assertEqual(
+            result,
+            [
+                ("1001", 600, 400),
+                ("1001", 600, 200),
+                ("1002", 400, 100),
+                ("1002", 400, 300),
+            ],
+        )
+
+    def test_canonical_checksum_is_shared_across_alias_component(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "Zelda BOTW (copy)")
+        self.dao.save_game_dict("1003", "Zelda BOTW (backup)")
+        self.dao.save_game_checksum(
+            "1001", "checksum_a", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_game_checksum(
+            "1001", "checksum_b", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_game_checksum(
+            "1002", "checksum_b", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_game_checksum(
+            "1003", "checksum_b", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_play_time(datetime(2023, 1, 1, 9, 0), 3600, "1001")
+        self.dao.save_play_time(datetime(2023, 1, 1, 11, 0), 1800, "1002")
+        self.dao.save_play_time(datetime(2023, 1, 1, 13, 0), 600, "1003")
+
+        overall = self.dao.fetch_overall_playtime()
+
+        self.assertEqual(
+            sorted((g.game_id, g.checksum) for g in overall),
+            [
+                ("1001", "checksum_a"),
+                ("1002", "checksum_a"),
+                ("1003", "checksum_a"),
+            ],
+        )
+
     def test_link_game_to_game_with_checksum_copies_checksum(self):
         self.dao.save_game_dict("parent_game", "Parent Game")
         self.dao.save_game_dict("alias_game", "Parent Game")  # Child must exist
@@ -350,7 +538,255 @@ class TestDao(AbstractDatabaseTest):
         with self.assertRaises(Exception):
             self.dao.link_game_to_game_with_checksum("alias_game", "parent_game")
 
+    def test_should_keep_last_session_of_every_game_on_insert(self):
+        self.dao.save_game_dict("101", "Zelda BOTW")
+        self.dao.save_play_time(datetime(2023, 1, 2, 10, 0), 600, "101")
+        self.dao.save_play_time(datetime(2023, 1, 1, 10, 0), 300, "101")
+        self.dao.apply_manual_time_for_game(
+            datetime(2023, 1, 3, 10, 0), "102", "DOOM", 1200, "manually-changed"
+        )
+        self.dao.import_sessions(
+            {"101": "Zelda BOTW", "102": "DOOM"},
+            [
+                ("2023-01-05T10:00:00", 60, "101", None),
+                ("2023-01-04T10:00:00", 90, "101", None),
+                ("2022-12-01T10:00:00", 30, "102", None),
+            ],
+        )
+
+        self.assertEqual(
+            {
+                game_id: (s.date, s.duration, s.migrated)
+                for game_id, s in (
+                    self.dao.fetch_all_last_playtime_session_information().items()
+                )
+            },
+            {
+                "101": ("2023-01-05T10:00:00", 60, None),
+                "102": ("2023-01-03T10:00:00", 1200, "manually-changed"),
+            },
+        )
+
     def _get_overall_time_for_game(self, game_id: str):
         return list(
             filter(lambda x: x.game_id == game_id, self.dao.fetch_overall_playtime())
         )[0].time
+
+
+class TestDaoWriteBuffer(AbstractDatabaseTest):
+    dao: Dao
+
+    def setUp(self) -> None:
+        super().setUp()
+        DbMigration(db=self.database).migrate()
+        self.dao = Dao(
+            db=self.database,
+            write_buffer=PlayTimeWriteBuffer(max_pending=3, max_delay_seconds=60),
+        )
+
+    def _count_play_time_rows(self) -> int:
+        with self.database.transactional() as connection:
+            return connection.execute("SELECT COUNT(*) FROM play_time").fetchone()[0]
+
+    def test_should_coalesce_checkpoints_of_one_session(self):
+        start = datetime(2024, 1, 1, 10, 0)
+
+        self.dao.buffer_play_time(start, 60, "101", "Zelda BOTW")
+        self.dao.buffer_play_time(start, 60, "101", "Zelda BOTW")
+        self.dao.flush_play_time()
+        self.dao.buffer_play_time(start, 60, "101", "Zelda BOTW")
+        self.dao.flush_play_time()
+
+        self.assertEqual(self._count_play_time_rows(), 1)
+        self.assertEqual(
+            [(s.duration, s.migrated) for _, s in self.dao.iter_game_sessions()],
+            [(180, None)],
+        )
+        self.assertEqual(self.dao.get_game("101").time, 180)
+
+    def test_should_extend_last_session_continued_by_buffer(self):
+        start = datetime(2024, 1, 1, 10, 0)
+
+        self.dao.buffer_play_time(start, 60, "101", "Zelda BOTW")
+        self.dao.flush_play_time()
+        self.dao.buffer_play_time(start, 60, "101", "Zelda BOTW")
+
+        self.assertEqual(
+            [
+                (s.date, s.duration)
+                for s in self.dao.fetch_all_last_playtime_session_information().values()
+            ],
+            [("2024-01-01T10:00:00", 120)],
+        )
+
+    def test_should_see_buffered_time_in_queries(self):
+        self.dao.buffer_play_time(datetime(2024, 1, 1, 10, 0), 600, "101", "Zelda BOTW")
+
+        self.assertEqual(self._count_play_time_rows(), 0)
+        self.assertEqual(
+            [(g.game_id, g.time) for g in self.dao.fetch_overall_playtime()],
+            [("101", 600)],
+        )
+        self.assertEqual(self._count_play_time_rows(), 1)
+
+    def test_should_flush_when_full(self):
+        for hour in range(3):
+            self.dao.buffer_play_time(
+                datetime(2024, 1, 1, 10 + hour, 0), 60, "101", "Zelda BOTW"
+            )
+
+        self.assertEqual(self._count_play_time_rows(), 3)
+
+    def test_should_only_flush_due_time_when_asked_to(self):
+        self.dao.buffer_play_time(datetime(2024, 1, 1, 10, 0), 60, "101", "Zelda BOTW")
+
+        self.assertEqual(self.dao.flush_play_time(only_if_due=True), 0)
+        self.assertEqual(self._count_play_time_rows(), 0)
+        self.assertEqual(self.dao.flush_play_time(), 1)
+        self.assertEqual(self._count_play_time_rows(), 1)
+
+    def test_should_put_back_buffer_when_write_fails(self):
+        self.dao.buffer_play_time(datetime(2024, 1, 1, 10, 0), 60, "101", "Zelda BOTW")
+
+        with patch.object(
+            Dao,
+            "_write_buffered_play_time",
+            side_effect=sqlite3.OperationalError("disk I/O error"),
+        ):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.dao.get_games_dictionary()
+
+        self.dao.buffer_play_time(datetime(2024, 1, 1, 10, 0), 60, "101", "Zelda BOTW")
+
+        self.assertEqual(self._count_play_time_rows(), 0)
+        self.assertEqual(self.dao.flush_play_time(), 1)
+        self.assertEqual(self.dao.get_game("101").time, 120)
+
+    def test_should_write_buffer_for_call_nested_in_open_transaction(self):
+        self.dao.save_game_dict("101", "Zelda BOTW")
+        self.dao.save_play_time(datetime(2024, 1, 1, 10, 0), 60, "101")
+        self.dao.buffer_play_time(datetime(2024, 1, 2, 10, 0), 60, "101", "Zelda BOTW")
+        times = []
+
+        with self.dao._transactional():
+            for _ in range(2):
+                self.dao.buffer_play_time(
+                    datetime(2024, 1, 3, 10, 0), 60, "102", "Mario Kart"
+                )
+                times.append(
+                    (self.dao.get_game("101").time, self.dao.get_game("102").time)
+                )
+
+        self.assertEqual(times, [(120, 60), (120, 120)])
+        self.assertEqual(self.dao.flush_play_time(), 0)
+
+    def test_should_not_block_buffering_while_another_thread_queries(self):
+        self.dao.buffer_play_time(datetime(2024, 1, 1, 10, 0), 60, "101", "Zelda BOTW")
+        in_transaction, release = threading.Event(), threading.Event()
+
+        def query():
+            with self.dao._transactional():
+                in_transaction.set()
+                release.wait(5)
+
+        reader = threading.Thread(target=query)
+        reader.start()
+        in_transaction.wait(5)
+
+        self.dao.buffer_play_time(datetime(2024, 1, 1, 11, 0), 60, "102", "Mario Kart")
+        self.assertEqual(self.dao.flush_play_time(), 1)
+
+        release.set()
+        reader.join()
+
+        self.assertEqual(self.dao.get_game("101").time, 60)
+        self.assertEqual(self.dao.get_game("102").time, 60)
+
+
+class TestDaoChangeLog(AbstractDatabaseTest):
+    dao: Dao
+
+    def setUp(self) -> None:
+        super().setUp()
+        DbMigration(db=self.database).migrate()
+        self.dao = Dao(self.database)
+
+    def _add_game(self, game_id: str, time: float = 60) -> None:
+        self.dao.save_game_dict(game_id, f"Game {game_id}")
+        self.dao.save_play_time(datetime(2024, 1, 1, 10, 0), time, game_id)
+
+    def test_should_return_games_changed_since_generation(self):
+        self.assertEqual(self.dao.get_changes_since(0), (0, set()))
+
+        self._add_game("101")
+        generation = self.dao.get_generation()
+        self._add_game("102")
+        self.dao.upsert_tracking_status("101", "hidden")
+
+        current, changed = self.dao.get_changes_since(generation)
+
+        self.assertEqual(current, self.dao.get_generation())
+        self.assertEqual(changed, {"101", "102"})
+        self.assertEqual(self.dao.get_changes_since(current), (current, set()))
+
+    def test_should_log_games_sharing_a_changed_checksum(self):
+        for game_id in ("101", "102", "103"):
+            self._add_game(game_id)
+        self.dao.save_game_checksum("101", "abc", "SHA256", 16384, None, None)
+        self.dao.save_game_checksum("103", "def", "SHA256", 16384, None, None)
+        generation = self.dao.get_generation()
+
+        self.dao.save_game_checksum("102", "abc", "SHA256", 16384, None, None)
+
+        self.assertEqual(self.dao.get_changes_since(generation)[1], {"101", "102"})
+
+    def test_should_not_know_changes_of_unknown_or_pruned_generations(self):
+        self._add_game("101")
+        current = self.dao.get_generation()
+
+        self.assertEqual(self.dao.get_changes_since(current + 1), (current, None))
+        self.assertEqual(self.dao.get_changes_since(-1), (current, None))
+
+        with patch("py_modules.db.dao.CHANGE_LOG_LIMIT", 2):
+            self._add_game("102")
+            self._add_game("103")
+
+        self.assertIsNone(self.dao.get_changes_since(current)[1])
+
+    def test_should_need_full_response_after_full_change(self):
+        self._add_game("101")
+        generation = self.dao.get_generation()
+
+        full_change = self.dao.log_full_change(after_generation=generation + 10)
+
+        self.assertEqual(full_change, generation + 11)
+        self.assertEqual(self.dao.get_changes_since(generation), (full_change, None))
+        self._add_game("102")
+        self.assertEqual(self.dao.get_changes_since(full_change)[1], {"102"})
+
+    def test_should_not_log_unchanged_game_name(self):
+        self.dao.save_game_dict("101", "Zelda BOTW")
+        generation = self.dao.get_generation()
+
+        self.dao.save_game_dict("101", "Zelda BOTW")
+
+        self.assertEqual(self.dao.get_changes_since(generation)[1], set())
+
+    def test_should_log_only_games_changed_by_import(self):
+        self._add_game("101")
+        self._add_game("102")
+        self._add_game("103")
+        generation = self.dao.get_generation()
+
+        self.dao.import_sessions(
+            {"101": "Game 101", "102": "Renamed 102", "103": "Game 103"},
+            [
+                ("2024-01-01T10:00:00", 60, "101", None),
+                ("2024-01-02T10:00:00", 60, "103", None),
+                ("2024-01-02T10:00:00", 60, "104", None),
+            ],
+        )
+
+        self.assertEqual(
+            self.dao.get_changes_since(generation)[1], {"102", "103", "104"}
+        )
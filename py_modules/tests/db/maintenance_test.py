@@ -0,0 +1,86 @@
+import sqlite3
+import unittest
+from contextlib import closing
+
+from py_modules.db.dao import Dao
+from py_modules.db.maintenance import DbMaintenance, MaintenanceSettings
+from py_modules.db.migration import DbMigration
+from py_modules.tests.helpers import AbstractDatabaseTest
+
+
+class TestDbMaintenance(AbstractDatabaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        DbMigration(db=self.database).migrate()
+        self.dao = Dao(self.database)
+        self.database.optimize(analyze=True)
+
+    def _maintenance(self, **settings) -> DbMaintenance:
+        return DbMaintenance(lambda: [self.database], MaintenanceSettings(**settings))
+
+    def _write_games(self, count: int) -> None:
+        # One row changed per write, `Dao` would also write the change log.
+        # Not game_dict: its rows also change the rows of the name search index.
+        for index in range(count):
+            with self.database.transactional() as connection:
+                connection.execute(
+                    "INSERT INTO overall_time (game_id, duration) VALUES (?, ?)",
+                    (str(index), 60),
+                )
+
+    def test_should_track_writes(self):
+        self._write_games(3)
+
+        self.assertEqual(self.database.changes_since_optimize, 3)
+        self.assertEqual(self.database.changes_since_analyze, 3)
+        self.assertLess(self.database.seconds_since_last_write, 60)
+
+        self.dao.get_games_dictionary()
+
+        self.assertEqual(self.database.changes_since_optimize, 3)
+
+    def test_should_skip_database_that_is_not_idle(self):
+        self._write_games(1)
+        wal_size = self.database.wal_size
+
+        maintained = self._maintenance(
+            idle_seconds=60, checkpoint_wal_bytes=0
+        ).maintain(self.database)
+
+        self.assertFalse(maintained)
+        self.assertEqual(self.database.wal_size, wal_size)
+        self.assertEqual(self.database.changes_since_optimize, 1)
+
+    def test_should_checkpoint_and_analyze_idle_database(self):
+        # SQLite only removes the WAL when the last connection closes, so keep
+        # one open like a long running reader would
+        with closing(sqlite3.connect(self.database_file)) as reader:
+            reader.execute("SELECT COUNT(*) FROM overall_time").fetchone()
+            self._write_games(5)
+            self.assertGreater(self.database.wal_size, 0)
+
+            self._maintenance(
+                idle_seconds=0, checkpoint_wal_bytes=1, analyze_after_changes=5
+            ).run_once()
+
+        self.assertEqual(self.database.wal_size, 0)
+        self.assertEqual(self.database.changes_since_optimize, 0)
+        self.assertEqual(self.database.changes_since_analyze, 0)
+        with self.database.transactional() as connection:
+            self.assertIsNotNone(
+                connection.execute(
+                    "SELECT 1 FROM sqlite_stat1 WHERE tbl = 'overall_time'"
+                ).fetchone()
+            )
+
+    def test_should_only_optimize_below_analyze_threshold(self):
+        self._write_games(2)
+
+        self._maintenance(idle_seconds=0, analyze_after_changes=100).run_once()
+
+        self.assertEqual(self.database.changes_since_optimize, 0)
+        self.assertEqual(self.database.changes_since_analyze, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
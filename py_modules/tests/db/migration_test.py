@@ -1,6 +1,8 @@
 import sqlite3
 from contextlib import closing
+from unittest.mock import patch
 
+from py_modules.db import migration
 from py_modules.db.migration import DbMigration
 from py_modules.tests.helpers import AbstractDatabaseTest
 
@@ -33,6 +35,122 @@ class TestDbMigration(AbstractDatabaseTest):
         )
         # TODO Check indexes as well
 
+    def test_play_time_indexes_cover_session_columns(self):
+        self.get_migration().migrate()
+
+        with closing(sqlite3.connect(self.database_file)) as connection:
+            indexes = {
+                name: [
+                    column
+                    for _, _, column in connection.execute(f"PRAGMA index_info({name})")
+                ]
+                for _, name, *_ in connection.execute("PRAGMA index_list(play_time)")
+            }
+
+        self.assertEqual(
+            indexes,
+            {
+                "play_time_date_time_covering_idx": [
+                    "date_time",
+                    "game_id",
+                    "duration",
+                    "migrated",
+                ],
+                "play_time_game_id_date_time_covering_idx": [
+                    "game_id",
+                    "date_time",
+                    "duration",
+                    "migrated",
+                ],
+            },
+        )
+
+    def _migrate_to(self, version: int):
+        migrations = [m for m in migration._migrations if m.version <= version]
+
+        with patch.object(migration, "_migrations", migrations):
+            self.get_migration().migrate()
+
+    def test_should_backfill_last_session_of_every_game(self):
+        self._migrate_to(11)
+        with closing(sqlite3.connect(self.database_file)) as connection, connection:
+            connection.executemany(
+                "INSERT INTO play_time VALUES (?, ?, ?, ?)",
+                [
+                    ("2023-01-02T10:00:00", 600, "101", None),
+                    ("2023-01-03T10:00:00", 300, "101", "manually-changed"),
+                    ("2023-01-01T10:00:00", 900, "101", None),
+                    ("2023-01-01T12:00:00", 60, "102", None),
+                ],
+            )
+
+        self.get_migration().migrate()
+
+        with closing(sqlite3.connect(self.database_file)) as connection:
+            self.assertEqual(
+                connection.execute(
+                    "SELECT * FROM game_last_session ORDER BY game_id"
+                ).fetchall(),
+                [
+                    ("101", "2023-01-03T10:00:00", 300, "manually-changed"),
+                    ("102", "2023-01-01T12:00:00", 60, None),
+                ],
+            )
+
+    def test_should_index_names_of_existing_games_for_search(self):
+        self._migrate_to(13)
+        with closing(sqlite3.connect(self.database_file)) as connection, connection:
+            connection.executemany(
+                "INSERT INTO game_dict VALUES (?, ?)",
+                [("101", "Zelda BOTW"), ("102", "DOOM")],
+            )
+
+        self.get_migration().migrate()
+
+        with closing(sqlite3.connect(self.database_file)) as connection, connection:
+            connection.execute(
+                "UPDATE game_dict SET name = 'DOOM 64' WHERE game_id = '102'"
+            )
+            connection.execute("INSERT INTO game_dict VALUES ('103', 'Zelda II')")
+            search = """
+                SELECT gd.game_id, gd.name
+                FROM game_name_search gns
+                JOIN game_dict gd ON gd.rowid = gns.rowid
+                WHERE game_name_search MATCH ?
+                ORDER BY gd.game_id
+                """
+            self.assertEqual(
+                connection.execute(search, ["zel* OR doom"]).fetchall(),
+                [("101", "Zelda BOTW"), ("102", "DOOM 64"), ("103", "Zelda II")],
+            )
+            self.assertEqual(connection.execute(search, ["doom NOT 64"]).fetchall(), [])
+
+    def test_should_record_optional_migration_that_failed(self):
+        self._migrate_to(1)
+        optional = migration.Migration(
+            2,
+            [
+                "CREATE TABLE before_failure (id INT)",
+                "CREATE VIRTUAL TABLE unsupported USING no_such_module()",
+            ],
+            optional=True,
+        )
+
+        with patch.object(
+            migration, "_migrations", [migration._migrations[0], optional]
+        ):
+            self.get_migration().migrate()
+
+        with closing(sqlite3.connect(self.database_file)) as connection:
+            self.assertEqual(
+                connection.execute("SELECT max(id) FROM migration").fetchone(), (2,)
+            )
+            self.assertIsNone(
+                connection.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'before_failure'"
+                ).fetchone()
+            )
+
     def _get_table_meta(self, table: str):
         with closing(sqlite3.connect(self.database_file)) as connection, connection:
             return connection.execute(f"PRAGMA table_xinfo({table})").fetchall()
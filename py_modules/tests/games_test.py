@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 from py_modules.db.dao import Dao
 from py_modules.db.migration import DbMigration
 from py_modules.games import Games
@@ -37,6 +38,54 @@ class TestGames(AbstractDatabaseTest):
 
         self.assertIn("Parent game does not exist", str(context.exception))
 
+    def test_get_dictionary_attaches_files_checksum_per_game(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "DOOM")
+        self.dao.save_game_checksum(
+            "1001", "checksum_a", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_game_checksum(
+            "1001", "checksum_b", "SHA256", 16 * 1024 * 1024, None, None
+        )
+
+        result = {g["game"]["id"]: g for g in self.games.get_dictionary()}
+
+        self.assertEqual(
+            [f["checksum"] for f in result["1001"]["files"]],
+            ["checksum_a", "checksum_b"],
+        )
+        self.assertEqual(result["1001"]["files"][0]["game"]["name"], "Zelda BOTW")
+        self.assertEqual(result["1002"]["files"], [])
+
+    def test_get_dictionary_since_reads_only_changed_games(self):
+        self.dao.save_game_dict("1001", "Zelda BOTW")
+        self.dao.save_game_dict("1002", "DOOM")
+        self.dao.save_game_dict("1003", "Celeste")
+        generation = self.dao.get_generation()
+
+        self.dao.save_game_checksum(
+            "1002", "checksum_a", "SHA256", 16 * 1024 * 1024, None, None
+        )
+        self.dao.save_game_dict("1003", "Celeste 64")
+
+        with patch.object(
+            Dao,
+            "get_games_dictionary",
+            autospec=True,
+            side_effect=Dao.get_games_dictionary,
+        ) as get_games_dictionary:
+            delta = self.games.get_dictionary_since(generation).to_dict()
+
+        get_games_dictionary.assert_called_once_with(self.dao, {"1002", "1003"})
+        self.assertEqual(
+            [
+                (g["game"]["id"], g["game"]["name"], len(g["files"]))
+                for g in delta["upserted"]
+            ],
+            [("1002", "DOOM", 1), ("1003", "Celeste 64", 0)],
+        )
+        self.assertEqual(delta["removed"], [])
+
 
 if __name__ == "__main__":
     unittest.main()
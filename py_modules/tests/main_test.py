@@ -1,11 +1,14 @@
+import asyncio
+import gzip
 import unittest
 import os
 import shutil
 import tempfile
 import sqlite3
 from contextlib import closing
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from py_modules.tests.helpers import remove_date_fields
 
 
@@ -29,6 +32,7 @@ class TestPlugin(unittest.IsolatedAsyncioTestCase):
 
         cls.mock_decky = MagicMock()
         cls.mock_decky.logger = MagicMock()
+        cls.mock_decky.emit = AsyncMock()
 
         cls.mocked_modules = {
             "decky": cls.mock_decky,
@@ -117,6 +121,32 @@ class TestPlugin(unittest.IsolatedAsyncioTestCase):
         await plugin._unload()
         self.mock_decky.logger.info.assert_called_with("Goodnight, World!")
 
+    async def test_main_creates_result_sharing_per_plugin(self):
+        self.assertIsNone(self.main.Plugin.result_cache)
+
+        plugin, other_plugin = self.main.Plugin(), self.main.Plugin()
+        await plugin._main()
+        await other_plugin._main()
+
+        self.assertIsNot(plugin.result_cache, other_plugin.result_cache)
+        self.assertIsNot(plugin.single_flight, other_plugin.single_flight)
+        self.assertIsNot(plugin.change_notifier, other_plugin.change_notifier)
+        self.assertIsNot(plugin.response_stream, other_plugin.response_stream)
+
+        await plugin._unload()
+        await other_plugin._unload()
+
+    async def test_unload_stops_db_maintenance(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        maintenance = plugin.db_maintenance
+        self.assertIsNotNone(maintenance)
+
+        await plugin._unload()
+
+        self.assertIsNone(plugin.db_maintenance)
+        self.assertIsNone(maintenance._task)
+
     async def test_uninstall_logs_message(self):
         plugin = self.main.Plugin()
         await plugin._uninstall()
@@ -140,6 +170,502 @@ class TestPlugin(unittest.IsolatedAsyncioTestCase):
         current_user = await plugin.get_current_user()
         self.assertEqual(current_user, user_id)
 
+    async def test_recovers_session_interrupted_after_heartbeat(self):
+        user_id = "76561198033333333"
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+        session = {
+            "session_id": "session-1",
+            "started_at": started_at,
+            "game_id": "recovered_game",
+            "game_name": "Recovered Game",
+        }
+
+        crashed_plugin = self.main.Plugin()
+        await crashed_plugin._main()
+        await crashed_plugin.set_current_user(user_id)
+        await crashed_plugin.session_heartbeat(
+            {**session, "last_seen_at": started_at + 600}
+        )
+        await crashed_plugin._unload()
+
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user(user_id)
+
+        self.assertEqual(await self._total_time(plugin, "recovered_game"), 600)
+
+        # The session was still running; only the unrecovered part is added
+        await plugin.add_time({**session, "ended_at": started_at + 900})
+
+        self.assertEqual(await self._total_time(plugin, "recovered_game"), 900)
+
+    async def test_keeps_session_that_failed_to_recover_for_next_start(self):
+        user_id = "76561198060606060"
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+
+        crashed_plugin = self.main.Plugin()
+        await crashed_plugin._main()
+        await crashed_plugin.set_current_user(user_id)
+        for game_id in ("recovered_game", "failing_game"):
+            await crashed_plugin.session_heartbeat(
+                {
+                    "session_id": game_id,
+                    "started_at": started_at,
+                    "last_seen_at": started_at + 600,
+                    "game_id": game_id,
+                    "game_name": game_id,
+                }
+            )
+        await crashed_plugin._unload()
+
+        add_missing_session_time = self.main.TimeTracking.add_missing_session_time
+
+        def fail_for_failing_game(tracking, started_at, ended_at, game_id, *args):
+            if game_id == "failing_game":
+                raise sqlite3.OperationalError("disk I/O error")
+            return add_missing_session_time(
+                tracking, started_at, ended_at, game_id, *args
+            )
+
+        with patch.object(
+            self.main.TimeTracking,
+            "add_missing_session_time",
+            autospec=True,
+            side_effect=fail_for_failing_game,
+        ):
+            plugin = self.main.Plugin()
+            await plugin._main()
+
+        self.assertEqual(
+            [s.session_id for s in plugin.session_journal.recover()],
+            ["failing_game"],
+        )
+
+        restarted_plugin = self.main.Plugin()
+        await restarted_plugin._main()
+        await restarted_plugin.set_current_user(user_id)
+
+        self.assertEqual(
+            await self._total_time(restarted_plugin, "recovered_game"), 600
+        )
+        self.assertEqual(await self._total_time(restarted_plugin, "failing_game"), 600)
+
+    async def _total_time(self, plugin, game_id: str):
+        stats = await plugin.per_game_overall_statistics()
+        return next(
+            stat["totalTime"] for stat in stats if stat["game"]["id"] == game_id
+        )
+
+    async def test_recovers_heartbeats_lost_from_write_buffer_once(self):
+        user_id = "76561198070707070"
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+        session = {
+            "session_id": "lost-buffer-session",
+            "started_at": started_at,
+            "game_id": "buffered_game",
+            "game_name": "Buffered Game",
+        }
+
+        crashed_plugin = self.main.Plugin()
+        await crashed_plugin._main()
+        await crashed_plugin.set_current_user(user_id)
+        await crashed_plugin.session_heartbeat(
+            {**session, "last_seen_at": started_at + 300}
+        )
+        crashed_plugin._flush_play_time()
+        await crashed_plugin.session_heartbeat(
+            {**session, "last_seen_at": started_at + 600}
+        )
+        # Crash: the last heartbeat never leaves the write buffer
+        crashed_plugin.write_behind_task.cancel()
+        crashed_plugin.snapshot_task.cancel()
+        await crashed_plugin.db_maintenance.stop()
+
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user(user_id)
+
+        self.assertEqual(
+            self._play_time_rows(user_id, "buffered_game"),
+            [(datetime.fromtimestamp(started_at).isoformat(), 600)],
+        )
+        await plugin._unload()
+
+    async def test_writes_session_checkpointed_by_heartbeats_as_one_row(self):
+        user_id = "76561198044444444"
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user(user_id)
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+        session = {
+            "session_id": "checkpointed-session",
+            "started_at": started_at,
+            "game_id": "buffered_game",
+            "game_name": "Buffered Game",
+        }
+
+        for seconds in (60, 120):
+            await plugin.session_heartbeat(
+                {**session, "last_seen_at": started_at + seconds}
+            )
+        await plugin.add_time({**session, "ended_at": started_at + 180})
+
+        self.assertEqual(
+            self._play_time_rows(user_id, "buffered_game"),
+            [(datetime.fromtimestamp(started_at).isoformat(), 180)],
+        )
+        self.assertEqual(plugin.session_journal.recover(), [])
+
+    async def test_unload_writes_buffered_play_time(self):
+        user_id = "76561198044444445"
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user(user_id)
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+
+        await plugin.session_heartbeat(
+            {
+                "session_id": "unload-session",
+                "started_at": started_at,
+                "last_seen_at": started_at + 60,
+                "game_id": "buffered_game",
+                "game_name": "Buffered Game",
+            }
+        )
+        await plugin._unload()
+
+        self.assertEqual(
+            self._play_time_rows(user_id, "buffered_game"),
+            [(datetime.fromtimestamp(started_at).isoformat(), 60)],
+        )
+
+    def _play_time_rows(self, user_id: str, game_id: str):
+        user_db_path = (
+            Path(self.mock_plugin_runtime_dir) / "users" / user_id / "storage.db"
+        )
+        with closing(sqlite3.connect(user_db_path)) as conn:
+            return conn.execute(
+                "SELECT date_time, duration FROM play_time WHERE game_id = ?",
+                (game_id,),
+            ).fetchall()
+
+    async def test_export_data_writes_file_in_user_directory(self):
+        user_id = "76561198055555555"
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user(user_id)
+        await plugin.apply_manual_time_correction(
+            [{"game": {"id": "exported_game", "name": "Exported Game"}, "time": 60}]
+        )
+
+        result = await plugin.export_data("csv")
+
+        path = Path(result["path"])
+        self.assertEqual(
+            path.parent,
+            Path(self.mock_plugin_runtime_dir) / "users" / user_id / "exports",
+        )
+        self.assertTrue(path.name.endswith(".csv.gz"))
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            self.assertIn("game_dict,exported_game,Exported Game", file.read())
+
+    async def test_create_and_list_snapshots(self):
+        user_id = "76561198066666666"
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user(user_id)
+
+        snapshot = await plugin.create_snapshot()
+        snapshots = await plugin.list_snapshots()
+        await plugin._unload()
+
+        self.assertEqual([s["name"] for s in snapshots], [snapshot["name"]])
+        self.assertTrue(
+            (
+                Path(self.mock_plugin_runtime_dir)
+                / "users"
+                / user_id
+                / "backups"
+                / snapshot["name"]
+            ).exists()
+        )
+
+    def _data_changed_events(self):
+        return [
+            call.args[1]
+            for call in self.mock_decky.emit.await_args_list
+            if call.args[0] == "data_changed"
+        ]
+
+    async def test_mutations_publish_data_changed_events(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user("76561198077777777")
+        await plugin.apply_manual_time_correction(
+            [{"game": {"id": "evented_child", "name": "Evented Child"}, "time": 60}]
+        )
+        self.mock_decky.emit.reset_mock()
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+
+        await plugin.add_time(
+            {
+                "started_at": started_at,
+                "ended_at": started_at + 60,
+                "game_id": "evented_game",
+                "game_name": "Evented Game",
+            }
+        )
+        await plugin.set_game_tracking_status(
+            {"game_id": "evented_game", "status": "hidden"}
+        )
+        await plugin.create_game_association(
+            {"parent_game_id": "evented_game", "child_game_id": "evented_child"}
+        )
+        await plugin.remove_game_association("evented_child")
+        await plugin.remove_game_association("evented_child")
+        await plugin._unload()
+
+        events = self._data_changed_events()
+        self.assertEqual(
+            [(event["reason"], event["gameIds"]) for event in events],
+            [
+                ("add_time", ["evented_game"]),
+                ("tracking_status", ["evented_game"]),
+                ("game_association", ["evented_game", "evented_child"]),
+                ("game_association", ["evented_child", "evented_game"]),
+            ],
+        )
+        generations = [event["generation"] for event in events]
+        self.assertEqual(generations, sorted(set(generations)))
+
+    async def test_search_games_returns_matches_with_playtime(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user("76561198050505050")
+        await plugin.apply_manual_time_correction(
+            [
+                {"game": {"id": "search_game", "name": "Searchable Quest"}, "time": 60},
+                {"game": {"id": "other_game", "name": "Other Quest"}, "time": 30},
+            ]
+        )
+
+        cached_results = plugin.result_cache.stats().entries
+
+        matches = await plugin.search_games("searchable qu")
+        all_matches = await plugin.search_games("quest", limit=5)
+        with self.assertRaises(ValueError):
+            await plugin.search_games("quest", limit=0)
+        await plugin._unload()
+
+        self.assertEqual(plugin.result_cache.stats().entries, cached_results)
+
+        self.assertEqual(
+            matches,
+            [
+                {
+                    "game": {"id": "search_game", "name": "Searchable Quest"},
+                    "totalTime": 60,
+                }
+            ],
+        )
+        self.assertEqual(
+            sorted(match["game"]["id"] for match in all_matches),
+            ["other_game", "search_game"],
+        )
+
+    async def test_skipped_add_time_publishes_no_event(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user("76561198088888888")
+        await plugin.apply_manual_time_correction(
+            [{"game": {"id": "paused_evented_game", "name": "Paused"}, "time": 60}]
+        )
+        await plugin.set_game_tracking_status(
+            {"game_id": "paused_evented_game", "status": "pause"}
+        )
+        self.mock_decky.emit.reset_mock()
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+
+        await plugin.add_time(
+            {
+                "started_at": started_at,
+                "ended_at": started_at + 60,
+                "game_id": "paused_evented_game",
+                "game_name": "Paused Game",
+            }
+        )
+        await plugin._unload()
+
+        self.assertEqual(self._data_changed_events(), [])
+
+    async def test_fetch_since_generation_returns_only_changes(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user("76561198099999999")
+        await plugin.apply_manual_time_correction(
+            [
+                {"game": {"id": "delta_game", "name": "Delta Game"}, "time": 60},
+                {"game": {"id": "delta_child", "name": "Delta Child"}, "time": 30},
+            ]
+        )
+        full = await plugin.fetch_playtime_information(since=-1)
+        dictionary = await plugin.get_games_dictionary(since=-1)
+
+        await plugin.create_game_association(
+            {"parent_game_id": "delta_game", "child_game_id": "delta_child"}
+        )
+        delta = await plugin.fetch_playtime_information(since=full["generation"])
+        dictionary_delta = await plugin.get_games_dictionary(
+            since=dictionary["generation"]
+        )
+        unchanged = await plugin.fetch_playtime_information(since=delta["generation"])
+        await plugin._unload()
+
+        self.assertTrue(full["full"])
+        self.assertFalse(delta["full"])
+        self.assertEqual(
+            [(entry["game"]["id"], entry["totalTime"]) for entry in delta["upserted"]],
+            [("delta_game", 90)],
+        )
+        self.assertEqual(delta["removed"], ["delta_child"])
+        self.assertEqual(
+            [entry["game"]["id"] for entry in dictionary_delta["upserted"]],
+            ["delta_game"],
+        )
+        self.assertEqual(dictionary_delta["removed"], ["delta_child"])
+        self.assertEqual(
+            unchanged,
+            {
+                "generation": delta["generation"],
+                "full": False,
+                "upserted": [],
+                "removed": [],
+            },
+        )
+
+    async def test_stream_per_game_overall_statistics_emits_chunks(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user("76561198010101010")
+        await plugin.apply_manual_time_correction(
+            [{"game": {"id": "streamed_game", "name": "Streamed Game"}, "time": 60}]
+        )
+        self.mock_decky.emit.reset_mock()
+
+        result = await plugin.stream_per_game_overall_statistics("stream-1")
+        await plugin._unload()
+
+        events = [
+            call.args[1]
+            for call in self.mock_decky.emit.await_args_list
+            if call.args[0] == "statistics_chunk"
+        ]
+        self.assertEqual(result, {"streamId": "stream-1", "chunks": len(events) - 1})
+        self.assertTrue(events[-1]["done"])
+        streamed = [game for event in events for game in event["items"]]
+        self.assertIn(
+            ("streamed_game", 60),
+            [(game["game"]["id"], game["totalTime"]) for game in streamed],
+        )
+
+    async def test_identical_concurrent_calls_share_one_computation(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user("76561198020202020")
+        await plugin.apply_manual_time_correction(
+            [{"game": {"id": "coalesced_game", "name": "Coalesced Game"}, "time": 60}]
+        )
+        before = {
+            c["name"]: c for c in (await plugin.get_request_coalescing_stats())["calls"]
+        }
+
+        statistics_class = type(plugin.statistics)
+        with patch.object(
+            statistics_class,
+            "fetch_playtime_information",
+            autospec=True,
+            side_effect=statistics_class.fetch_playtime_information,
+        ) as fetch:
+            results = await asyncio.gather(
+                *[plugin.fetch_playtime_information() for _ in range(3)],
+                plugin.fetch_playtime_information(since=0),
+            )
+        stats = await plugin.get_request_coalescing_stats()
+        await plugin._unload()
+
+        # Once for the three full calls, once for the delta
+        self.assertEqual(fetch.call_count, 2)
+        self.assertIs(results[0], results[1])
+        self.assertIs(results[0], results[2])
+        self.assertIn("upserted", results[3])
+        counters = {c["name"]: c for c in stats["calls"]}["fetch_playtime_information"]
+        previous = before.get(
+            "fetch_playtime_information", {"calls": 0, "coalesced": 0}
+        )
+        self.assertEqual(counters["calls"] - previous["calls"], 4)
+        self.assertEqual(counters["coalesced"] - previous["coalesced"], 2)
+        self.assertEqual(stats["inFlight"], 0)
+
+    async def test_add_time_prewarms_result_cache(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user("76561198030303030")
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+        add_time = {
+            "started_at": started_at,
+            "ended_at": started_at + 60,
+            "game_id": "prewarmed_game",
+            "game_name": "Prewarmed Game",
+        }
+
+        with patch.object(self.main, "PREWARM_DELAY_SECONDS", 0):
+            await plugin.add_time(add_time)
+            await plugin.prewarm_task
+
+            statistics_class = type(plugin.statistics)
+            with patch.object(
+                statistics_class, "fetch_playtime_information", autospec=True
+            ) as fetch:
+                result = await plugin.fetch_playtime_information()
+        await plugin._unload()
+
+        fetch.assert_not_called()
+        self.assertIn(
+            ("prewarmed_game", 60),
+            [(info["game"]["id"], info["totalTime"]) for info in result],
+        )
+
+    async def test_newer_write_cancels_prewarming(self):
+        plugin = self.main.Plugin()
+        await plugin._main()
+        await plugin.set_current_user("76561198040404040")
+        started_at = int(datetime(2024, 1, 1, 10, 0).timestamp())
+        add_time = {
+            "started_at": started_at,
+            "ended_at": started_at + 60,
+            "game_id": "cancelled_prewarm_game",
+            "game_name": "Cancelled Prewarm Game",
+        }
+
+        await plugin.add_time(add_time)
+        first_prewarm = plugin.prewarm_task
+        await plugin.set_game_tracking_status(
+            {"game_id": "cancelled_prewarm_game", "status": "hidden"}
+        )
+        await asyncio.sleep(0)
+
+        self.assertTrue(first_prewarm.cancelled())
+        self.assertIsNone(plugin.prewarm_task)
+
+        await plugin.add_time(
+            {**add_time, "started_at": started_at + 120, "ended_at": started_at + 180}
+        )
+        second_prewarm = plugin.prewarm_task
+        await plugin._unload()
+        await asyncio.sleep(0)
+
+        self.assertTrue(second_prewarm.cancelled())
+
     async def test_multi_user_data_isolation(self):
         """Test that different users have isolated data."""
         plugin = self.main.Plugin()
@@ -391,6 +917,9 @@ class TestPlugin(unittest.IsolatedAsyncioTestCase):
         plugin = self.main.Plugin()
         await plugin._main()
         await plugin.set_current_user("76561198088888888")
+        await plugin.apply_manual_time_correction(
+            [{"game": {"id": "paused_evented_game", "name": "Paused"}, "time": 60}]
+        )
 
         # Session 1: Default status - should track
         await plugin.add_time(
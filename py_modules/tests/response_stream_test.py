@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import AsyncMock, call
+
+from py_modules.response_stream import STATISTICS_CHUNK_EVENT, ResponseStream
+
+
+class TestResponseStream(unittest.IsolatedAsyncioTestCase):
+    async def test_should_emit_chunks_in_camel_case_and_finish(self):
+        emit = AsyncMock()
+
+        chunks = await ResponseStream(emit).send(
+            "s1", iter([[{"total_time": 60}], [{"total_time": 30}]])
+        )
+
+        self.assertEqual(chunks, 2)
+        emit.assert_has_awaits(
+            [
+                call(
+                    STATISTICS_CHUNK_EVENT,
+                    {
+                        "streamId": "s1",
+                        "index": 0,
+                        "items": [{"totalTime": 60}],
+                        "done": False,
+                    },
+                ),
+                call(
+                    STATISTICS_CHUNK_EVENT,
+                    {
+                        "streamId": "s1",
+                        "index": 1,
+                        "items": [{"totalTime": 30}],
+                        "done": False,
+                    },
+                ),
+                call(
+                    STATISTICS_CHUNK_EVENT,
+                    {"streamId": "s1", "index": 2, "items": [], "done": True},
+                ),
+            ]
+        )
+
+    async def test_should_end_stream_with_error_when_producing_fails(self):
+        emit = AsyncMock()
+
+        def failing_chunks():
+            yield [{"id": 1}]
+            raise RuntimeError("database is locked")
+
+        with self.assertRaises(RuntimeError):
+            await ResponseStream(emit).send("s1", failing_chunks())
+
+        self.assertEqual(
+            emit.await_args_list[-1],
+            call(
+                STATISTICS_CHUNK_EVENT,
+                {
+                    "streamId": "s1",
+                    "index": 1,
+                    "items": [],
+                    "done": True,
+                    "error": "database is locked",
+                },
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
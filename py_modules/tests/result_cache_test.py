@@ -0,0 +1,35 @@
+import unittest
+
+from py_modules.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def test_should_return_stored_result_for_same_key(self):
+        cache = ResultCache()
+        cache.put("fetch", ("user", 3, ()), {"games": 1})
+
+        self.assertEqual(cache.get("fetch", ("user", 3, ())), {"games": 1})
+        self.assertIsNone(cache.get("fetch", ("user", 4, ())))
+        self.assertIsNone(cache.get("dictionary", ("user", 3, ())))
+        self.assertEqual(
+            cache.stats().to_dict(), {"entries": 1, "hits": 1, "misses": 2}
+        )
+
+    def test_should_drop_least_recently_used_results(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("fetch", 1, "first")
+        cache.put("fetch", 2, "second")
+        cache.get("fetch", 1)
+        cache.put("fetch", 3, "third")
+
+        self.assertEqual(cache.get("fetch", 1), "first")
+        self.assertIsNone(cache.get("fetch", 2))
+        self.assertEqual(cache.get("fetch", 3), "third")
+
+    def test_should_require_room_for_a_result(self):
+        with self.assertRaises(ValueError):
+            ResultCache(max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from py_modules.session_journal import JournalSession, SessionJournal
+
+
+class TestSessionJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = Path(self.directory) / "sessions.journal"
+        self.journal = SessionJournal(self.path, fsync=False)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_should_recover_last_heartbeat_of_open_sessions(self):
+        self.journal.heartbeat("s1", "7656", "101", "Zelda BOTW", 1000, 1060)
+        self.journal.heartbeat("s2", None, "102", "DOOM", 1030, 1090)
+        self.journal.heartbeat("s1", "7656", "101", "Zelda BOTW", 1000, 1120)
+
+        journal = SessionJournal(self.path, fsync=False)
+        recovered = journal.recover()
+
+        self.assertEqual(
+            recovered,
+            [
+                JournalSession("s1", "7656", "101", "Zelda BOTW", 1000, 1120),
+                JournalSession("s2", None, "102", "DOOM", 1030, 1090),
+            ],
+        )
+        self.assertEqual(journal.recover(), recovered)
+
+        journal.commit_recovered(recovered)
+
+        self.assertEqual(self.path.read_text(), "")
+
+    def test_should_keep_failed_sessions_for_next_recovery(self):
+        self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, 1060)
+        self.journal.heartbeat("s2", None, "102", "DOOM", 1030, 1090)
+        journal = SessionJournal(self.path, fsync=False)
+        recovered = journal.recover()
+
+        journal.commit_recovered(recovered, failed=recovered[1:])
+
+        self.assertEqual(
+            SessionJournal(self.path).recover(),
+            [JournalSession("s2", None, "102", "DOOM", 1030, 1090)],
+        )
+        self.assertEqual(journal.saved_until("s1"), 1060)
+        # None of the failed session is saved
+        self.assertIsNone(journal.saved_until("s2"))
+        self.assertEqual(journal.heartbeat("s2", None, "102", "DOOM", 1030, 1150), 1030)
+
+    def test_should_keep_only_latest_heartbeat_of_each_session(self):
+        for last_seen_at in range(1060, 2000, 60):
+            self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, last_seen_at)
+        self.journal.heartbeat("s2", None, "102", "DOOM", 1030, 1090)
+
+        self.assertEqual(len(self.path.read_text().splitlines()), 2)
+        self.assertEqual(
+            [
+                (s.session_id, s.last_seen_at)
+                for s in SessionJournal(self.path).recover()
+            ],
+            [("s1", 1960), ("s2", 1090)],
+        )
+        self.assertEqual(list(Path(self.directory).iterdir()), [self.path])
+
+    def test_should_return_time_recorded_before_each_heartbeat(self):
+        self.assertEqual(
+            [
+                self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, seen)
+                for seen in (1060, 1120, 1090)
+            ],
+            [1000, 1060, 1090],
+        )
+        self.assertEqual(self.journal.saved_until("s1"), 1120)
+
+    def test_should_ignore_heartbeat_older_than_the_recorded_one(self):
+        self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, 1120)
+        self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, 1060)
+
+        self.assertEqual(
+            [s.last_seen_at for s in SessionJournal(self.path).recover()], [1120]
+        )
+
+    def test_should_not_recover_closed_sessions(self):
+        self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, 1060)
+        self.journal.heartbeat("s2", None, "102", "DOOM", 1000, 1060)
+        self.journal.close("s1")
+
+        self.assertEqual(
+            [s.session_id for s in SessionJournal(self.path).recover()], ["s2"]
+        )
+
+    def test_should_truncate_once_no_session_is_open(self):
+        self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, 1060)
+        self.journal.close("s1")
+
+        self.assertEqual(self.path.read_text(), "")
+
+    def test_should_skip_torn_record(self):
+        self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, 1060)
+        with open(self.path, "a", encoding="utf-8") as journal:
+            journal.write('{"session_id":"s1","user_id":null,"ga')
+
+        recovered = SessionJournal(self.path).recover()
+
+        self.assertEqual(
+            [(s.session_id, s.last_seen_at) for s in recovered], [("s1", 1060)]
+        )
+
+    def test_should_remember_how_much_was_recovered(self):
+        self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, 1060)
+        self.journal.commit_recovered(self.journal.recover())
+
+        self.assertEqual(self.journal.saved_until("s1"), 1060)
+        self.assertEqual(
+            self.journal.heartbeat("s1", None, "101", "Zelda BOTW", 1000, 1120), 1060
+        )
+
+        self.journal.close("s1")
+
+        self.assertIsNone(self.journal.saved_until("s1"))
+
+    def test_should_recover_nothing_without_journal(self):
+        self.assertEqual(self.journal.recover(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
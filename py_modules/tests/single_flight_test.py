@@ -0,0 +1,91 @@
+import asyncio
+import unittest
+
+from py_modules.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_should_share_running_computation_of_same_key(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+        computations = []
+
+        async def compute(value):
+            computations.append(value)
+            await release.wait()
+            return {"value": value}
+
+        calls = [
+            asyncio.ensure_future(
+                single_flight.run("fetch", key, lambda key=key: compute(key))
+            )
+            for key in ("a", "a", "b", "a")
+        ]
+        await asyncio.sleep(0)
+        self.assertEqual(single_flight.in_flight, 2)
+
+        release.set()
+        results = await asyncio.gather(*calls)
+
+        self.assertEqual(computations, ["a", "b"])
+        self.assertIs(results[0], results[1])
+        self.assertIs(results[0], results[3])
+        self.assertEqual(results[2], {"value": "b"})
+        self.assertEqual(single_flight.in_flight, 0)
+        self.assertEqual(
+            [c.to_dict() for c in single_flight.counters()],
+            [{"name": "fetch", "calls": 4, "coalesced": 2}],
+        )
+
+    async def test_should_compute_again_once_finished(self):
+        single_flight = SingleFlight()
+
+        async def compute():
+            return object()
+
+        first = await single_flight.run("fetch", None, compute)
+        second = await single_flight.run("fetch", None, compute)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(single_flight.counters()[0].coalesced, 0)
+
+    async def test_should_raise_failure_to_every_waiting_call(self):
+        single_flight = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0)
+            raise ValueError("broken")
+
+        results = await asyncio.gather(
+            single_flight.run("fetch", None, compute),
+            single_flight.run("fetch", None, compute),
+            return_exceptions=True,
+        )
+
+        self.assertEqual([type(r) for r in results], [ValueError, ValueError])
+        self.assertEqual(single_flight.in_flight, 0)
+
+    async def test_should_keep_computing_for_others_when_first_caller_cancelled(
+        self,
+    ):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            return "result"
+
+        first = asyncio.ensure_future(single_flight.run("fetch", None, compute))
+        second = asyncio.ensure_future(single_flight.run("fetch", None, compute))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, "result")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from py_modules.db.dao import Dao
+from py_modules.db.migration import DbMigration
+from py_modules.db.sqlite_db import SqlLiteDb
+from py_modules.snapshot_manager import SnapshotManager
+from py_modules.tests.helpers import AbstractDatabaseTest
+
+
+class TestSnapshotManager(AbstractDatabaseTest):
+    dao: Dao
+
+    def setUp(self) -> None:
+        super().setUp()
+        DbMigration(db=self.database).migrate()
+        self.dao = Dao(db=self.database)
+        self.backups_dir = Path(tempfile.mkdtemp()) / "backups"
+        self.snapshot_manager = SnapshotManager(keep=2)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.backups_dir.parent)
+        super().tearDown()
+
+    def _snapshot_at(self, moment: datetime):
+        with patch("py_modules.snapshot_manager.datetime") as mock_datetime:
+            mock_datetime.now.return_value = moment
+            mock_datetime.fromtimestamp = datetime.fromtimestamp
+            return self.snapshot_manager.create_snapshot(self.dao, self.backups_dir)
+
+    def test_should_create_snapshot_with_current_data(self):
+        self.dao.save_game_dict("101", "Zelda BOTW")
+        self.dao.save_play_time(datetime(2024, 1, 1, 10, 0), 3600, "101")
+
+        snapshot = self._snapshot_at(datetime(2025, 1, 1, 3, 0))
+
+        self.assertEqual(snapshot.name, "snapshot-20250101-030000.db")
+        self.assertGreater(snapshot.size, 0)
+        self.assertFalse(
+            (self.backups_dir / "snapshot-20250101-030000.db.part").exists()
+        )
+        snapshot_dao = Dao(type(self.database)(str(self.backups_dir / snapshot.name)))
+        self.assertEqual(snapshot_dao.get_game("101").time, 3600)
+
+    def test_should_keep_only_newest_snapshots(self):
+        self._snapshot_at(datetime(2025, 1, 1, 3, 0))
+        self._snapshot_at(datetime(2025, 1, 2, 3, 0))
+        self._snapshot_at(datetime(2025, 1, 2, 3, 0))
+
+        self.assertEqual(
+            sorted(
+                s.name for s in self.snapshot_manager.list_snapshots(self.backups_dir)
+            ),
+            ["snapshot-20250102-030000-1.db", "snapshot-20250102-030000.db"],
+        )
+
+    def test_should_restore_snapshot_and_keep_state_before_restore(self):
+        self.dao.save_game_dict("101", "Zelda BOTW")
+        self.dao.save_play_time(datetime(2024, 1, 1, 10, 0), 3600, "101")
+        snapshot = self._snapshot_at(datetime(2025, 1, 1, 3, 0))
+        self.dao.save_play_time(datetime(2024, 1, 2, 10, 0), 1800, "101")
+
+        self.snapshot_manager.restore_snapshot(
+            self.dao, self.backups_dir, snapshot.name
+        )
+
+        self.assertEqual(self.dao.get_game("101").time, 3600)
+        snapshots = self.snapshot_manager.list_snapshots(self.backups_dir)
+        self.assertEqual(len(snapshots), 2)
+        pre_restore = next(s for s in snapshots if s.name != snapshot.name)
+        self.snapshot_manager.restore_snapshot(
+            self.dao, self.backups_dir, pre_restore.name
+        )
+        self.assertEqual(self.dao.get_game("101").time, 5400)
+
+    def test_should_log_full_change_above_generation_before_restore(self):
+        self.dao.save_game_dict("101", "Zelda BOTW")
+        snapshot = self._snapshot_at(datetime(2025, 1, 1, 3, 0))
+        self.dao.save_play_time(datetime(2024, 1, 2, 10, 0), 1800, "101")
+        generation = self.dao.get_generation()
+
+        self.snapshot_manager.restore_snapshot(
+            self.dao, self.backups_dir, snapshot.name
+        )
+
+        self.assertEqual(self.dao.get_changes_since(generation), (generation + 1, None))
+
+    def test_should_reject_unknown_snapshot(self):
+        with self.assertRaises(ValueError):
+            self.snapshot_manager.restore_snapshot(
+                self.dao, self.backups_dir, "../storage.db"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
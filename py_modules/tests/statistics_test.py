@@ -0,0 +1,356 @@
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+from py_modules.association_manager import AssociationManager
+from py_modules.db.dao import Dao
+from py_modules.db.migration import DbMigration
+from py_modules.statistics import Statistics
+from py_modules.tests.helpers import AbstractDatabaseTest
+
+
+class AbstractStatisticsTest(AbstractDatabaseTest):
+    dao: Dao
+    statistics: Statistics
+
+    def setUp(self) -> None:
+        super().setUp()
+        DbMigration(db=self.database).migrate()
+        self.dao = Dao(db=self.database)
+        self.association_manager = AssociationManager(dao=self.dao)
+        self.statistics = Statistics(
+            dao=self.dao,
+            tracking_manager=None,
+            association_manager=self.association_manager,
+        )
+
+    def _add_session(self, game_id: str, game_name: str, start: datetime, time_s: int):
+        self.dao.save_game_dict(game_id, game_name)
+        self.dao.save_play_time(start, time_s, game_id)
+
+    def _add_parent_with_aliased_child(self, alias_id: str, child_id: str):
+        """
+        Parent "200" with one session, whose association child shares a
+        checksum with `alias_id`; the child and the alias have one session.
+        """
+        self._add_session("200", "Parent P", datetime(2023, 1, 5, 10), 300)
+        self._add_session(alias_id, "Alias A", datetime(2023, 1, 6, 10), 300)
+        self._add_session(child_id, "Alias C", datetime(2023, 1, 7, 10), 300)
+        self.dao.save_game_checksum(alias_id, "checksum_a", "SHA256", 1024, None, None)
+        self.dao.save_game_checksum(child_id, "checksum_a", "SHA256", 1024, None, None)
+        self.association_manager.create_association("200", child_id)
+
+
+class TestStatisticsForPeriod(AbstractStatisticsTest):
+    def test_should_sum_playtime_per_month(self):
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 5, 10), 3600)
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 20, 10), 1800)
+        self._add_session("1002", "DOOM", datetime(2023, 1, 21, 10), 600)
+        self._add_session("1002", "DOOM", datetime(2023, 3, 1, 10), 900)
+
+        result = self.statistics.statistics_for_period(
+            date(2023, 1, 1), date(2023, 3, 31), "month"
+        ).to_dict()
+
+        self.assertEqual(
+            result["data"],
+            [
+                {
+                    "period_start": "2023-01-01",
+                    "games": [
+                        {
+                            "game": {"id": "1001", "name": "Zelda BOTW"},
+                            "total_time": 5400,
+                            "sessions": 2,
+                        },
+                        {
+                            "game": {"id": "1002", "name": "DOOM"},
+                            "total_time": 600,
+                            "sessions": 1,
+                        },
+                    ],
+                    "total": 6000,
+                },
+                {"period_start": "2023-02-01", "games": [], "total": 0},
+                {
+                    "period_start": "2023-03-01",
+                    "games": [
+                        {
+                            "game": {"id": "1002", "name": "DOOM"},
+                            "total_time": 900,
+                            "sessions": 1,
+                        },
+                    ],
+                    "total": 900,
+                },
+            ],
+        )
+        self.assertFalse(result["has_prev"])
+        self.assertFalse(result["has_next"])
+
+    def test_should_bucket_weeks_by_first_day_of_week(self):
+        # 2023-01-01 is a Sunday
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 1, 10), 3600)
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 2, 10), 1800)
+
+        monday_weeks = self.statistics.statistics_for_period(
+            date(2023, 1, 1), date(2023, 1, 8), "week", week_starts_on=1
+        )
+        sunday_weeks = self.statistics.statistics_for_period(
+            date(2023, 1, 1), date(2023, 1, 8), "week", week_starts_on=0
+        )
+
+        self.assertEqual(
+            [(p.period_start, p.total) for p in monday_weeks.data],
+            [("2022-12-26", 3600), ("2023-01-02", 1800)],
+        )
+        self.assertEqual(
+            [(p.period_start, p.total) for p in sunday_weeks.data],
+            [("2023-01-01", 5400), ("2023-01-08", 0)],
+        )
+
+    def test_should_merge_checksum_aliases_and_association_children(self):
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 5, 10), 3600)
+        self._add_session("1002", "Zelda BOTW (copy)", datetime(2023, 2, 5, 10), 1800)
+        self._add_session("2001", "DOOM", datetime(2023, 3, 5, 10), 600)
+        self._add_session("2002", "DOOM Eternal", datetime(2023, 4, 5, 10), 900)
+        self.dao.save_game_checksum("1001", "checksum_a", "SHA256", 1024, None, None)
+        self.dao.save_game_checksum("1002", "checksum_a", "SHA256", 1024, None, None)
+        self.association_manager.create_association("2001", "2002")
+
+        result = self.statistics.statistics_for_period(
+            date(2023, 1, 1), date(2023, 12, 31), "year"
+        )
+
+        self.assertEqual(len(result.data), 1)
+        self.assertEqual(
+            [(g.game.id, g.total_time, g.sessions) for g in result.data[0].games],
+            [("1001", 5400, 2), ("2001", 1500, 2)],
+        )
+
+        result = self.statistics.statistics_for_period(
+            date(2023, 1, 1), date(2023, 12, 31), "year", game_id="2001"
+        )
+
+        self.assertEqual(
+            [(g.game.id, g.total_time) for g in result.data[0].games],
+            [("2001", 1500)],
+        )
+
+    def test_should_merge_alias_component_of_association_child(self):
+        for alias_id, child_id in (("100", "300"), ("300", "050")):
+            with self.subTest(child_is_component_leader=child_id < alias_id):
+                self.setUp()
+                self._add_parent_with_aliased_child(alias_id, child_id)
+
+                result = self.statistics.statistics_for_period(
+                    date(2023, 1, 1), date(2023, 12, 31), "year"
+                )
+                filtered = self.statistics.statistics_for_period(
+                    date(2023, 1, 1), date(2023, 12, 31), "year", game_id=alias_id
+                )
+
+                for report in (result, filtered):
+                    self.assertEqual(
+                        [
+                            (g.game.id, g.game.name, g.total_time, g.sessions)
+                            for g in report.data[0].games
+                        ],
+                        [("200", "Parent P", 900, 3)],
+                    )
+                self.tearDown()
+
+    def test_should_report_nearest_data_outside_period(self):
+        self._add_session("1001", "Zelda BOTW", datetime(2022, 6, 5, 10), 3600)
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 2, 5, 10), 3600)
+        self._add_session("1001", "Zelda BOTW", datetime(2024, 3, 5, 10), 3600)
+
+        result = self.statistics.statistics_for_period(
+            date(2023, 1, 1), date(2023, 12, 31), "month"
+        )
+
+        self.assertEqual(len(result.data), 12)
+        self.assertTrue(result.has_prev)
+        self.assertTrue(result.has_next)
+        self.assertEqual(result.prev_date, "2022-06-05T10:00:00")
+        self.assertEqual(result.next_date, "2024-03-05T10:00:00")
+
+    def test_should_reject_unknown_granularity(self):
+        with self.assertRaises(ValueError):
+            self.statistics.statistics_for_period(
+                date(2023, 1, 1), date(2023, 12, 31), "decade"
+            )
+
+    def test_should_merge_checksum_aliases_played_on_same_day(self):
+        self._add_session("1002", "Zelda BOTW (copy)", datetime(2023, 1, 2, 10), 600)
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 2, 12), 300)
+        self._add_session("1002", "Zelda BOTW (copy)", datetime(2023, 1, 3, 10), 900)
+        self._add_session("1003", "Zelda DLC", datetime(2023, 1, 3, 11), 60)
+        self._add_session("2001", "DOOM", datetime(2023, 1, 3, 12), 120)
+        self.dao.save_game_checksum("1001", "checksum_a", "SHA256", 1024, None, None)
+        self.dao.save_game_checksum("1002", "checksum_a", "SHA256", 1024, None, None)
+        self.association_manager.create_association("1002", "1003")
+
+        days = self.statistics.daily_statistics_for_period(
+            date(2023, 1, 2), date(2023, 1, 3), "1002"
+        ).data
+
+        self.assertEqual(
+            [
+                (
+                    day.date,
+                    [
+                        (g.game.id, g.total_time, [s.date[11:16] for s in g.sessions])
+                        for g in day.games
+                    ],
+                    day.total,
+                )
+                for day in days
+            ],
+            [
+                ("2023-01-02", [("1001", 900, ["12:00", "10:00"])], 900),
+                ("2023-01-03", [("1002", 960, ["11:00", "10:00"])], 960),
+            ],
+        )
+
+    def test_should_name_days_only_children_played_after_parent(self):
+        self._add_session("2001", "DOOM", datetime(2023, 1, 2, 10), 600)
+        self._add_session("2002", "DOOM Eternal", datetime(2023, 1, 3, 10), 900)
+        self._add_session("2003", "DOOM 64", datetime(2023, 1, 3, 12), 300)
+        self._add_session("3001", "Quake", datetime(2023, 1, 3, 14), 120)
+        self.association_manager.create_association("2001", "2002")
+        self.association_manager.create_association("2001", "2003")
+
+        with patch.object(Dao, "get_game", autospec=True) as get_game:
+            days = self.statistics.daily_statistics_for_period(
+                date(2023, 1, 2), date(2023, 1, 3)
+            ).data
+
+        get_game.assert_not_called()
+        self.assertEqual(
+            [
+                (g.game.id, g.game.name, g.total_time, len(g.sessions))
+                for g in days[1].games
+            ],
+            [("2001", "DOOM", 1200, 2), ("3001", "Quake", 120, 1)],
+        )
+
+
+class TestPlaytimeHeatmap(AbstractStatisticsTest):
+    def _cell(self, heatmap, weekday: int, hour: int) -> float:
+        return heatmap.grid[weekday][hour]
+
+    def test_should_split_sessions_on_hour_boundaries(self):
+        # 2023-01-01 is a Sunday, the session runs into Monday
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 1, 23, 30), 5400)
+
+        heatmap = self.statistics.playtime_heatmap()
+
+        self.assertEqual(self._cell(heatmap, 6, 23), 1800)
+        self.assertEqual(self._cell(heatmap, 0, 0), 3600)
+        self.assertEqual(sum(sum(row) for row in heatmap.grid), 5400)
+        self.assertEqual(heatmap.total, 5400)
+
+    def test_should_keep_short_sessions_in_one_cell(self):
+        # 2023-01-04 is a Wednesday
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 4, 10, 15), 600)
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 11, 10, 0), 3600)
+
+        heatmap = self.statistics.playtime_heatmap()
+
+        self.assertEqual(len(heatmap.grid), 7)
+        self.assertTrue(all(len(row) == 24 for row in heatmap.grid))
+        self.assertEqual(self._cell(heatmap, 2, 10), 4200)
+        self.assertEqual(heatmap.total, 4200)
+
+    def test_should_filter_by_game_with_aliases_and_children(self):
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 2, 10), 600)
+        self._add_session("1002", "Zelda BOTW (copy)", datetime(2023, 1, 2, 11), 600)
+        self._add_session("1003", "Zelda DLC", datetime(2023, 1, 2, 12), 600)
+        self._add_session("2001", "DOOM", datetime(2023, 1, 2, 13), 600)
+        self.dao.save_game_checksum("1001", "checksum_a", "SHA256", 1024, None, None)
+        self.dao.save_game_checksum("1002", "checksum_a", "SHA256", 1024, None, None)
+        self.association_manager.create_association("1001", "1003")
+
+        heatmap = self.statistics.playtime_heatmap("1001")
+
+        self.assertEqual(heatmap.grid[0][10:14], [600, 600, 600, 0])
+        self.assertEqual(heatmap.total, 1800)
+
+    def test_should_include_alias_component_of_association_child(self):
+        for alias_id, child_id in (("100", "300"), ("300", "050")):
+            with self.subTest(child_is_component_leader=child_id < alias_id):
+                self.setUp()
+                self._add_parent_with_aliased_child(alias_id, child_id)
+
+                for game_id in ("200", alias_id, child_id):
+                    heatmap = self.statistics.playtime_heatmap(game_id)
+
+                    # Sessions run Thursday to Saturday at 10:00
+                    self.assertEqual(
+                        [self._cell(heatmap, weekday, 10) for weekday in (3, 4, 5)],
+                        [300, 300, 300],
+                    )
+                    self.assertEqual(heatmap.total, 900)
+                self.tearDown()
+
+
+class TestStatisticsStreaming(AbstractStatisticsTest):
+    def test_should_stream_daily_statistics_by_week(self):
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 4, 10), 3600)
+        self._add_session("1002", "DOOM", datetime(2023, 1, 10, 10), 600)
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 17, 10), 1800)
+        start, end = date(2023, 1, 4), date(2023, 1, 18)
+
+        chunks = list(self.statistics.iter_daily_statistics_for_period(start, end))
+
+        self.assertEqual(
+            [[day["date"] for day in chunk][::6] for chunk in chunks],
+            [["2023-01-04"], ["2023-01-09", "2023-01-15"], ["2023-01-16"]],
+        )
+        self.assertEqual(
+            [day for chunk in chunks for day in chunk],
+            self.statistics.daily_statistics_for_period(start, end).to_dict()["data"],
+        )
+
+    def test_should_stream_games_with_aliases_and_children_merged(self):
+        self._add_session("3001", "Celeste", datetime(2023, 5, 5, 10), 300)
+        self._add_session("1002", "Zelda BOTW (copy)", datetime(2023, 2, 5, 10), 1800)
+        self._add_session("1001", "Zelda BOTW", datetime(2023, 1, 5, 10), 3600)
+        self._add_session("2001", "DOOM", datetime(2023, 3, 5, 10), 600)
+        self._add_session("2002", "DOOM Eternal", datetime(2023, 4, 5, 10), 900)
+        self._add_parent_with_aliased_child("100", "300")
+        self.dao.save_game_checksum("1001", "checksum_z", "SHA256", 1024, None, None)
+        self.dao.save_game_checksum("1002", "checksum_z", "SHA256", 1024, None, None)
+        self.association_manager.create_association("2001", "2002")
+
+        chunks = list(self.statistics.iter_per_game_overall_statistics(chunk_size=2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2])
+        games = [game for chunk in chunks for game in chunk]
+        self.assertEqual(games, self.statistics.per_game_overall_statistic())
+        self.assertEqual(
+            [
+                (
+                    game["game"]["id"],
+                    game["total_time"],
+                    [session["date"][:10] for session in game["sessions"]],
+                    game["last_session"]["date"][:10],
+                )
+                for game in games
+            ],
+            [
+                ("3001", 300, ["2023-05-05"], "2023-05-05"),
+                ("1001", 5400, ["2023-01-05", "2023-02-05"], "2023-02-05"),
+                ("2001", 1500, ["2023-04-05", "2023-03-05"], "2023-04-05"),
+                (
+                    "200",
+                    900,
+                    ["2023-01-07", "2023-01-06", "2023-01-05"],
+                    "2023-01-07",
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -195,6 +195,61 @@ class TestPlayTime(AbstractDatabaseTest):
             ],
         )
 
+    def test_should_write_checkpointed_session_like_one_added_at_once(self):
+        started_at = datetime(2022, 1, 1, 23, 0).timestamp()
+        checkpoints = [
+            datetime(2022, 1, 1, 23, 20).timestamp(),
+            datetime(2022, 1, 1, 23, 50).timestamp(),
+            datetime(2022, 1, 2, 0, 30).timestamp(),
+            datetime(2022, 1, 2, 1, 0).timestamp(),
+        ]
+
+        saved_until = started_at
+        for checkpoint in checkpoints:
+            self.time_tracking.add_session_progress(
+                started_at, saved_until, checkpoint, "100", "Zelda BOTW"
+            )
+            saved_until = checkpoint
+        self.time_tracking.dao.flush_play_time()
+        self.time_tracking.add_time(started_at, checkpoints[-1], "101", "DOOM")
+
+        starts = [datetime(2022, 1, 1, 23, 0), datetime(2022, 1, 2, 0, 0)]
+        self.assertEqual(
+            self.dao.fetch_play_time_durations("100", starts),
+            {"2022-01-01T23:00:00": 3600, "2022-01-02T00:00:00": 3600},
+        )
+        self.assertEqual(
+            self.dao.fetch_play_time_durations("101", starts),
+            self.dao.fetch_play_time_durations("100", starts),
+        )
+        self.assertEqual(self.dao.fetch_overall_playtime()[0].time, 7200)
+
+    def test_should_add_only_missing_time_of_interrupted_session(self):
+        started_at = datetime(2022, 1, 1, 23, 0).timestamp()
+        written_until = datetime(2022, 1, 1, 23, 50).timestamp()
+        last_seen_at = datetime(2022, 1, 2, 0, 30).timestamp()
+        self.time_tracking.add_session_progress(
+            started_at, started_at, written_until, "100", "Zelda BOTW"
+        )
+        self.time_tracking.dao.flush_play_time()
+        # Buffered but lost with the process
+        TimeTracking(Dao(self.database)).add_session_progress(
+            started_at, written_until, last_seen_at, "100", "Zelda BOTW"
+        )
+
+        for _ in range(2):
+            TimeTracking(Dao(self.database)).add_missing_session_time(
+                started_at, last_seen_at, "100", "Zelda BOTW"
+            )
+
+        self.assertEqual(
+            self.dao.fetch_play_time_durations(
+                "100", [datetime(2022, 1, 1, 23, 0), datetime(2022, 1, 2, 0, 0)]
+            ),
+            {"2022-01-01T23:00:00": 3600, "2022-01-02T00:00:00": 1800},
+        )
+        self.assertEqual(self.dao.fetch_overall_playtime()[0].time, 5400)
+
     def test_should_sum_total_time_per_day(self):
         now = datetime(2022, 1, 1, 9, 0)
         self.time_tracking.add_time(
@@ -466,6 +521,91 @@ class TestPlayTime(AbstractDatabaseTest):
             ],
         )
 
+    def test_should_detect_and_repair_overall_time_drift(self):
+        now = datetime(2025, 1, 1, 9, 0)
+        self.time_tracking.add_time(
+            now.timestamp(), (now + timedelta(hours=1)).timestamp(), "101", "Zelda BOTW"
+        )
+        self.time_tracking.add_time(
+            now.timestamp(), (now + timedelta(hours=1)).timestamp(), "102", "DOOM"
+        )
+        self.dao.save_game_dict("103", "Celeste")
+
+        with self.database.transactional() as connection:
+            connection.execute(
+                "UPDATE overall_time SET duration = 100 WHERE game_id = '101'"
+            )
+            connection.execute(
+                "INSERT INTO overall_time (game_id, duration) VALUES ('103', 50)"
+            )
+
+        self.assertEqual(
+            [d.to_dict() for d in self.time_tracking.verify_overall_time()],
+            [
+                {"game_id": "101", "stored_time": 100, "actual_time": 3600},
+                {"game_id": "103", "stored_time": 50, "actual_time": 0},
+            ],
+        )
+
+        repaired = self.time_tracking.verify_overall_time(repair=True)
+
+        self.assertEqual([d.game_id for d in repaired], ["101", "103"])
+        self.assertEqual(self.time_tracking.verify_overall_time(), [])
+        self.assertEqual(self.dao.get_game("101").time, 3600)
+
+    def test_should_correct_manual_time_from_overall_time(self):
+        now = datetime(2025, 1, 1, 9, 0)
+        self.time_tracking.add_time(
+            now.timestamp(), (now + timedelta(hours=1)).timestamp(), "101", "Zelda BOTW"
+        )
+
+        self.time_tracking.apply_manual_time_for_games(
+            [ApplyManualTimeCorrectionList(game=Game("101", "Zelda BOTW"), time=5400)],
+            "manually-changed",
+        )
+        self.time_tracking.apply_manual_time_for_games(
+            [ApplyManualTimeCorrectionList(game=Game("102", "DOOM"), time=600)],
+            "manually-changed",
+        )
+
+        self.assertEqual(self.dao.get_game("101").time, 5400)
+        self.assertEqual(self.dao.get_game("102").time, 600)
+        self.assertEqual(self.time_tracking.verify_overall_time(), [])
+
+    def test_should_apply_manual_time_for_many_games_at_once(self):
+        now = datetime(2025, 1, 1, 9, 0)
+        self.time_tracking.add_time(
+            now.timestamp(), (now + timedelta(hours=1)).timestamp(), "101", "Zelda BOTW"
+        )
+        self.time_tracking.add_time(
+            now.timestamp(), (now + timedelta(hours=1)).timestamp(), "102", "DOOM"
+        )
+
+        results = self.time_tracking.apply_manual_time_for_games(
+            [
+                ApplyManualTimeCorrectionList(game=Game("101", "Zelda BOTW"), time=1800),
+                ApplyManualTimeCorrectionList(game=Game("102", "DOOM"), time=3600),
+                ApplyManualTimeCorrectionList(game=Game("103", "Celeste"), time=600),
+                ApplyManualTimeCorrectionList(game=Game("103", "Celeste"), time=900),
+            ],
+            "manually-changed",
+        )
+
+        self.assertEqual(
+            [r.to_dict() for r in results],
+            [
+                {"game_id": "101", "previous_time": 3600, "time": 1800, "delta": -1800},
+                {"game_id": "102", "previous_time": 3600, "time": 3600, "delta": 0},
+                {"game_id": "103", "previous_time": 0, "time": 600, "delta": 600},
+                {"game_id": "103", "previous_time": 600, "time": 900, "delta": 300},
+            ],
+        )
+        self.assertEqual(self.dao.get_game("101").time, 1800)
+        self.assertEqual(self.dao.get_game("102").time, 3600)
+        self.assertEqual(self.dao.get_game("103").time, 900)
+        self.assertEqual(self.dao.get_game("103").name, "Celeste")
+        self.assertEqual(self.time_tracking.verify_overall_time(), [])
+
     def test_should_merge_correctly_overall_statistic_of_games_with_same_checksum_and_without(
         self,
     ):
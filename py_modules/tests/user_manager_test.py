@@ -132,6 +132,16 @@ class TestUserManagerBasics(TestUserManager):
                 )
                 """
             )
+            connection.execute(
+                """
+                CREATE TABLE play_time(
+                    date_time TEXT,
+                    duration INT,
+                    game_id TEXT,
+                    migrated TEXT
+                )
+                """
+            )
             connection.execute("INSERT INTO migration (id) VALUES (9)")
 
         self.assertFalse(self._table_exists(str(legacy_path), "game_association"))
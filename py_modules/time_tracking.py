@@ -1,5 +1,6 @@
 from datetime import datetime
-from py_modules.db.dao import Dao
+from typing import List, Tuple
+from py_modules.db.dao import Dao, ManualTimeCorrectionResult, OverallTimeDrift
 from py_modules.helpers import end_of_day
 from py_modules.schemas.request import ApplyManualTimeCorrectionDict
 
@@ -13,34 +14,87 @@ class TimeTracking:
 
     def add_time(self, started_at: int, ended_at: int, game_id: str, game_name: str):
         self.dao.save_game_dict(game_id, game_name)
-        day_end_for_start_at = end_of_day(
-            datetime.fromtimestamp(started_at)
-        ).timestamp()
-
-        intervals = []
-
-        if started_at < day_end_for_start_at and ended_at > day_end_for_start_at:
-            next_day_start = int(day_end_for_start_at + 1)
-            intervals.append((started_at, next_day_start, game_id, game_name))
-            intervals.append((next_day_start, ended_at, game_id, game_name))
-        else:
-            intervals.append((started_at, ended_at, game_id, game_name))
-
-        for interval in intervals:
-            (i_started_at, i_ended_at, i_game_id, _) = interval
 
+        for i_started_at, i_ended_at in _split_at_day_end(started_at, ended_at):
             length = round(i_ended_at - i_started_at)
 
             self.dao.save_play_time(
-                datetime.fromtimestamp(i_started_at), length, i_game_id
+                datetime.fromtimestamp(i_started_at), length, game_id
+            )
+
+    def add_session_progress(
+        self,
+        started_at: float,
+        saved_until: float,
+        seen_at: float,
+        game_id: str,
+        game_name: str,
+    ):
+        """
+        Buffers the time of a running session played between `saved_until`
+        and `seen_at`. It goes into the same rows `add_time(started_at,
+        seen_at, ...)` would write, so a session checkpointed many times
+        still ends up as one row per day it was played on.
+        """
+        for i_started_at, i_ended_at in _split_at_day_end(started_at, seen_at):
+            saved = round(
+                min(max(saved_until, i_started_at), i_ended_at) - i_started_at
             )
+            length = round(i_ended_at - i_started_at) - saved
+
+            if length > 0:
+                self.dao.buffer_play_time(
+                    datetime.fromtimestamp(i_started_at), length, game_id, game_name
+                )
+
+    def add_missing_session_time(
+        self,
+        started_at: float,
+        ended_at: float,
+        game_id: str,
+        game_name: str,
+    ):
+        """
+        Saves the part of an interrupted session that is not stored yet, as
+        time buffered from its heartbeats may already have been written.
+        """
+        intervals = _split_at_day_end(started_at, ended_at)
+        stored = self.dao.fetch_play_time_durations(
+            game_id,
+            [datetime.fromtimestamp(i_started_at) for i_started_at, _ in intervals],
+        )
+
+        for i_started_at, i_ended_at in intervals:
+            start = datetime.fromtimestamp(i_started_at)
+            length = round(i_ended_at - i_started_at) - stored.get(start.isoformat(), 0)
+
+            if length > 0:
+                self.dao.buffer_play_time(start, length, game_id, game_name)
+
+        self.dao.flush_play_time()
 
     def apply_manual_time_for_games(
         self, list_of_game_stats: ApplyManualTimeCorrectionDict, source: str
-    ):
-        now = datetime.now()
+    ) -> List[ManualTimeCorrectionResult]:
+        return self.dao.apply_manual_time_for_games(
+            datetime.now(),
+            [(stat.game.id, stat.game.name, stat.time) for stat in list_of_game_stats],
+            source,
+        )
 
-        for stat in list_of_game_stats:
-            self.dao.apply_manual_time_for_game(
-                now, stat.game.id, stat.game.name, stat.time, source
-            )
+    def verify_overall_time(self, repair: bool = False) -> List[OverallTimeDrift]:
+        if repair:
+            return self.dao.repair_overall_time()
+
+        return self.dao.find_overall_time_drift()
+
+
+def _split_at_day_end(started_at: float, ended_at: float) -> List[Tuple[float, float]]:
+    """Splits a session crossing midnight in two, the second part starting on the next day."""
+    day_end_for_start_at = end_of_day(datetime.fromtimestamp(started_at)).timestamp()
+
+    if started_at < day_end_for_start_at and ended_at > day_end_for_start_at:
+        next_day_start = int(day_end_for_start_at + 1)
+        return [(started_at, next_day_start), (next_day_start, ended_at)]
+
+    return [(started_at, ended_at)]
@@ -12,7 +12,7 @@ Migration Strategy:
 
 import shutil
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from py_modules.db.dao import Dao
 from py_modules.db.migration import DbMigration
@@ -263,6 +263,28 @@ class UserManager:
 
         return users
 
+    def open_daos(self) -> List[Dao]:
+        """
+        Get every DAO opened so far, including the legacy one.
+
+        Returns:
+            List of Dao instances
+        """
+        daos = list(self._user_daos.values())
+        if self._legacy_dao is not None:
+            daos.append(self._legacy_dao)
+
+        return daos
+
+    def open_databases(self) -> List[SqlLiteDb]:
+        """
+        Get the databases of every DAO opened so far, including the legacy one.
+
+        Returns:
+            List of SqlLiteDb instances
+        """
+        return [dao.db for dao in self.open_daos()]
+
     def clear_cache(self):
         """Clear all cached DAOs. Useful for testing."""
         self._user_daos.clear()
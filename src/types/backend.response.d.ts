@@ -45,6 +45,8 @@ type PagedDayStatistics = {
 	data: DayStatistics[];
 	hasPrev: boolean;
 	hasNext: boolean;
+	prevDate?: string;
+	nextDate?: string;
 };
 
 type FileChecksum = {